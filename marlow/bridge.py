@@ -0,0 +1,122 @@
+"""
+Marlow stdio bridge
+
+Thin entry point for MCP clients. If a persistent Marlow server
+(``marlow-serve``) is already running, stdin/stdout are piped to it over
+a loopback socket so the client skips the heavy startup (pywinauto,
+pywin32, whisper, ...). Otherwise the full server runs in-process over
+stdio, exactly as before.
+
+Only stdlib imports here — this module must stay cheap to start.
+
+/ Puente stdio: reutiliza un servidor Marlow persistente si existe,
+/ si no arranca el servidor completo en este proceso.
+"""
+
+import json
+import socket
+import sys
+import threading
+from pathlib import Path
+
+from marlow import __version__
+
+# Written by marlow.server.serve_persistent(), removed on shutdown
+PERSISTENT_FILE = Path.home() / ".marlow" / "persistent.json"
+PERSISTENT_HOST = "127.0.0.1"
+_CONNECT_TIMEOUT = 0.5
+_ACK_TIMEOUT = 5.0
+
+
+def _read_endpoint() -> dict | None:
+    """Return the persistent server's {port, token, pid, version} or None."""
+    try:
+        info = json.loads(PERSISTENT_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if info.get("version") != __version__:
+        return None
+    return info
+
+
+def _connect() -> socket.socket | None:
+    """Connect and authenticate to the persistent server, or return None."""
+    info = _read_endpoint()
+    if not info:
+        return None
+    try:
+        sock = socket.create_connection(
+            (PERSISTENT_HOST, int(info["port"])), timeout=_CONNECT_TIMEOUT,
+        )
+    except (OSError, KeyError, ValueError):
+        return None
+    try:
+        sock.sendall(info["token"].encode("ascii") + b"\n")
+        # The server answers "ok" once the token checks out; a stale file,
+        # wrong token or foreign listener gets no ack and we fall back
+        sock.settimeout(_ACK_TIMEOUT)
+        ack = b""
+        while not ack.endswith(b"\n") and len(ack) < 16:
+            byte = sock.recv(1)  # byte-wise: nothing past the ack is consumed
+            if not byte:
+                break
+            ack += byte
+        sock.settimeout(None)
+    except (OSError, KeyError, AttributeError):
+        sock.close()
+        return None
+    if ack.strip() != b"ok":
+        sock.close()
+        return None
+    return sock
+
+
+def _pump_stdin(sock: socket.socket) -> None:
+    """Forward client → server bytes until stdin closes."""
+    stdin = sys.stdin.buffer
+    try:
+        while True:
+            chunk = stdin.read1(65536)
+            if not chunk:
+                break
+            sock.sendall(chunk)
+    except OSError:
+        pass
+    finally:
+        try:
+            sock.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+
+
+def _pump_socket(sock: socket.socket) -> None:
+    """Forward server → client bytes until the server closes the session."""
+    stdout = sys.stdout.buffer
+    try:
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            stdout.write(chunk)
+            stdout.flush()
+    except OSError:
+        pass
+
+
+def main():
+    """Attach to a running persistent server, or start Marlow over stdio."""
+    sock = _connect()
+    if sock is None:
+        from marlow.server import main as server_main
+        server_main()
+        return
+
+    threading.Thread(target=_pump_stdin, args=(sock,), daemon=True).start()
+    try:
+        _pump_socket(sock)
+    finally:
+        sock.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ them to the user. Patterns are stored persistently in ~/.marlow/memory/.
 import json
 import logging
 import uuid
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -42,7 +43,8 @@ class PatternDetector:
     """
 
     def __init__(self):
-        self._actions: list[dict] = []
+        # Rolling buffer — deque drops the oldest entry in O(1)
+        self._actions: deque[dict] = deque(maxlen=_MAX_BUFFER)
 
     # ── Recording ──────────────────────────────────────────────
 
@@ -50,17 +52,19 @@ class PatternDetector:
         """
         Record a tool call for pattern analysis.
 
+        Called after every tool execution, so it must never raise.
+
         / Registra una llamada a herramienta para analisis de patrones.
         """
-        key_params = {k: v for k, v in params.items() if k in _KEY_PARAMS and v}
+        key_params = (
+            {k: v for k, v in params.items() if k in _KEY_PARAMS and v}
+            if isinstance(params, dict) else {}
+        )
         self._actions.append({
             "tool": tool,
             "params": key_params,
             "timestamp": datetime.now().isoformat(),
         })
-        # Trim buffer
-        if len(self._actions) > _MAX_BUFFER:
-            self._actions = self._actions[-_MAX_BUFFER:]
 
     # ── Analysis ───────────────────────────────────────────────
 
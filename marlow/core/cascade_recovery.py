@@ -189,7 +189,7 @@ async def cascade_find(
     screenshot_result = await _take_screenshot(window_title)
     step_time = round((time.perf_counter() - step_start) * 1000, 1)
 
-    if screenshot_result.get("image_base64"):
+    if screenshot_result.get("image_bytes"):
         attempts.append({
             "step": 5,
             "method": "screenshot",
@@ -199,7 +199,7 @@ async def cascade_find(
         return _build_result(
             False, "screenshot", None, attempts, target, _elapsed(),
             requires_vision=True,
-            image_base64=screenshot_result.get("image_base64"),
+            image_bytes=screenshot_result.get("image_bytes"),
             image_width=screenshot_result.get("width"),
             image_height=screenshot_result.get("height"),
             hint=f"Could not find '{target}' via UIA, fuzzy search, or OCR. "
@@ -161,13 +161,13 @@ async def smart_find(
             return result
 
         # Cascade didn't find it — check if it got a screenshot
-        if cascade_result.get("requires_vision") and cascade_result.get("image_base64"):
+        if cascade_result.get("requires_vision") and cascade_result.get("image_bytes"):
             result = {
                 "success": True,
                 "found": False,
                 "method": "screenshot",
                 "requires_vision": True,
-                "image_base64": cascade_result["image_base64"],
+                "image_bytes": cascade_result["image_bytes"],
                 "image_width": cascade_result.get("image_width"),
                 "image_height": cascade_result.get("image_height"),
                 "hint": cascade_result.get("hint",
@@ -204,7 +204,7 @@ async def smart_find(
 
     methods_tried.append({
         "method": "screenshot",
-        "success": screenshot_result.get("image_base64") is not None,
+        "success": screenshot_result.get("image_bytes") is not None,
         "time_ms": elapsed,
     })
 
@@ -221,7 +221,7 @@ async def smart_find(
         "found": False,
         "method": "screenshot",
         "requires_vision": True,
-        "image_base64": screenshot_result.get("image_base64"),
+        "image_bytes": screenshot_result.get("image_bytes"),
         "image_width": screenshot_result.get("width"),
         "image_height": screenshot_result.get("height"),
         "hint": f"UIA and OCR couldn't find '{target}'. Showing screenshot for LLM Vision.",
@@ -0,0 +1,96 @@
+"""
+Marlow Loop Guard
+
+Stops error loops: an agent retrying the exact same failing tool call
+over and over, each retry costing a round trip and tokens. Once the same
+(tool, arguments) pair has failed MAX_FAILURES times within
+WINDOW_SECONDS, further identical calls return the last error right away,
+marked with "aborted": "loop-detected", instead of running the tool again.
+
+Only failures are remembered — a successful call clears its entry, and
+successful results are never replayed (they describe live UI state).
+The window is counted from the first failure, so slow retries (waits,
+timeouts) never trip it, and the guard lifts on its own once the window
+has passed. Only the _MAX_ENTRIES most recently failing calls are kept.
+
+/ Corta bucles de error: la misma llamada fallando repetidamente en poco
+/ tiempo devuelve el ultimo error sin volver a ejecutar la herramienta.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger("marlow.core.loop_guard")
+
+MAX_FAILURES = 3
+WINDOW_SECONDS = 5.0
+_MAX_ENTRIES = 512
+
+# call key → [first failure time, failure count, last error result]
+_failures: "OrderedDict[tuple[str, bytes], list]" = OrderedDict()
+
+
+def call_key(name: str, arguments: dict) -> tuple[str, bytes]:
+    """
+    Key identifying a tool call: the tool name plus a digest of its
+    arguments (key order does not matter).
+
+    / Clave de una llamada: nombre + digest de los argumentos.
+    """
+    payload = json.dumps(arguments, sort_keys=True, default=str).encode("utf-8")
+    return name, hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def check(key: tuple[str, bytes]) -> Optional[dict]:
+    """
+    Return the short-circuit result if ``key`` is stuck in an error loop,
+    else None (run the tool).
+
+    / Retorna el error cacheado si la llamada esta en un bucle, o None.
+    """
+    entry = _failures.get(key)
+    if entry is None:
+        return None
+    first, count, error = entry
+    if count < MAX_FAILURES or time.monotonic() - first > WINDOW_SECONDS:
+        return None
+    logger.warning(f"Loop detected: {key[0]} failed {count}x with the same arguments")
+    return {
+        **error,
+        "aborted": "loop-detected",
+        "hint": (
+            f"{key[0]} failed {count} times in a row with these exact arguments. "
+            "Change the arguments or the approach instead of retrying."
+        ),
+    }
+
+
+def record(key: tuple[str, bytes], result) -> None:
+    """
+    Record the outcome of a call that actually ran.
+
+    / Registra el resultado de una llamada ejecutada.
+    """
+    if not (isinstance(result, dict) and "error" in result):
+        _failures.pop(key, None)
+        return
+
+    now = time.monotonic()
+    entry = _failures.get(key)
+    if entry is None or now - entry[0] > WINDOW_SECONDS:
+        _failures[key] = [now, 1, result]
+    else:
+        entry[1] += 1
+        entry[2] = result
+    _failures.move_to_end(key)
+    while len(_failures) > _MAX_ENTRIES:
+        _failures.popitem(last=False)
+
+
+def reset() -> None:
+    """Forget all recorded failures. / Olvida todos los fallos registrados."""
+    _failures.clear()
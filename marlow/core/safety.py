@@ -15,6 +15,7 @@ This module provides:
 import time
 import logging
 import threading
+from collections import deque
 from datetime import datetime
 from typing import Optional, Callable
 from dataclasses import dataclass
@@ -23,8 +24,14 @@ from marlow.core.config import MarlowConfig
 
 logger = logging.getLogger("marlow.safety")
 
+# Params that name a target application (see _check_blocked_app)
+_APP_PARAM_KEYS = ("window_title", "app_name", "process_name", "title", "name")
+# Bound on memoized blocked-app/command verdicts (see _check_blocked)
+_BLOCKED_CACHE_SIZE = 1024
 
-@dataclass
+
+# One per tool call, kept for the life of the process — slots keep it small
+@dataclass(slots=True)
 class ActionRecord:
     """Record of an action taken by Marlow."""
     timestamp: str
@@ -48,11 +55,16 @@ class SafetyEngine:
         self.config = config
         self._killed = False
         self._kill_lock = threading.Lock()
+        # Set while the kill switch is active — lets background threads
+        # (scheduler) wait on / react to it without polling is_killed
+        self.kill_event = threading.Event()
         self._action_log: list[ActionRecord] = []
-        self._action_timestamps: list[float] = []
+        self._action_timestamps: deque[float] = deque()  # oldest first
         self._rate_lock = threading.Lock()
         self._confirmation_callback: Optional[Callable] = None
         self._kill_switch_thread: Optional[threading.Thread] = None
+        # (action, app params, command) → (blocked app, blocked command)
+        self._blocked_cache: dict[tuple, tuple[Optional[str], Optional[str]]] = {}
 
     # =========================================================================
     # KILL SWITCH
@@ -84,19 +96,24 @@ class SafetyEngine:
         """Activate kill switch — stop ALL automation immediately."""
         with self._kill_lock:
             self._killed = True
+            self.kill_event.set()
+            self._blocked_cache.clear()
         logger.critical("🛑 KILL SWITCH ACTIVATED — All automation stopped")
 
     def reset_kill_switch(self):
         """Reset kill switch (allow automation to resume)."""
         with self._kill_lock:
             self._killed = False
+            self.kill_event.clear()
+            self._blocked_cache.clear()
         logger.info("✅ Kill switch reset — Automation can resume")
 
     @property
     def is_killed(self) -> bool:
         """Check if kill switch has been activated."""
-        with self._kill_lock:
-            return self._killed
+        # A single attribute read is atomic; the lock only keeps writers
+        # (_killed + kill_event) consistent, so readers don't take it.
+        return self._killed
 
     # =========================================================================
     # ACTION APPROVAL
@@ -126,14 +143,13 @@ class SafetyEngine:
             return False, "🛑 Kill switch is active. Use reset_kill_switch to resume."
 
         # 2. Blocked apps
-        blocked = self._check_blocked_app(action, params)
+        blocked, blocked_cmd = self._check_blocked(action, params)
         if blocked:
             self._log_action(tool, action, params, False, "blocked",
                            f"Blocked app: {blocked}")
             return False, f"🚫 Blocked: '{blocked}' is a protected application. Marlow will never interact with banking, password managers, or security apps."
 
         # 3. Blocked commands
-        blocked_cmd = self._check_blocked_command(action, params)
         if blocked_cmd:
             self._log_action(tool, action, params, False, "blocked",
                            f"Blocked command: {blocked_cmd}")
@@ -177,11 +193,45 @@ class SafetyEngine:
         self._log_action(tool, action, params, True, "success")
         return True, "✅ Approved"
 
+    def _check_blocked(
+        self, action: str, params: dict
+    ) -> tuple[Optional[str], Optional[str]]:
+        """
+        Blocked app and blocked command for this call, memoized.
+
+        Both checks are pure functions of the action, the target/command
+        params and the (static) blocklists, so repeated calls — polling a
+        window, batch steps — reuse the verdict instead of rescanning every
+        blocklist entry. Only the verdict is cached: kill switch, rate limit
+        and logging still run on every call.
+        """
+        try:
+            key = (
+                action,
+                tuple(params.get(k) for k in _APP_PARAM_KEYS),
+                params.get("command"),
+            )
+            cached = self._blocked_cache.get(key)
+        except TypeError:  # unhashable param value
+            key = cached = None
+        if cached is not None:
+            return cached
+
+        verdict = (
+            self._check_blocked_app(action, params),
+            self._check_blocked_command(action, params),
+        )
+        if key is not None:
+            if len(self._blocked_cache) >= _BLOCKED_CACHE_SIZE:
+                self._blocked_cache.clear()
+            self._blocked_cache[key] = verdict
+        return verdict
+
     def _check_blocked_app(self, action: str, params: dict) -> Optional[str]:
         """Check if the action targets a blocked application."""
         # Check window title, app name, process name in params
         check_values = []
-        for key in ["window_title", "app_name", "process_name", "title", "name"]:
+        for key in _APP_PARAM_KEYS:
             if key in params and params[key]:
                 check_values.append(str(params[key]).lower())
 
@@ -236,11 +286,12 @@ class SafetyEngine:
         window = 60.0  # 1 minute window
 
         with self._rate_lock:
-            # Clean old timestamps
-            self._action_timestamps = [
-                t for t in self._action_timestamps if now - t < window
-            ]
-            return len(self._action_timestamps) < self.config.security.max_actions_per_minute
+            # Drop expired timestamps from the front (appended in order), so
+            # the lock is held for O(expired) instead of a full rebuild
+            timestamps = self._action_timestamps
+            while timestamps and now - timestamps[0] >= window:
+                timestamps.popleft()
+            return len(timestamps) < self.config.security.max_actions_per_minute
 
     def _record_action_timestamp(self):
         """Record that an action was performed. Thread-safe."""
@@ -14,6 +14,15 @@ from marlow.core.config import MarlowConfig
 
 logger = logging.getLogger("marlow.sanitizer")
 
+# Leading global inline flags, e.g. "(?i)" — must be scoped before the
+# pattern can be embedded in a larger alternation.
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+# Group references (\1, (?P=name), (?(1)...)) change meaning once patterns
+# are combined, since group numbers shift. Over-matching here only turns
+# the prefilter off.
+_GROUP_REFERENCE = re.compile(r"\\\d|\(\?P=|\(\?\(")
+
 
 class DataSanitizer:
     """
@@ -38,6 +47,7 @@ class DataSanitizer:
     def __init__(self, config: MarlowConfig):
         self.config = config
         self._patterns: dict[str, re.Pattern] = {}
+        self._any_pattern: re.Pattern | None = None
         self._compile_patterns()
         self._redaction_count = 0
 
@@ -48,6 +58,33 @@ class DataSanitizer:
                 self._patterns[name] = re.compile(pattern)
             except re.error as e:
                 logger.error(f"Invalid regex pattern '{name}': {e}")
+        self._compile_prefilter()
+
+    def _compile_prefilter(self):
+        """
+        Fold all patterns into one alternation used only to detect whether
+        a string contains anything sensitive, in a single pass.
+
+        Redaction itself stays sequential (see sanitize): each pattern
+        must see the text already redacted by the earlier ones, which a
+        leftmost-match alternation cannot reproduce. Left unset when the
+        patterns cannot be combined safely.
+        """
+        parts = []
+        for compiled in self._patterns.values():
+            source = compiled.pattern
+            if _GROUP_REFERENCE.search(source):
+                return
+            flags = _LEADING_FLAGS.match(source)
+            if flags:
+                source = f"(?{flags.group(1)}:{source[flags.end():]})"
+            parts.append(f"(?:{source})")
+        if not parts:
+            return
+        try:
+            self._any_pattern = re.compile("|".join(parts))
+        except re.error as e:
+            logger.warning(f"Could not combine sanitizer patterns, scanning each: {e}")
 
     def sanitize(self, text: str) -> str:
         """
@@ -58,6 +95,11 @@ class DataSanitizer:
         if not text:
             return text
 
+        # Single pass for the common case: if no pattern matches anywhere,
+        # the sequential passes below would not change anything either
+        if self._any_pattern is not None and not self._any_pattern.search(text):
+            return text
+
         sanitized = text
         redactions_made = 0
 
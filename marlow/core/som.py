@@ -9,7 +9,6 @@ map, then refers to elements by number: "click [3]", "type in [5]".
 / El LLM recibe la imagen anotada + mapa de elementos.
 """
 
-import base64
 import io
 import logging
 from typing import Optional
@@ -46,7 +45,7 @@ async def annotate_screenshot(
       2. Filter by interactive control types if requested
       3. Take screenshot of the window
       4. Draw [1], [2], [3]... labels with orange background on each element
-      5. Return annotated PNG image (base64) + element map
+      5. Return annotated PNG image (raw bytes) + element map
 
     / Tomar screenshot y superponer labels numerados en cada elemento UI.
     """
@@ -103,8 +102,7 @@ async def annotate_screenshot(
             return {"error": f"Screenshot failed: {ss_result['error']}"}
 
         # Decode screenshot and convert to RGBA for semi-transparent drawing
-        img_data = base64.b64decode(ss_result["image_base64"])
-        img = Image.open(io.BytesIO(img_data)).convert("RGBA")
+        img = Image.open(io.BytesIO(ss_result["image_bytes"])).convert("RGBA")
 
         # Create transparent overlay for alpha compositing
         overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
@@ -188,14 +186,13 @@ async def annotate_screenshot(
         # ── Step 5: Encode as PNG ──
         buf = io.BytesIO()
         result_img.save(buf, format="PNG")
-        annotated_b64 = base64.b64encode(buf.getvalue()).decode("ascii")
 
         # Store for som_click
         _last_elements = element_map
 
         return {
             "success": True,
-            "image_base64": annotated_b64,
+            "image_bytes": buf.getvalue(),
             "width": result_img.width,
             "height": result_img.height,
             "format": "png",
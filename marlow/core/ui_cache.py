@@ -0,0 +1,301 @@
+"""
+Marlow UI Tree Cache
+
+Short-lived, per-window snapshots of the UI Automation tree so that
+back-to-back element searches (find_elements → click → type_text, or the
+steps of a batch_execute) share one walk instead of each crossing COM for
+every node again.
+
+A snapshot is filled lazily: searches that stop early on a perfect match
+only pay for the nodes they visited, and the next search resumes the walk
+where the previous one stopped. Entries expire after TTL_SECONDS and are
+dropped by invalidate() whenever a tool may have changed the UI.
+
+While the UIA event monitor is running it acts as the cache's watcher:
+each cached window gets structure-changed and property-changed (name,
+automation id, help text) subscriptions, and snapshots of subscribed
+windows stay valid until an event invalidates them (bounded by
+WATCHED_TTL_SECONDS) instead of being re-walked every TTL_SECONDS. Only
+the _MAX_WINDOWS most recently used windows are kept.
+
+Finished get_ui_tree results are kept too (get_result/put_result), for
+TTL_SECONDS only — they also carry window position and focus state,
+which change without structure events — and are dropped by the same
+invalidate() calls.
+
+Every tool dispatcher (server.py's _execute_tool and the kernel's
+SmartExecutor) calls tool_finished() after running a tool, so any tool
+that may have changed the UI invalidates the cache no matter who ran it.
+
+/ Cache de corta duracion del arbol UIA por ventana. Evita recorrer el
+/ arbol completo en cada busqueda consecutiva.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterator, Optional
+
+logger = logging.getLogger("marlow.core.ui_cache")
+
+TTL_SECONDS = 0.5
+# Upper bound for subscribed windows, in case a structure event is missed
+WATCHED_TTL_SECONDS = 30.0
+_MAX_WINDOWS = 3
+
+# (hwnd, max_depth) → TreeSnapshot, least recently used first
+_snapshots: "OrderedDict[tuple[int, int], TreeSnapshot]" = OrderedDict()
+_lock = threading.Lock()
+
+# Structure-change watcher (see set_watcher) and its per-window state
+_watcher = None
+_requested: set[int] = set()   # watch_structure() already asked for
+_subscribed: set[int] = set()  # events confirmed live for these windows
+
+# Finished tool results: (hwnd, *call args) → (created, result)
+_results: dict[tuple, tuple[float, dict]] = {}
+
+# Tools that never change the UI — everything else invalidates on finish
+READ_ONLY_TOOLS = frozenset({
+    "get_ui_tree", "take_screenshot", "list_windows", "system_info",
+    "ocr_region", "find_elements", "get_annotated_screenshot",
+    "detect_app_framework", "get_agent_screen_state", "get_dialog_info",
+    "wait_for_element", "wait_for_text", "wait_for_window", "wait_for_idle",
+})
+
+
+def read_properties(element) -> dict:
+    """
+    Read the searchable properties of one UIA element.
+
+    / Lee las propiedades buscables de un elemento UIA.
+    """
+    info = element.element_info
+    return {
+        "name": (element.window_text() or "").strip(),
+        "automation_id": (getattr(info, "automation_id", "") or "").strip(),
+        "help_text": (getattr(info, "help_text", "") or "").strip(),
+        "class_name": (getattr(info, "class_name", "") or "").strip(),
+        "control_type": (getattr(info, "control_type", "") or "").strip(),
+    }
+
+
+def _walk(element, max_depth: int, depth: int = 0) -> Iterator[dict]:
+    """Depth-first, pre-order walk yielding {element, depth, **properties}."""
+    if depth > max_depth:
+        return
+    try:
+        entry = read_properties(element)
+    except Exception:
+        return
+    entry["element"] = element
+    entry["depth"] = depth
+    yield entry
+    try:
+        children = element.children()
+    except Exception:
+        return
+    for child in children:
+        yield from _walk(child, max_depth, depth + 1)
+
+
+class TreeSnapshot:
+    """
+    Memoized tree walk. Iterating replays the entries already read and
+    then continues the underlying walk, recording what it reads.
+    """
+
+    __slots__ = ("created", "entries", "_walker", "_lock")
+
+    def __init__(self, root, max_depth: int):
+        self.created = time.monotonic()
+        self.entries: list[dict] = []
+        self._walker: Optional[Iterator[dict]] = _walk(root, max_depth)
+        self._lock = threading.Lock()
+
+    @property
+    def complete(self) -> bool:
+        return self._walker is None
+
+    def __iter__(self) -> Iterator[dict]:
+        i = 0
+        while True:
+            if i < len(self.entries):
+                yield self.entries[i]
+                i += 1
+                continue
+            with self._lock:
+                if i < len(self.entries):
+                    continue  # another reader advanced the walk
+                if self._walker is None:
+                    return
+                try:
+                    self.entries.append(next(self._walker))
+                except StopIteration:
+                    self._walker = None
+                    return
+
+
+def _handle_of(element) -> Optional[int]:
+    try:
+        return element.handle or None
+    except Exception:
+        return None
+
+
+def get_tree(root, max_depth: int = 5) -> TreeSnapshot:
+    """
+    Return the (possibly partially walked) snapshot for ``root``.
+
+    Elements without a native window handle can't be keyed reliably and
+    always get a fresh, uncached snapshot.
+
+    / Retorna el snapshot (posiblemente parcial) del arbol de ``root``.
+    """
+    hwnd = _handle_of(root)
+    if hwnd is None:
+        return TreeSnapshot(root, max_depth)
+
+    key = (hwnd, max_depth)
+    now = time.monotonic()
+    with _lock:
+        snapshot = _snapshots.get(key)
+        ttl = WATCHED_TTL_SECONDS if hwnd in _subscribed else TTL_SECONDS
+        if snapshot is not None and now - snapshot.created <= ttl:
+            _snapshots.move_to_end(key)
+            return snapshot
+
+        snapshot = TreeSnapshot(root, max_depth)
+        _snapshots[key] = snapshot
+        _snapshots.move_to_end(key)
+        _evict_lru()
+
+        if _watcher is not None and hwnd not in _requested:
+            _requested.add(hwnd)
+            _watcher.watch_structure(hwnd)
+    return snapshot
+
+
+def _evict_lru() -> None:
+    """Keep only the _MAX_WINDOWS most recently used windows. Caller holds _lock."""
+    recent: list[int] = []
+    for hwnd, _depth in reversed(_snapshots):
+        if hwnd not in recent:
+            recent.append(hwnd)
+    for hwnd in recent[_MAX_WINDOWS:]:
+        for key in [k for k in _snapshots if k[0] == hwnd]:
+            del _snapshots[key]
+        if hwnd in _requested:
+            _requested.discard(hwnd)
+            _subscribed.discard(hwnd)
+            if _watcher is not None:
+                _watcher.unwatch_structure(hwnd)
+
+
+def invalidate(hwnd: Optional[int] = None) -> None:
+    """
+    Drop cached snapshots — all of them, or only those for ``hwnd``.
+
+    Safe to call from any thread (structure-changed events arrive on the
+    UIA event monitor's thread).
+
+    / Descarta los snapshots cacheados (todos o los de ``hwnd``).
+    """
+    with _lock:
+        if hwnd is None:
+            _snapshots.clear()
+            _results.clear()
+            return
+        for key in [k for k in _snapshots if k[0] == hwnd]:
+            del _snapshots[key]
+        for key in [k for k in _results if k[0] == hwnd]:
+            del _results[key]
+
+
+def tool_finished(name: str) -> None:
+    """
+    Drop cached snapshots and results after tool ``name`` ran, unless it
+    is known not to change the UI. Called by every tool dispatcher.
+
+    / Invalida el cache tras ejecutar una herramienta que puede cambiar la UI.
+    """
+    if name not in READ_ONLY_TOOLS:
+        invalidate()
+
+
+def get_result(key: tuple) -> Optional[dict]:
+    """
+    Return the result stored under ``key`` (first item: the window handle)
+    if it is younger than TTL_SECONDS, else None.
+
+    / Retorna el resultado cacheado para ``key`` si sigue vigente.
+    """
+    with _lock:
+        entry = _results.get(key)
+    if entry is not None and time.monotonic() - entry[0] <= TTL_SECONDS:
+        return entry[1]
+    return None
+
+
+def put_result(key: tuple, result: dict) -> None:
+    """
+    Store a finished result under ``key`` (first item: the window handle).
+
+    / Guarda un resultado terminado bajo ``key``.
+    """
+    now = time.monotonic()
+    with _lock:
+        for k in [k for k, (created, _) in _results.items() if now - created > TTL_SECONDS]:
+            del _results[k]
+        _results[key] = (now, result)
+
+
+def set_watcher(watcher) -> None:
+    """
+    Install the object that subscribes cached windows to structure-changed
+    events, or remove it with None (falls back to TTL_SECONDS expiry).
+
+    ``watcher.watch_structure(hwnd)`` / ``unwatch_structure(hwnd)`` must
+    not block; the watcher reports back through subscribed() and
+    unsubscribed() once the subscription actually changes.
+
+    / Instala (o quita con None) el observador de cambios de estructura.
+    """
+    global _watcher
+    with _lock:
+        _watcher = watcher
+        _requested.clear()
+        _subscribed.clear()
+        _snapshots.clear()
+        _results.clear()
+
+
+def subscribed(hwnd: int) -> None:
+    """
+    Structure and property events for ``hwnd`` are now live. Drops its
+    snapshots, since they were taken before changes could be observed.
+
+    / Los eventos de estructura de ``hwnd`` ya estan activos.
+    """
+    with _lock:
+        if hwnd not in _requested:
+            return  # evicted while the subscription was pending
+        _subscribed.add(hwnd)
+        for key in [k for k in _snapshots if k[0] == hwnd]:
+            del _snapshots[key]
+
+
+def unsubscribed(hwnd: int) -> None:
+    """
+    ``hwnd`` no longer delivers structure events (its window closed).
+    A window whose subscription fails is simply never reported as
+    subscribed and keeps TTL expiry.
+
+    / ``hwnd`` ya no entrega eventos de estructura.
+    """
+    with _lock:
+        _requested.discard(hwnd)
+        _subscribed.discard(hwnd)
+        for key in [k for k in _snapshots if k[0] == hwnd]:
+            del _snapshots[key]
@@ -20,6 +20,8 @@ from typing import Optional
 
 import psutil
 
+from marlow.core import ui_cache
+
 logger = logging.getLogger("marlow.uia_events")
 
 # ─────────────────────────────────────────────────────────────
@@ -36,6 +38,16 @@ TreeScope_Subtree = 0x7  # Element + Children + Descendants
 
 MAX_EVENTS = 500
 
+# Properties ui_cache snapshots store that can change without a structure
+# event (a button relabelled "Start" → "Stop"); control type and class
+# name are fixed for an element's lifetime
+UIA_NamePropertyId = 30005
+UIA_AutomationIdPropertyId = 30011
+UIA_HelpTextPropertyId = 30013
+_CACHED_TEXT_PROPERTIES = [
+    UIA_NamePropertyId, UIA_AutomationIdPropertyId, UIA_HelpTextPropertyId,
+]
+
 # StructureChangeType names
 _STRUCTURE_CHANGE_NAMES = {
     0: "ChildAdded",
@@ -49,6 +61,9 @@ _STRUCTURE_CHANGE_NAMES = {
 # PM_REMOVE for PeekMessage
 _PM_REMOVE = 0x0001
 
+# How often watched windows are checked for having been destroyed
+_WATCH_PRUNE_SECONDS = 1.0
+
 # ─────────────────────────────────────────────────────────────
 # Singleton
 # ─────────────────────────────────────────────────────────────
@@ -79,6 +94,7 @@ _com_load_error: Optional[str] = None
 IUIAutomationEventHandler = None
 IUIAutomationFocusChangedEventHandler = None
 IUIAutomationStructureChangedEventHandler = None
+IUIAutomationPropertyChangedEventHandler = None
 CUIAutomation = None
 
 
@@ -92,6 +108,7 @@ def _load_com_types() -> Optional[str]:
     global _com_loaded, _com_load_error
     global IUIAutomationEventHandler, IUIAutomationFocusChangedEventHandler
     global IUIAutomationStructureChangedEventHandler, CUIAutomation
+    global IUIAutomationPropertyChangedEventHandler
 
     if _com_loaded:
         return None
@@ -107,11 +124,13 @@ def _load_com_types() -> Optional[str]:
             IUIAutomationEventHandler as _IUIAutomationEventHandler,
             IUIAutomationFocusChangedEventHandler as _IUIAutomationFocusChangedEventHandler,
             IUIAutomationStructureChangedEventHandler as _IUIAutomationStructureChangedEventHandler,
+            IUIAutomationPropertyChangedEventHandler as _IUIAutomationPropertyChangedEventHandler,
         )
 
         IUIAutomationEventHandler = _IUIAutomationEventHandler
         IUIAutomationFocusChangedEventHandler = _IUIAutomationFocusChangedEventHandler
         IUIAutomationStructureChangedEventHandler = _IUIAutomationStructureChangedEventHandler
+        IUIAutomationPropertyChangedEventHandler = _IUIAutomationPropertyChangedEventHandler
         CUIAutomation = _CUIAutomation
 
         _com_loaded = True
@@ -228,7 +247,39 @@ def _create_handler_classes():
                 pass
             return 0  # S_OK
 
-    return WindowEventHandler, FocusEventHandler, StructureEventHandler
+    class CacheInvalidationHandler(comtypes.COMObject):
+        """
+        StructureChanged + PropertyChanged (text properties) handler for
+        one cached window. Only drops the window's ui_cache snapshots —
+        no element reads, so it stays cheap under bursts of events.
+        """
+        _com_interfaces_ = [
+            IUIAutomationStructureChangedEventHandler,
+            IUIAutomationPropertyChangedEventHandler,
+        ]
+
+        def __init__(self, hwnd: int):
+            super().__init__()
+            self._hwnd = hwnd
+
+        def HandleStructureChangedEvent(self, sender, changeType, runtimeId):
+            try:
+                ui_cache.invalidate(self._hwnd)
+            except Exception:
+                pass
+            return 0  # S_OK
+
+        def HandlePropertyChangedEvent(self, sender, propertyId, newValue):
+            try:
+                ui_cache.invalidate(self._hwnd)
+            except Exception:
+                pass
+            return 0  # S_OK
+
+    return (
+        WindowEventHandler, FocusEventHandler, StructureEventHandler,
+        CacheInvalidationHandler,
+    )
 
 
 # ─────────────────────────────────────────────────────────────
@@ -266,6 +317,8 @@ class UIAEventManager:
         self._window_opened_handler = None
         self._window_closed_handler = None
         self._focus_handler = None
+        self._cache_handler_cls = None
+        self._structure_watches: dict[int, tuple] = {}  # hwnd → (element, handler)
 
     def is_running(self) -> bool:
         """Check if the event monitor is running."""
@@ -301,6 +354,7 @@ class UIAEventManager:
             return self._start_error
 
         self._running = True
+        ui_cache.set_watcher(self)
         logger.info("UIA event monitor started")
         return None
 
@@ -313,6 +367,7 @@ class UIAEventManager:
         if not self._running:
             return
 
+        ui_cache.set_watcher(None)
         self._stop_event.set()
 
         if self._thread and self._thread.is_alive():
@@ -360,6 +415,23 @@ class UIAEventManager:
         # Return newest first, limited
         return filtered[-limit:][::-1]
 
+    def watch_structure(self, hwnd: int) -> None:
+        """
+        Ask the daemon thread to subscribe to StructureChanged events for
+        ``hwnd`` (ui_cache watcher hook, non-blocking).
+
+        / Pide suscribirse a eventos StructureChanged de ``hwnd``.
+        """
+        self._command_queue.put(("watch", hwnd))
+
+    def unwatch_structure(self, hwnd: int) -> None:
+        """
+        Ask the daemon thread to drop the StructureChanged subscription.
+
+        / Pide cancelar la suscripcion StructureChanged de ``hwnd``.
+        """
+        self._command_queue.put(("unwatch", hwnd))
+
     def _on_event(self, event_type: str, info: dict) -> None:
         """
         Callback passed to handler constructors. Thread-safe event storage.
@@ -410,7 +482,10 @@ class UIAEventManager:
                 return
 
             # Create handler classes (needs loaded type library)
-            WindowEventHandler, FocusEventHandler, _ = _create_handler_classes()
+            (
+                WindowEventHandler, FocusEventHandler, _,
+                self._cache_handler_cls,
+            ) = _create_handler_classes()
 
             # Create IUIAutomation instance
             import comtypes.client
@@ -425,7 +500,13 @@ class UIAEventManager:
 
             # Run message pump
             msg = ctypes.wintypes.MSG()
+            next_prune = time.monotonic() + _WATCH_PRUNE_SECONDS
             while not self._stop_event.is_set():
+                self._process_commands()
+                if time.monotonic() >= next_prune:
+                    self._prune_structure_watches()
+                    next_prune = time.monotonic() + _WATCH_PRUNE_SECONDS
+
                 # Process Windows messages (delivers COM callbacks)
                 while ctypes.windll.user32.PeekMessageW(
                     ctypes.byref(msg), 0, 0, 0, _PM_REMOVE
@@ -501,6 +582,76 @@ class UIAEventManager:
         except Exception as e:
             logger.warning(f"Failed to register FocusChanged handler: {e}")
 
+    def _process_commands(self) -> None:
+        """
+        Apply pending watch/unwatch requests. Runs on the daemon thread,
+        where the COM objects live.
+
+        / Aplica las solicitudes watch/unwatch pendientes (thread daemon).
+        """
+        while True:
+            try:
+                command, hwnd = self._command_queue.get_nowait()
+            except queue.Empty:
+                return
+            if command == "watch":
+                self._add_structure_watch(hwnd)
+            elif command == "unwatch":
+                self._remove_structure_watch(hwnd)
+
+    def _add_structure_watch(self, hwnd: int) -> None:
+        """
+        Subscribe a cached window's subtree to StructureChanged events and
+        to PropertyChanged for the text properties snapshots store. Both
+        must succeed, otherwise the window keeps ui_cache's short TTL.
+        """
+        if hwnd in self._structure_watches:
+            return
+        try:
+            element = self._automation.ElementFromHandle(hwnd)
+            handler = self._cache_handler_cls(hwnd)
+            self._automation.AddStructureChangedEventHandler(
+                element, TreeScope_Subtree, None, handler,
+            )
+        except Exception as e:
+            logger.debug(f"StructureChanged subscription failed for {hwnd}: {e}")
+            return
+        try:
+            self._automation.AddPropertyChangedEventHandler(
+                element, TreeScope_Subtree, None, handler, _CACHED_TEXT_PROPERTIES,
+            )
+        except Exception as e:
+            logger.debug(f"PropertyChanged subscription failed for {hwnd}: {e}")
+            try:
+                self._automation.RemoveStructureChangedEventHandler(element, handler)
+            except Exception:
+                pass
+            return
+        self._structure_watches[hwnd] = (element, handler)
+        ui_cache.subscribed(hwnd)
+
+    def _remove_structure_watch(self, hwnd: int) -> None:
+        """Drop a window's StructureChanged subscription, if any."""
+        watch = self._structure_watches.pop(hwnd, None)
+        if watch is None:
+            return
+        element, handler = watch
+        try:
+            self._automation.RemoveStructureChangedEventHandler(element, handler)
+        except Exception as e:
+            logger.debug(f"StructureChanged unsubscribe failed for {hwnd}: {e}")
+        try:
+            self._automation.RemovePropertyChangedEventHandler(element, handler)
+        except Exception as e:
+            logger.debug(f"PropertyChanged unsubscribe failed for {hwnd}: {e}")
+
+    def _prune_structure_watches(self) -> None:
+        """Unsubscribe windows that no longer exist."""
+        for hwnd in list(self._structure_watches):
+            if not ctypes.windll.user32.IsWindow(hwnd):
+                self._remove_structure_watch(hwnd)
+                ui_cache.unsubscribed(hwnd)
+
     def _unregister_all(self) -> None:
         """
         Unregister all event handlers. Called during cleanup.
@@ -517,6 +668,7 @@ class UIAEventManager:
             logger.warning(f"Error removing event handlers: {e}")
 
         self._handlers.clear()
+        self._structure_watches.clear()
         self._window_opened_handler = None
         self._window_closed_handler = None
         self._focus_handler = None
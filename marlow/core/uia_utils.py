@@ -18,41 +18,72 @@ from typing import Optional
 logger = logging.getLogger("marlow.core.uia_utils")
 
 
-# ── Levenshtein distance (basic, zero deps) ──
+# ── Levenshtein distance ──
+
+# rapidfuzz (optional) computes the distance in C++ with bit-parallel
+# SIMD; the pure-Python version below is used when it isn't installed.
+try:
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+except ImportError:
+    _rf_levenshtein = None
+
 
 def _levenshtein(s1: str, s2: str) -> int:
     """
     Compute Levenshtein edit distance between two strings.
-    Wagner-Fischer algorithm, O(m*n) time and O(min(m,n)) space.
+    Wagner-Fischer algorithm, O(m*n) time and O(min(m,n)) space, after
+    trimming the common prefix/suffix (which never affects the distance).
 
     / Distancia de edicion Levenshtein entre dos strings.
     """
-    if len(s1) < len(s2):
-        return _levenshtein(s2, s1)
+    if s1 == s2:
+        return 0
+    if _rf_levenshtein is not None:
+        return _rf_levenshtein.distance(s1, s2)
+
+    # Trim common prefix and suffix
+    start = 0
+    end1, end2 = len(s1), len(s2)
+    while start < end1 and start < end2 and s1[start] == s2[start]:
+        start += 1
+    while end1 > start and end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    s1, s2 = s1[start:end1], s2[start:end2]
 
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
     if not s2:
         return len(s1)
 
     prev = list(range(len(s2) + 1))
-    for i, c1 in enumerate(s1):
-        curr = [i + 1]
+    for i, c1 in enumerate(s1, 1):
+        curr = [i]
+        append = curr.append
+        left = i
         for j, c2 in enumerate(s2):
-            # Insert, delete, or substitute
-            curr.append(min(
-                prev[j + 1] + 1,      # deletion
-                curr[j] + 1,           # insertion
-                prev[j] + (c1 != c2),  # substitution
-            ))
+            # Substitution, deletion, insertion — inlined instead of min()
+            cost = prev[j] + (c1 != c2)
+            deletion = prev[j + 1] + 1
+            if deletion < cost:
+                cost = deletion
+            if left + 1 < cost:
+                cost = left + 1
+            append(cost)
+            left = cost
         prev = curr
 
     return prev[-1]
 
 
-def _similarity(s1: str, s2: str) -> float:
+def _similarity(s1: str, s2: str, min_score: float = 0.0) -> float:
     """
     Normalized similarity score between 0.0 and 1.0.
     1.0 = identical, 0.0 = completely different.
 
+    If ``min_score`` is given and the length difference alone rules it
+    out, returns 0.0 without computing the distance.
+
     / Puntaje de similitud normalizado entre 0.0 y 1.0.
     """
     if s1 == s2:
@@ -60,6 +91,8 @@ def _similarity(s1: str, s2: str) -> float:
     max_len = max(len(s1), len(s2))
     if max_len == 0:
         return 1.0
+    if min_score and 1.0 - abs(len(s1) - len(s2)) / max_len < min_score:
+        return 0.0
     return 1.0 - (_levenshtein(s1, s2) / max_len)
 
 
@@ -138,26 +171,24 @@ def _match_element(element, query_lower: str) -> Optional[dict]:
 
     / Evalua un elemento contra la query en multiples propiedades.
     """
+    from marlow.core.ui_cache import read_properties
+    return _match_properties(element, read_properties(element), query_lower)
+
+
+def _match_properties(element, props: dict, query_lower: str) -> Optional[dict]:
+    """
+    Score already-read element properties (see ui_cache.read_properties)
+    against the query. Same rules as _match_element.
+    """
     best_score = 0.0
     best_prop = None
 
-    # Gather properties
-    # / Recopilar propiedades del elemento
-    name = (element.window_text() or "").strip()
-    info = element.element_info
-    auto_id = (getattr(info, "automation_id", "") or "").strip()
-    help_text = (getattr(info, "help_text", "") or "").strip()
-    class_name = (getattr(info, "class_name", "") or "").strip()
-    control_type = (getattr(info, "control_type", "") or "").strip()
-
-    props = {
-        "name": name,
-        "automation_id": auto_id,
-        "help_text": help_text,
-        "class_name": class_name,
-    }
-
-    for prop_name, prop_value in props.items():
+    name = props["name"]
+    auto_id = props["automation_id"]
+    control_type = props["control_type"]
+
+    for prop_name in _THRESHOLDS:
+        prop_value = props[prop_name]
         if not prop_value:
             continue
 
@@ -194,7 +225,7 @@ def _match_element(element, query_lower: str) -> Optional[dict]:
             continue
 
         # Fuzzy similarity
-        score = _similarity(query_lower, prop_lower)
+        score = _similarity(query_lower, prop_lower, threshold)
         if score >= threshold and score > best_score:
             best_score = score
             best_prop = prop_name
@@ -213,12 +244,142 @@ def _match_element(element, query_lower: str) -> Optional[dict]:
     return None
 
 
+# UIA property / flag constants for the native FindAll prefilter
+_UIA_NamePropertyId = 30005
+_UIA_AutomationIdPropertyId = 30011
+_UIA_HelpTextPropertyId = 30013
+_UIA_ClassNamePropertyId = 30012
+_UIA_ControlTypePropertyId = 30003
+_PropertyConditionFlags_IgnoreCase = 1
+_PropertyConditionFlags_MatchSubstring = 2
+_TreeScope_Subtree = 7
+
+_SEARCH_PROPERTIES = (
+    ("name", _UIA_NamePropertyId),
+    ("automation_id", _UIA_AutomationIdPropertyId),
+    ("help_text", _UIA_HelpTextPropertyId),
+    ("class_name", _UIA_ClassNamePropertyId),
+)
+
+
+# Cache request for the native prefilter — built once per process
+_cache_request = None
+# Lowercased control type name → UIA control type id, built once per process
+_control_type_ids: Optional[dict] = None
+
+
+def _get_cache_request(iuia):
+    """Return the shared IUIAutomationCacheRequest for the search properties."""
+    global _cache_request
+    if _cache_request is None:
+        request = iuia.CreateCacheRequest()
+        for _, prop_id in _SEARCH_PROPERTIES:
+            request.AddProperty(prop_id)
+        request.AddProperty(_UIA_ControlTypePropertyId)
+        _cache_request = request
+    return _cache_request
+
+
+def _control_type_id(uia, control_type: str) -> Optional[int]:
+    """Case-insensitive lookup of a UIA control type id ("button" → Button)."""
+    global _control_type_ids
+    if _control_type_ids is None:
+        _control_type_ids = {
+            name.lower(): ct_id for name, ct_id in uia.known_control_types.items()
+        }
+    return _control_type_ids.get(control_type.lower())
+
+
+def _within_depth(iuia, elem, root, max_depth: int) -> bool:
+    """
+    True if ``elem`` is at most ``max_depth`` levels below ``root`` — the
+    same bound the tree walk applies. Follows the raw-view parent chain,
+    at most max_depth + 1 COM calls per candidate.
+    """
+    walker = iuia.RawViewWalker
+    current = elem
+    for _ in range(max_depth + 1):
+        if not current:
+            return False
+        if iuia.CompareElements(current, root):
+            return True
+        current = walker.GetParentElement(current)
+    return False
+
+
+def _find_native(
+    parent, query: str, control_type: Optional[str], max_depth: int = 5,
+) -> Optional[list]:
+    """
+    Let UIA do the filtering: one FindAllBuildCache call with a
+    case-insensitive substring condition on name / automation_id /
+    help_text / class_name (AND control type), prefetching those
+    properties in the same round trip. Matches deeper than ``max_depth``
+    are dropped, as the tree walk never reaches them.
+
+    Returns [(element, props)] for the candidates, or None when the native
+    query isn't available (older Windows without MatchSubstring, non-UIA
+    parent, comtypes error, unknown control type) so the caller falls back
+    to the tree walk.
+
+    / Filtrado nativo en UIA: una sola llamada FindAll con condiciones.
+    """
+    try:
+        from pywinauto.uia_defines import IUIA
+        from pywinauto.uia_element_info import UIAElementInfo
+        from pywinauto.controls.uiawrapper import UIAWrapper
+
+        root = parent.element_info.element
+        # IUIA is pywinauto's process-wide singleton: the CUIAutomation
+        # object is created once and COM is initialized (MTA) on import
+        uia = IUIA()
+        iuia = uia.iuia
+        flags = _PropertyConditionFlags_IgnoreCase | _PropertyConditionFlags_MatchSubstring
+
+        condition = None
+        for _, prop_id in _SEARCH_PROPERTIES:
+            cond = iuia.CreatePropertyConditionEx(prop_id, query, flags)
+            condition = cond if condition is None else iuia.CreateOrCondition(condition, cond)
+        if control_type:
+            ct_id = _control_type_id(uia, control_type)
+            if ct_id is None:
+                return None  # let the walk apply its name-based filter
+            condition = iuia.CreateAndCondition(
+                condition,
+                iuia.CreatePropertyCondition(_UIA_ControlTypePropertyId, ct_id),
+            )
+
+        found = root.FindAllBuildCache(
+            _TreeScope_Subtree, condition, _get_cache_request(iuia),
+        )
+        id_to_type = uia.known_control_type_ids
+
+        results = []
+        for i in range(found.Length):
+            elem = found.GetElement(i)
+            if not _within_depth(iuia, elem, root, max_depth):
+                continue
+            props = {
+                "name": (elem.CachedName or "").strip(),
+                "automation_id": (elem.CachedAutomationId or "").strip(),
+                "help_text": (elem.CachedHelpText or "").strip(),
+                "class_name": (elem.CachedClassName or "").strip(),
+                "control_type": id_to_type.get(elem.CachedControlType, ""),
+            }
+            results.append((UIAWrapper(UIAElementInfo(elem)), props))
+        return results
+    except Exception as e:
+        logger.debug(f"Native UIA FindAll unavailable, walking tree: {e}")
+        return None
+
+
 def find_element_enhanced(
     parent: object,
     query: str,
     control_type: Optional[str] = None,
     max_depth: int = 5,
     max_results: int = 5,
+    use_cache: bool = True,
 ) -> list[dict]:
     """
     Multi-property fuzzy search for UI elements.
@@ -232,6 +393,8 @@ def find_element_enhanced(
         control_type: Filter by control type (e.g., "Button", "Edit", "MenuItem").
         max_depth: Maximum tree depth to search.
         max_results: Maximum candidates to return.
+        use_cache: Reuse a recent tree snapshot of ``parent`` (ui_cache).
+                   Pollers that wait for the UI to change pass False.
 
     Returns:
         List of match dicts sorted by score (highest first):
@@ -240,6 +403,8 @@ def find_element_enhanced(
     / Busqueda fuzzy multi-propiedad para elementos UI.
     / Retorna candidatos rankeados por puntaje de similitud.
     """
+    from marlow.core import ui_cache
+
     query_lower = query.lower().strip()
     if not query_lower:
         return []
@@ -247,45 +412,40 @@ def find_element_enhanced(
     ct_lower = control_type.lower() if control_type else None
     candidates: list[dict] = []
 
-    def _walk(element, depth: int) -> bool:
-        """Walk tree. Returns True if perfect match found and we should stop."""
-        if depth > max_depth:
-            return False
-
-        try:
-            # Filter by control_type if specified
-            # / Filtrar por control_type si se especifica
-            if ct_lower:
-                elem_ct = (getattr(element.element_info, "control_type", "") or "").lower()
-                if elem_ct and elem_ct != ct_lower:
-                    # Still search children — control_type filter only skips this element
-                    pass
-                else:
-                    match = _match_element(element, query_lower)
-                    if match:
-                        if match["score"] == 1.0:
-                            candidates.append(match)
-                            return True  # Perfect match — stop early
-                        candidates.append(match)
-            else:
-                match = _match_element(element, query_lower)
-                if match:
-                    if match["score"] == 1.0:
-                        candidates.append(match)
-                        return True  # Perfect match — stop early
-                    candidates.append(match)
-
-            # Search children
-            for child in element.children():
-                if _walk(child, depth + 1):
-                    return True  # Propagate early stop
-
-        except Exception:
-            pass
-
-        return False
-
-    _walk(parent, 0)
+    # Fast path: native substring prefilter, fuzzy-score only what UIA
+    # returns. Typos and other fuzzy-only matches fall through to the walk.
+    native = _find_native(parent, query.strip(), control_type, max_depth)
+    if native:
+        for element, props in native:
+            # Same filter as the walk below, in case UIA ignored the condition
+            elem_ct = props["control_type"].lower()
+            if ct_lower and elem_ct and elem_ct != ct_lower:
+                continue
+            match = _match_properties(element, props, query_lower)
+            if match:
+                candidates.append(match)
+        if candidates:
+            candidates.sort(key=lambda c: c["score"], reverse=True)
+            return candidates[:max_results]
+
+    if use_cache:
+        snapshot = ui_cache.get_tree(parent, max_depth)
+    else:
+        snapshot = ui_cache.TreeSnapshot(parent, max_depth)
+
+    for entry in snapshot:
+        # Filter by control_type if specified — children are still searched
+        # / Filtrar por control_type si se especifica
+        if ct_lower:
+            elem_ct = entry["control_type"].lower()
+            if elem_ct and elem_ct != ct_lower:
+                continue
+
+        match = _match_properties(entry["element"], entry, query_lower)
+        if match:
+            candidates.append(match)
+            if match["score"] == 1.0:
+                break  # Perfect match — stop early
 
     # Sort by score descending, take top N
     candidates.sort(key=lambda c: c["score"], reverse=True)
@@ -297,6 +457,7 @@ def find_element_by_name(
     name: str,
     max_depth: int = 5,
     depth: int = 0,
+    use_cache: bool = True,
 ) -> Optional[object]:
     """
     Recursively search for an element by name in the UI tree.
@@ -312,7 +473,9 @@ def find_element_by_name(
     if depth != 0:
         return _find_element_by_name_legacy(parent, name, max_depth, depth)
 
-    results = find_element_enhanced(parent, name, max_depth=max_depth, max_results=1)
+    results = find_element_enhanced(
+        parent, name, max_depth=max_depth, max_results=1, use_cache=use_cache,
+    )
     if results:
         return results[0]["element"]
     return None
@@ -12,6 +12,11 @@ active MCP client window. Opens voice overlay automatically.
 Not an MCP tool itself (except get_voice_hotkey_status for querying state).
 Started automatically from server.py main().
 
+Hotkeys are registered with Win32 RegisterHotKey and delivered as
+WM_HOTKEY to a dedicated thread blocked in GetMessageW — zero CPU while
+idle and no per-keystroke Python hook. Falls back to the keyboard module
+if the combo can't be registered natively (e.g. already taken).
+
 / Proceso background con Ctrl+Shift+M (grabar) y Ctrl+Shift+N (parar).
 / Graba voz con VAD, transcribe, escribe en cliente MCP. Abre overlay.
 """
@@ -23,7 +28,6 @@ import ctypes
 import threading
 import winsound
 from typing import Optional, Callable
-from pathlib import Path
 
 from marlow.core.vad import AdaptiveVAD
 
@@ -41,6 +45,27 @@ _kill_switch_check: Optional[Callable] = None
 _hotkey_handle: Optional[object] = None
 _stop_handle: Optional[object] = None
 _saved_hwnd: Optional[int] = None  # foreground window when hotkey pressed
+_backend: Optional[str] = None  # "register_hotkey" | "keyboard"
+_pump_thread: Optional[threading.Thread] = None
+_pump_thread_id: Optional[int] = None
+
+# ── Win32 RegisterHotKey ──
+_WM_HOTKEY = 0x0312
+_WM_QUIT = 0x0012
+_MOD_ALT = 0x0001
+_MOD_CONTROL = 0x0002
+_MOD_SHIFT = 0x0004
+_MOD_WIN = 0x0008
+_MOD_NOREPEAT = 0x4000
+_HOTKEY_ID_RECORD = 1
+_HOTKEY_ID_STOP = 2
+
+_MODIFIERS = {
+    "ctrl": _MOD_CONTROL, "control": _MOD_CONTROL,
+    "shift": _MOD_SHIFT,
+    "alt": _MOD_ALT,
+    "win": _MOD_WIN, "windows": _MOD_WIN,
+}
 
 # ── Recording config ──
 CHUNK_DURATION = 0.5        # seconds per chunk
@@ -53,13 +78,121 @@ MAX_RECORDING_SECONDS = 30   # absolute max
 _vad = AdaptiveVAD(silero_threshold=0.5, rms_threshold=SILENCE_RMS_THRESHOLD)
 
 
+def _parse_hotkey(combo: str) -> Optional[tuple[int, int]]:
+    """
+    Parse "ctrl+shift+m" into (modifiers, virtual_key) for RegisterHotKey.
+    Returns None for combos this parser doesn't handle.
+
+    / Convierte "ctrl+shift+m" a (modificadores, tecla virtual).
+    """
+    modifiers = 0
+    key = None
+    for part in combo.lower().replace(" ", "").split("+"):
+        if part in _MODIFIERS:
+            modifiers |= _MODIFIERS[part]
+        elif key is None:
+            key = part
+        else:
+            return None
+
+    if key is None:
+        return None
+    if len(key) == 1 and key.isalnum():
+        vk = ord(key.upper())
+    elif key.startswith("f") and key[1:].isdigit() and 1 <= int(key[1:]) <= 24:
+        vk = 0x70 + int(key[1:]) - 1  # VK_F1..VK_F24
+    else:
+        return None
+    return modifiers, vk
+
+
+def _hotkey_pump(
+    record: tuple[int, int],
+    stop: tuple[int, int],
+    ready: threading.Event,
+    errors: list,
+) -> None:
+    """
+    Dedicated thread: register both hotkeys and block in GetMessageW.
+    RegisterHotKey with hWnd=NULL posts WM_HOTKEY to this thread's queue.
+
+    / Hilo dedicado: registra hotkeys y espera WM_HOTKEY en GetMessageW.
+    """
+    global _pump_thread_id
+    import ctypes.wintypes
+
+    user32 = ctypes.windll.user32
+    _pump_thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+
+    registered = []
+    for hotkey_id, (mods, vk) in ((_HOTKEY_ID_RECORD, record), (_HOTKEY_ID_STOP, stop)):
+        if user32.RegisterHotKey(None, hotkey_id, mods | _MOD_NOREPEAT, vk):
+            registered.append(hotkey_id)
+        else:
+            errors.append(f"RegisterHotKey failed (id={hotkey_id}, error={ctypes.GetLastError()})")
+
+    if errors:
+        for hotkey_id in registered:
+            user32.UnregisterHotKey(None, hotkey_id)
+        ready.set()
+        return
+    ready.set()
+
+    msg = ctypes.wintypes.MSG()
+    try:
+        # GetMessageW returns 0 on WM_QUIT, -1 on error
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            if msg.message != _WM_HOTKEY:
+                continue
+            try:
+                if msg.wParam == _HOTKEY_ID_RECORD:
+                    _on_hotkey_pressed()
+                elif msg.wParam == _HOTKEY_ID_STOP:
+                    _on_stop_pressed()
+            except Exception as e:
+                logger.error(f"Voice hotkey callback error: {e}")
+    finally:
+        for hotkey_id in registered:
+            user32.UnregisterHotKey(None, hotkey_id)
+        _pump_thread_id = None
+
+
+def _start_native_hotkeys(hotkey: str) -> Optional[str]:
+    """
+    Start the RegisterHotKey pump thread. Returns None on success,
+    or an error string if native registration isn't possible.
+    """
+    global _pump_thread
+
+    record = _parse_hotkey(hotkey)
+    stop = _parse_hotkey(_stop_combo)
+    if record is None or stop is None:
+        return f"unsupported hotkey combo for RegisterHotKey: {hotkey}"
+
+    ready = threading.Event()
+    errors: list[str] = []
+    thread = threading.Thread(
+        target=_hotkey_pump,
+        args=(record, stop, ready, errors),
+        name="voice-hotkey-pump",
+        daemon=True,
+    )
+    thread.start()
+    if not ready.wait(timeout=5.0):
+        return "hotkey thread did not start"
+    if errors:
+        return "; ".join(errors)
+
+    _pump_thread = thread
+    return None
+
+
 def start_voice_hotkey(
     hotkey: str = "ctrl+shift+m",
     kill_check: Optional[Callable] = None,
 ) -> dict:
     """
-    Register global voice hotkey via keyboard module.
-    Same pattern as kill switch in safety.py.
+    Register global voice hotkeys via RegisterHotKey (keyboard module fallback).
 
     Args:
         hotkey: Hotkey combination (default: ctrl+shift+m).
@@ -68,10 +201,10 @@ def start_voice_hotkey(
     Returns:
         Status dict.
 
-    / Registra hotkey global de voz via modulo keyboard.
+    / Registra hotkeys globales de voz via RegisterHotKey (fallback: keyboard).
     """
     global _hotkey_active, _hotkey_combo, _kill_switch_check
-    global _hotkey_handle, _stop_handle
+    global _hotkey_handle, _stop_handle, _backend
 
     if _hotkey_active:
         return {"success": True, "status": "already_active", "hotkey": _hotkey_combo}
@@ -79,13 +212,28 @@ def start_voice_hotkey(
     _hotkey_combo = hotkey
     _kill_switch_check = kill_check
 
+    native_err = _start_native_hotkeys(hotkey)
+    if native_err is None:
+        _backend = "register_hotkey"
+        _hotkey_active = True
+        logger.info(f"Voice hotkeys active: {hotkey} (record), {_stop_combo} (stop)")
+        return {
+            "success": True, "hotkey": hotkey, "stop_hotkey": _stop_combo,
+            "backend": _backend,
+        }
+    logger.debug(f"Native voice hotkeys unavailable, using keyboard hook: {native_err}")
+
     try:
         import keyboard
         _hotkey_handle = keyboard.add_hotkey(hotkey, _on_hotkey_pressed)
         _stop_handle = keyboard.add_hotkey(_stop_combo, _on_stop_pressed)
+        _backend = "keyboard"
         _hotkey_active = True
         logger.info(f"Voice hotkeys active: {hotkey} (record), {_stop_combo} (stop)")
-        return {"success": True, "hotkey": hotkey, "stop_hotkey": _stop_combo}
+        return {
+            "success": True, "hotkey": hotkey, "stop_hotkey": _stop_combo,
+            "backend": _backend,
+        }
     except ImportError:
         logger.warning("keyboard module not available. Voice hotkey disabled.")
         return {"error": "keyboard module not installed"}
@@ -100,12 +248,24 @@ def stop_voice_hotkey() -> dict:
 
     / Desregistra ambos hotkeys de voz (grabar + parar).
     """
-    global _hotkey_active, _hotkey_handle, _stop_handle
+    global _hotkey_active, _hotkey_handle, _stop_handle, _backend, _pump_thread
 
     if not _hotkey_active:
         return {"success": True, "status": "already_inactive"}
 
     try:
+        if _backend == "register_hotkey":
+            # WM_QUIT ends GetMessageW; the pump unregisters on exit
+            if _pump_thread_id is not None:
+                ctypes.windll.user32.PostThreadMessageW(_pump_thread_id, _WM_QUIT, 0, 0)
+            if _pump_thread is not None:
+                _pump_thread.join(timeout=2.0)
+                _pump_thread = None
+            _backend = None
+            _hotkey_active = False
+            logger.info("Voice hotkeys deactivated")
+            return {"success": True, "status": "deactivated"}
+
         import keyboard
         if _hotkey_handle is not None:
             keyboard.remove_hotkey(_hotkey_handle)
@@ -113,6 +273,7 @@ def stop_voice_hotkey() -> dict:
         if _stop_handle is not None:
             keyboard.remove_hotkey(_stop_handle)
             _stop_handle = None
+        _backend = None
         _hotkey_active = False
         logger.info("Voice hotkeys deactivated")
         return {"success": True, "status": "deactivated"}
@@ -134,6 +295,7 @@ async def get_voice_hotkey_status() -> dict:
         "success": True,
         "hotkey_active": _hotkey_active,
         "hotkey": _hotkey_combo,
+        "backend": _backend,
         "currently_recording": _recording,
         "last_transcribed_text": _last_text,
         "last_error": _last_error,
@@ -225,16 +387,8 @@ def _record_and_transcribe():
         # Update overlay: processing
         _overlay_status("processing")
 
-        # Save to WAV
-        audio_path = _save_chunks_to_wav(audio_data)
-        if audio_path is None:
-            _last_error = "Failed to save audio"
-            _overlay_status("idle")
-            winsound.Beep(400, 300)
-            return
-
-        # Transcribe
-        text = _transcribe_sync(str(audio_path))
+        # Transcribe straight from memory (no WAV round-trip)
+        text = _transcribe_sync(audio_data)
         if text is None or not text.strip():
             _last_error = "Transcription returned empty text"
             _overlay_status("idle")
@@ -363,31 +517,12 @@ def _compute_rms_from_array(audio_array) -> float:
     return float(rms)
 
 
-def _save_chunks_to_wav(audio_data) -> Optional[Path]:
-    """
-    Save numpy int16 audio array to WAV file in AUDIO_DIR.
-
-    / Guarda array numpy de audio int16 en archivo WAV.
-    """
-    try:
-        import soundfile as sf
-        from marlow.tools.audio import AUDIO_DIR
-
-        ts = time.strftime("%Y%m%d_%H%M%S")
-        output_path = AUDIO_DIR / f"voice_hotkey_{ts}.wav"
-        sf.write(str(output_path), audio_data, SAMPLE_RATE)
-        return output_path
-    except Exception as e:
-        logger.error(f"Failed to save audio: {e}")
-        return None
-
-
-def _transcribe_sync(audio_path: str) -> Optional[str]:
+def _transcribe_sync(audio_data) -> Optional[str]:
     """
-    Transcribe audio file synchronously (we're in a thread, not async context).
+    Transcribe int16 samples synchronously (we're in a thread, not async context).
     Creates a new event loop to call the async transcribe_audio().
 
-    / Transcribe archivo de audio sincronamente usando nuevo event loop.
+    / Transcribe las muestras de audio sincronamente usando nuevo event loop.
     """
     try:
         from marlow.tools.audio import transcribe_audio
@@ -395,7 +530,7 @@ def _transcribe_sync(audio_path: str) -> Optional[str]:
         loop = asyncio.new_event_loop()
         try:
             result = loop.run_until_complete(
-                transcribe_audio(audio_path=audio_path, language="auto")
+                transcribe_audio(audio=audio_data, language="auto")
             )
         finally:
             loop.close()
@@ -17,6 +17,8 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
+from marlow.core import ui_cache
+
 from .constants import TOOL_RISK_MAP
 from .tool_wrapper import wrap_tool_call, wrap_tool_call_async
 from .types import ToolResult
@@ -104,6 +106,15 @@ class SmartExecutor:
                 f"Unknown tool: {tool_name}", tool_name=tool_name,
             )
 
+        try:
+            return await self._run(tool_name, func, params)
+        finally:
+            # The tool may have changed the UI (even if it failed or timed
+            # out) — drop cached UIA trees, as server.py does for MCP calls
+            ui_cache.tool_finished(tool_name)
+
+    async def _run(self, tool_name: str, func: Callable, params: dict) -> ToolResult:
+        """Call ``func`` and normalize its outcome into a ToolResult."""
         try:
             if inspect.iscoroutinefunction(func):
                 # Case 1: native async
@@ -62,7 +62,7 @@ async def main():
     from marlow.tools import screenshot
     result = await screenshot.take_screenshot(quality=50)
     pp("Direct take_screenshot result (truncated image)",
-       {k: (v[:80] + "..." if isinstance(v, str) and len(v) > 80 else v)
+       {k: (v[:80] + b"..." if isinstance(v, bytes) and len(v) > 80 else v)
         for k, v in result.items()})
 
     # ── Test 3: Direct call to open_application ──
@@ -230,7 +230,7 @@ def _summarize(data) -> str:
             return f"{count} windows found"
         if "os" in data:
             return f"{data.get('os', '?')} — {data.get('cpu', '?')}"
-        if "image_base64" in data:
+        if "image_bytes" in data:
             w = data.get("width", "?")
             h = data.get("height", "?")
             return f"Screenshot {w}x{h}"
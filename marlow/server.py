@@ -15,11 +15,25 @@ Usage:
     
     # Or with uvx (for MCP clients)
     uvx marlow-mcp
+
+    # Keep one warm server around; `marlow` then attaches to it
+    marlow-serve
 """
 
 import asyncio
+import atexit
+import base64
+import functools
+import importlib.util
+import inspect
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import re
 import sys
+from typing import Awaitable, Callable
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -27,6 +41,7 @@ from mcp.types import (
     Tool,
     TextContent,
     ImageContent,
+    ListToolsRequest,
 )
 
 from marlow import __version__
@@ -34,60 +49,124 @@ from marlow.core.config import MarlowConfig, ensure_dirs
 from marlow.core.safety import SafetyEngine
 from marlow.core.sanitizer import DataSanitizer
 
-# Phase 1 Tools
+
+def _lazy_import(name: str):
+    """
+    Return a module whose code only runs on first attribute access.
+
+    Tool modules outside the hot path (CDP, OCR, audio, SoM, ...) pull in
+    psutil, websocket, PIL, etc. at import; deferring them keeps server
+    startup cheap when a session only uses a handful of tools.
+
+    / Modulo que se carga al primer acceso a un atributo.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    parent, _, child = name.rpartition(".")
+    setattr(sys.modules[parent], child, module)
+    loader.exec_module(module)
+    return module
+
+
+# Phase 1 Tools (eager — first-hit tools)
 from marlow.tools import ui_tree, screenshot, mouse, keyboard, windows, system
 
-# Phase 2 Tools
-from marlow.tools import ocr, background, audio, voice, app_script
-from marlow.core import escalation
+# Used on every call or at startup (eager)
 from marlow.core import focus
-from marlow.core import app_detector
-from marlow.core import cdp_manager
+from marlow.tools import background
+from marlow.tools import scheduler
+from marlow.core import voice_hotkey
+from marlow.core import adaptive
+from marlow.core import workflows
+from marlow.core import setup_wizard
+from marlow.core import ui_cache
+from marlow.core import loop_guard
+
+# Phase 2 Tools
+ocr = _lazy_import("marlow.tools.ocr")
+audio = _lazy_import("marlow.tools.audio")
+voice = _lazy_import("marlow.tools.voice")
+app_script = _lazy_import("marlow.tools.app_script")
+escalation = _lazy_import("marlow.core.escalation")
+app_detector = _lazy_import("marlow.core.app_detector")
+cdp_manager = _lazy_import("marlow.core.cdp_manager")
 
 # Phase 3 Tools
-from marlow.tools import visual_diff, memory, clipboard_ext, scraper
-from marlow.extensions import registry as ext_registry
+visual_diff = _lazy_import("marlow.tools.visual_diff")
+memory = _lazy_import("marlow.tools.memory")
+clipboard_ext = _lazy_import("marlow.tools.clipboard_ext")
+scraper = _lazy_import("marlow.tools.scraper")
+ext_registry = _lazy_import("marlow.extensions.registry")
 
 # Phase 4 Tools
-from marlow.tools import watcher, scheduler
+watcher = _lazy_import("marlow.tools.watcher")
 
-# Phase 5: Voice Control + TTS
-from marlow.core import voice_hotkey
-from marlow.tools import tts
-
-# Adaptive Behavior + Workflows
-from marlow.core import adaptive
-from marlow.core import workflows
+# Phase 5: TTS
+tts = _lazy_import("marlow.tools.tts")
 
 # Self-Improve: Error Journal
-from marlow.core import error_journal
+error_journal = _lazy_import("marlow.core.error_journal")
 
 # Smart Wait
-from marlow.tools import wait
+wait = _lazy_import("marlow.tools.wait")
 
 # Voice Overlay
-from marlow.core import voice_overlay
+voice_overlay = _lazy_import("marlow.core.voice_overlay")
 
 # UIA Event Handlers + Dialog Handler + Cascade Recovery
-from marlow.core import uia_events
-from marlow.core import dialog_handler
-from marlow.core import cascade_recovery
-from marlow.core import som
-
-# Setup Wizard
-from marlow.core import setup_wizard
+uia_events = _lazy_import("marlow.core.uia_events")
+dialog_handler = _lazy_import("marlow.core.dialog_handler")
+cascade_recovery = _lazy_import("marlow.core.cascade_recovery")
+som = _lazy_import("marlow.core.som")
 
 # Help / Capabilities
-from marlow.tools import help as help_mod
+help_mod = _lazy_import("marlow.tools.help")
 
 # ─────────────────────────────────────────────────────────────
 # Setup
 # ─────────────────────────────────────────────────────────────
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
-)
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() formats the message in the caller so records
+        # can be pickled; ours never leave the process.
+        return record
+
+
+def _setup_logging() -> None:
+    """
+    Route all logging through a queue drained by a background thread.
+
+    Tool handlers only enqueue the record; formatting and the stderr
+    write (shared with the stdio transport's pipe) happen off the
+    request path. Same format and level as before; like basicConfig,
+    does nothing if the root logger is already configured.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(logging.Formatter(
+        "%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+    ))
+    listener = logging.handlers.QueueListener(log_queue, stream)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root.setLevel(logging.INFO)
+    root.addHandler(_InProcessQueueHandler(log_queue))
+
+
+_setup_logging()
 logger = logging.getLogger("marlow")
 
 # Load config and initialize safety systems
@@ -99,1981 +178,2050 @@ sanitizer = DataSanitizer(config)
 app = Server("marlow")
 
 # Wire kill switch into scheduler so scheduled tasks respect it
-from marlow.tools.scheduler import set_kill_switch_check
-set_kill_switch_check(lambda: safety.is_killed)
+from marlow.tools.scheduler import set_kill_event
+set_kill_event(safety.kill_event)
 
 
 # ─────────────────────────────────────────────────────────────
 # Tool Definitions
-# ─────────────────────────────────────────────────────────────
-
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """Register all Marlow tools with the MCP server."""
-    return [
-        # ── UI Tree (Primary vision — 0 tokens) ──
-        Tool(
-            name="get_ui_tree",
-            description=(
-                "Read the Windows UI Automation Accessibility Tree for a window. "
-                "This is Marlow's primary 'vision' — understands what's on screen "
-                "without screenshots. Cost: 0 tokens. Speed: ~10-50ms. "
-                "ALWAYS try this before take_screenshot. "
-                "Depth is auto-tuned per app framework (Electron=5, WinUI=15, etc.)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window title to inspect. If omitted, uses the active window.",
-                    },
-                    "max_depth": {
-                        "description": (
-                            "Tree depth. 'auto' (default) picks optimal depth per app framework "
-                            "(WinUI/WPF=15, WinForms=12, Chromium=8, Electron=5). "
-                            "Pass integer to override."
-                        ),
-                        "default": "auto",
-                    },
-                    "include_invisible": {
-                        "type": "boolean",
-                        "description": "Include non-visible elements.",
-                        "default": False,
-                    },
-                },
-            },
-        ),
-
-        # ── Screenshot (Last resort — ~1,500 tokens) ──
-        Tool(
-            name="take_screenshot",
-            description=(
-                "Take a screenshot of the screen or a specific window. "
-                "⚠️ Costs ~1,500 tokens. Use get_ui_tree first (0 tokens). "
-                "Use this only when UI tree is insufficient."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {
-                        "type": "string",
-                        "description": "Capture specific window only.",
-                    },
-                    "region": {
-                        "type": "object",
-                        "description": "Capture region: {x, y, width, height}.",
-                        "properties": {
-                            "x": {"type": "integer"},
-                            "y": {"type": "integer"},
-                            "width": {"type": "integer"},
-                            "height": {"type": "integer"},
-                        },
-                    },
-                    "quality": {
-                        "type": "integer",
-                        "description": "JPEG quality 1-100 (default: 85).",
-                        "default": 85,
-                    },
-                },
-            },
-        ),
-
-        # ── Mouse ──
-        Tool(
-            name="click",
-            description=(
-                "Click a UI element by name (preferred) or at coordinates. "
-                "By name: finds element in Accessibility Tree and clicks silently "
-                "(works in background mode). By coordinates: real mouse click."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "element_name": {
-                        "type": "string",
-                        "description": "Name/text of element to click (e.g., 'Save', 'OK').",
-                    },
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to search in.",
-                    },
-                    "x": {"type": "integer", "description": "X coordinate."},
-                    "y": {"type": "integer", "description": "Y coordinate."},
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "right", "middle"],
-                        "default": "left",
-                    },
-                    "double_click": {"type": "boolean", "default": False},
-                },
-            },
-        ),
-
-        # ── Keyboard ──
-        Tool(
-            name="type_text",
-            description=(
-                "Type text into an element by name (preferred) or at cursor position. "
-                "By name: finds text field and types silently (background compatible). "
-                "Direct: simulates keyboard at current cursor."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "Text to type.",
-                    },
-                    "element_name": {
-                        "type": "string",
-                        "description": "Name of text field (e.g., 'Search', 'Email').",
-                    },
-                    "window_title": {"type": "string"},
-                    "clear_first": {"type": "boolean", "default": False},
-                },
-                "required": ["text"],
-            },
-        ),
-        Tool(
-            name="press_key",
-            description="Press a keyboard key. Examples: 'enter', 'tab', 'escape', 'f5', 'delete'.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {
-                        "type": "string",
-                        "description": "Key to press.",
-                    },
-                    "times": {
-                        "type": "integer",
-                        "description": "Times to press (default: 1).",
-                        "default": 1,
-                    },
-                },
-                "required": ["key"],
-            },
-        ),
-        Tool(
-            name="hotkey",
-            description=(
-                "Execute keyboard shortcut. Examples: "
-                "['ctrl','c'] for copy, ['ctrl','shift','s'] for save as, "
-                "['alt','f4'] to close."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keys": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Keys to press simultaneously.",
-                    },
-                },
-                "required": ["keys"],
-            },
-        ),
-
-        # ── Windows ──
-        Tool(
-            name="list_windows",
-            description="List all open windows with titles, positions, and sizes.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "include_minimized": {"type": "boolean", "default": True},
-                },
-            },
-        ),
-        Tool(
-            name="focus_window",
-            description="Bring a window to the foreground.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {
-                        "type": "string",
-                        "description": "Title or partial title of window.",
-                    },
-                },
-                "required": ["window_title"],
-            },
-        ),
-        Tool(
-            name="manage_window",
-            description=(
-                "Manage a window: minimize, maximize, restore, close, move, or resize."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {"type": "string"},
-                    "action": {
-                        "type": "string",
-                        "enum": ["minimize", "maximize", "restore", "close",
-                                 "move", "resize"],
-                    },
-                    "x": {"type": "integer", "description": "For move action."},
-                    "y": {"type": "integer", "description": "For move action."},
-                    "width": {"type": "integer", "description": "For resize action."},
-                    "height": {"type": "integer", "description": "For resize action."},
-                },
-                "required": ["window_title", "action"],
-            },
-        ),
-
-        # ── System ──
-        Tool(
-            name="run_command",
-            description=(
-                "Execute a PowerShell or CMD command. "
-                "⚠️ Destructive commands (format, del /f, rm -rf, etc.) are BLOCKED."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "command": {"type": "string", "description": "Command to execute."},
-                    "shell": {
-                        "type": "string",
-                        "enum": ["powershell", "cmd"],
-                        "default": "powershell",
-                    },
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Timeout in seconds (default: 30).",
-                        "default": 30,
-                    },
-                },
-                "required": ["command"],
-            },
-        ),
-        Tool(
-            name="open_application",
-            description="Open an application by name (Start Menu) or file path.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "app_name": {
-                        "type": "string",
-                        "description": "App name (e.g., 'Notepad', 'Chrome').",
-                    },
-                    "app_path": {
-                        "type": "string",
-                        "description": "Full path to executable.",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="clipboard",
-            description="Read from or write to the system clipboard.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "enum": ["read", "write"],
-                        "default": "read",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Text to write (for action='write').",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="system_info",
-            description="Get system info: OS, CPU, RAM, disk usage, top processes.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-
-        # ── Phase 2: OCR ──
-        Tool(
-            name="ocr_region",
-            description=(
-                "Extract text from a window or screen region using OCR. "
-                "Primary: Windows OCR (~50-200ms, built-in). Fallback: Tesseract (~200-500ms). "
-                "Cost: 0 tokens. Returns text + word bounding boxes for clicking."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to OCR. If omitted, captures full screen.",
-                    },
-                    "region": {
-                        "type": "object",
-                        "description": "Specific region: {x, y, width, height}.",
-                        "properties": {
-                            "x": {"type": "integer"},
-                            "y": {"type": "integer"},
-                            "width": {"type": "integer"},
-                            "height": {"type": "integer"},
-                        },
-                    },
-                    "language": {
-                        "type": "string",
-                        "description": (
-                            "Language for OCR. Windows OCR: BCP-47 tag (e.g., 'en-US', 'es-MX'). "
-                            "Tesseract: ISO 639-3 (e.g., 'eng', 'spa'). Auto-detects if omitted."
-                        ),
-                    },
-                    "engine": {
-                        "type": "string",
-                        "enum": ["windows", "tesseract"],
-                        "description": "Force a specific OCR engine. Default: auto (Windows primary, Tesseract fallback).",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="list_ocr_languages",
-            description=(
-                "List available OCR languages for each engine (Windows OCR and Tesseract). "
-                "Use to check which languages are installed before running OCR."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-
-        # ── Phase 2: Smart Find (Escalation) ──
-        Tool(
-            name="smart_find",
-            description=(
-                "Find a UI element using escalating methods: "
-                "1) UI Automation with fuzzy search (0 tokens, ~10-50ms) → "
-                "2) OCR (0 tokens, ~50-200ms) → "
-                "3) Screenshot for LLM Vision (~1,500 tokens). "
-                "BEST tool for finding elements — automatically picks the cheapest method."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "target": {
-                        "type": "string",
-                        "description": "Text/name of element to find (e.g., 'File', 'Save').",
-                    },
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to search in.",
-                    },
-                    "click_if_found": {
-                        "type": "boolean",
-                        "description": "Automatically click the element if found.",
-                        "default": False,
-                    },
-                },
-                "required": ["target"],
-            },
-        ),
-        Tool(
-            name="find_elements",
-            description=(
-                "Multi-property fuzzy search for UI elements. "
-                "Searches name, automation_id, help_text, class_name with Levenshtein distance. "
-                "Returns top 5 candidates ranked by similarity score. "
-                "Use when you need to explore what elements exist or find approximate matches."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Text to search for (e.g., 'Save', 'btnSubmit', 'Edit').",
-                    },
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to search in. If omitted, uses active window.",
-                    },
-                    "control_type": {
-                        "type": "string",
-                        "description": "Filter by control type (e.g., 'Button', 'Edit', 'MenuItem').",
-                    },
-                },
-                "required": ["query"],
-            },
-        ),
-
-        # ── Phase 2: Cascade Recovery ──
-        Tool(
-            name="cascade_find",
-            description=(
-                "Multi-step recovery pipeline for finding UI elements when smart_find fails. "
-                "Tries 5 progressively harder strategies within a timeout: "
-                "1) Wait & retry (app loading), 2) Check blocking dialogs, "
-                "3) Wide fuzzy search (low thresholds), 4) OCR text search, "
-                "5) Screenshot for LLM vision. Each step records in Error Journal."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "target": {
-                        "type": "string",
-                        "description": "Text/name of the element to find.",
-                    },
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to search in. If omitted, uses active window.",
-                    },
-                    "timeout": {
-                        "type": "number",
-                        "description": "Maximum seconds for recovery (5-30, default 10).",
-                    },
-                },
-                "required": ["target"],
-            },
-        ),
-
-        # ── Phase 3.1: Set-of-Mark Prompting ──
-        Tool(
-            name="get_annotated_screenshot",
-            description=(
-                "Take a screenshot with numbered labels [1], [2], [3]... drawn on each "
-                "interactive UI element. Returns the annotated image + element map. "
-                "Use this to visually identify elements, then som_click(index) to interact. "
-                "Cost: ~1,500 tokens (screenshot). Preferred over raw screenshot when you "
-                "need to identify clickable elements."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to annotate. If omitted, uses active window.",
-                    },
-                    "interactive_only": {
-                        "type": "boolean",
-                        "description": (
-                            "If true (default), only label interactive elements "
-                            "(buttons, inputs, links, menu items, etc.)."
-                        ),
-                        "default": True,
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="som_click",
-            description=(
-                "Click a UI element by its Set-of-Mark index number from "
-                "get_annotated_screenshot. Example: after seeing [3] on 'Save' button, "
-                "call som_click(index=3) to click it."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "index": {
-                        "type": "integer",
-                        "description": "The [N] label number from the annotated screenshot.",
-                    },
-                    "window_title": {
-                        "type": "string",
-                        "description": (
-                            "If provided, re-annotates this window first to get fresh "
-                            "positions. Otherwise uses the last annotation."
-                        ),
-                    },
-                },
-                "required": ["index"],
-            },
-        ),
-
-        # ── Phase 2: App Framework Detection ──
-        Tool(
-            name="detect_app_framework",
-            description=(
-                "Detect the UI framework of a window (Electron, CEF, Chromium, WPF, WinForms, "
-                "WinUI 3, UWP, Win32) by analyzing loaded DLLs. If no window specified, scans "
-                "all visible windows. Useful to choose the best automation strategy."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to analyze. If omitted, scans all visible windows.",
-                    },
-                },
-            },
-        ),
-
-        # ── Phase 2.1: CDP (Chrome DevTools Protocol) ──
-        Tool(
-            name="cdp_discover",
-            description=(
-                "Scan localhost ports for apps with CDP (Chrome DevTools Protocol) enabled. "
-                "Finds Electron apps, Chrome with --remote-debugging-port, etc. "
-                "Returns list of targets with port, title, URL, and WebSocket URL."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port_start": {
-                        "type": "integer",
-                        "description": "Start of port range to scan (default: 9222).",
-                        "default": 9222,
-                    },
-                    "port_end": {
-                        "type": "integer",
-                        "description": "End of port range to scan (default: 9250).",
-                        "default": 9250,
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="cdp_connect",
-            description=(
-                "Connect to a CDP endpoint on a given port. Establishes WebSocket "
-                "connection to the first debuggable page target."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port": {
-                        "type": "integer",
-                        "description": "Port number of the CDP endpoint.",
-                    },
-                },
-                "required": ["port"],
-            },
-        ),
-        Tool(
-            name="cdp_disconnect",
-            description="Disconnect from a CDP endpoint.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port": {
-                        "type": "integer",
-                        "description": "Port number to disconnect from.",
-                    },
-                },
-                "required": ["port"],
-            },
-        ),
-        Tool(
-            name="cdp_list_connections",
-            description="List all active CDP connections.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="cdp_send",
-            description=(
-                "Send a raw CDP command. For advanced use when specific CDP methods "
-                "are needed beyond the convenience tools."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port": {
-                        "type": "integer",
-                        "description": "CDP port.",
-                    },
-                    "method": {
-                        "type": "string",
-                        "description": "CDP method (e.g., 'Network.enable', 'CSS.getComputedStyleForNode').",
-                    },
-                    "params": {
-                        "type": "object",
-                        "description": "Optional parameters for the CDP method.",
-                    },
-                },
-                "required": ["port", "method"],
-            },
-        ),
-        Tool(
-            name="cdp_click",
-            description=(
-                "Click at page coordinates via CDP. 100% invisible — no focus steal, "
-                "no mouse movement. Coordinates are relative to page viewport."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port": {
-                        "type": "integer",
-                        "description": "CDP port.",
-                    },
-                    "x": {
-                        "type": "integer",
-                        "description": "X coordinate in page viewport.",
-                    },
-                    "y": {
-                        "type": "integer",
-                        "description": "Y coordinate in page viewport.",
-                    },
-                },
-                "required": ["port", "x", "y"],
-            },
-        ),
-        Tool(
-            name="cdp_type_text",
-            description=(
-                "Type text via CDP. 100% invisible — no focus steal, no keyboard events. "
-                "Focus the target input first with cdp_click or cdp_click_selector."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port": {
-                        "type": "integer",
-                        "description": "CDP port.",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Text to type.",
-                    },
-                },
-                "required": ["port", "text"],
-            },
-        ),
-        Tool(
-            name="cdp_key_combo",
-            description=(
-                "Press a key combination via CDP (e.g., Ctrl+A, Enter, Escape). "
-                "100% invisible."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port": {
-                        "type": "integer",
-                        "description": "CDP port.",
-                    },
-                    "key": {
-                        "type": "string",
-                        "description": "Key name (e.g., 'a', 'Enter', 'Tab', 'Escape').",
-                    },
-                    "modifiers": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Modifier keys: 'ctrl', 'alt', 'shift', 'meta'.",
-                    },
-                },
-                "required": ["port", "key"],
-            },
-        ),
-        Tool(
-            name="cdp_screenshot",
-            description=(
-                "Take screenshot via CDP. Works even if window is behind others or minimized. "
-                "Returns base64 image."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port": {
-                        "type": "integer",
-                        "description": "CDP port.",
-                    },
-                    "format": {
-                        "type": "string",
-                        "enum": ["png", "jpeg"],
-                        "description": "Image format (default: png).",
-                        "default": "png",
-                    },
-                },
-                "required": ["port"],
-            },
-        ),
-        Tool(
-            name="cdp_evaluate",
-            description=(
-                "Evaluate JavaScript expression in the page context via CDP. "
-                "Returns the result value and type."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port": {
-                        "type": "integer",
-                        "description": "CDP port.",
-                    },
-                    "expression": {
-                        "type": "string",
-                        "description": "JavaScript expression to evaluate.",
-                    },
-                },
-                "required": ["port", "expression"],
-            },
-        ),
-        Tool(
-            name="cdp_get_dom",
-            description=(
-                "Get the DOM tree of the page via CDP. Returns structured node tree "
-                "with tag names, attributes, and children."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port": {
-                        "type": "integer",
-                        "description": "CDP port.",
-                    },
-                    "depth": {
-                        "type": "integer",
-                        "description": "Tree depth (-1 = full tree, default).",
-                        "default": -1,
-                    },
-                },
-                "required": ["port"],
-            },
-        ),
-        Tool(
-            name="cdp_click_selector",
-            description=(
-                "Click an element by CSS selector via CDP. Executes "
-                "document.querySelector(selector).click() in the page."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port": {
-                        "type": "integer",
-                        "description": "CDP port.",
-                    },
-                    "css_selector": {
-                        "type": "string",
-                        "description": "CSS selector (e.g., '#submit-btn', '.nav-link').",
-                    },
-                },
-                "required": ["port", "css_selector"],
-            },
-        ),
-
-        Tool(
-            name="cdp_ensure",
-            description=(
-                "Ensure CDP is available for an Electron app. Checks existing "
-                "connections, scans ports, and if needed proposes a restart plan "
-                "for user confirmation. NEVER restarts automatically — returns "
-                "action_required='restart' so you can ask the user first."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "app_name": {
-                        "type": "string",
-                        "description": "App name (e.g., 'code', 'slack', 'notion', 'chrome').",
-                    },
-                    "preferred_port": {
-                        "type": "integer",
-                        "description": "Preferred CDP port. If omitted, uses known defaults.",
-                    },
-                },
-                "required": ["app_name"],
-            },
-        ),
-        Tool(
-            name="cdp_restart_confirmed",
-            description=(
-                "Execute CDP restart AFTER user confirmation. Closes the app, "
-                "relaunches with --remote-debugging-port, waits for CDP, and "
-                "auto-connects. Only call after the user explicitly agreed."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "app_name": {
-                        "type": "string",
-                        "description": "App name to restart.",
-                    },
-                    "port": {
-                        "type": "integer",
-                        "description": "CDP port to use. If omitted, uses default for app.",
-                    },
-                },
-                "required": ["app_name"],
-            },
-        ),
-        Tool(
-            name="cdp_get_knowledge_base",
-            description=(
-                "Get the CDP knowledge base: which apps needed restart, what ports "
-                "worked, and default port assignments for known Electron apps."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-
-        # ── Phase 2: Background Mode ──
-        Tool(
-            name="setup_background_mode",
-            description=(
-                "Configure background mode so Marlow works on a separate screen. "
-                "Auto-detects: 2+ monitors → dual_monitor, 1 monitor → offscreen."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "preferred_mode": {
-                        "type": "string",
-                        "enum": ["dual_monitor", "offscreen"],
-                        "description": "Force a specific mode. Auto-detects if omitted.",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="move_to_agent_screen",
-            description="Move a window to the agent workspace (second monitor or offscreen area).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to move to agent screen.",
-                    },
-                },
-                "required": ["window_title"],
-            },
-        ),
-        Tool(
-            name="move_to_user_screen",
-            description="Move a window back to the user's primary monitor.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to move back to user screen.",
-                    },
-                },
-                "required": ["window_title"],
-            },
-        ),
-        Tool(
-            name="get_agent_screen_state",
-            description="List all windows currently on the agent screen/workspace.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-
-        # ── Phase 2: Audio ──
-        Tool(
-            name="capture_system_audio",
-            description=(
-                "Record system audio (what you hear) via WASAPI loopback. "
-                "Captures audio from speakers/headphones. Max 300 seconds."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "duration_seconds": {
-                        "type": "integer",
-                        "description": "Recording duration in seconds (default: 10, max: 300).",
-                        "default": 10,
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="capture_mic_audio",
-            description="Record microphone audio. Max 300 seconds.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "duration_seconds": {
-                        "type": "integer",
-                        "description": "Recording duration in seconds (default: 10, max: 300).",
-                        "default": 10,
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="transcribe_audio",
-            description=(
-                "Transcribe an audio file using faster-whisper (CPU, int8). "
-                "Supports auto language detection. First call downloads the model (~150MB). "
-                "Use download_whisper_model first to avoid timeout on first transcription."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "audio_path": {
-                        "type": "string",
-                        "description": "Path to WAV audio file to transcribe.",
-                    },
-                    "language": {
-                        "type": "string",
-                        "description": "Language code (e.g., 'en', 'es') or 'auto'.",
-                        "default": "auto",
-                    },
-                    "model_size": {
-                        "type": "string",
-                        "enum": ["tiny", "base", "small", "medium"],
-                        "description": "Whisper model size (default: base).",
-                        "default": "base",
-                    },
-                },
-                "required": ["audio_path"],
-            },
-        ),
-        Tool(
-            name="download_whisper_model",
-            description=(
-                "Pre-download a Whisper model so transcribe_audio doesn't timeout. "
-                "Downloads the model to local cache (~75MB tiny, ~150MB base, ~500MB small). "
-                "Run this BEFORE first transcription to avoid delays."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "model_size": {
-                        "type": "string",
-                        "enum": ["tiny", "base", "small", "medium"],
-                        "description": "Model to download (default: base).",
-                        "default": "base",
-                    },
-                },
-            },
-        ),
-
-        # ── Phase 2: Voice ──
-        Tool(
-            name="listen_for_command",
-            description=(
-                "Listen for a voice command via microphone. "
-                "Starts recording immediately, transcribes, returns text. "
-                "Includes silence detection."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "duration_seconds": {
-                        "type": "integer",
-                        "description": "How long to listen (default: 10, max: 60).",
-                        "default": 10,
-                    },
-                    "language": {
-                        "type": "string",
-                        "description": "Language code or 'auto'.",
-                        "default": "auto",
-                    },
-                    "model_size": {
-                        "type": "string",
-                        "enum": ["tiny", "base", "small", "medium"],
-                        "default": "base",
-                    },
-                },
-            },
-        ),
-
-        # ── Phase 2: COM Automation ──
-        Tool(
-            name="run_app_script",
-            description=(
-                "Run a Python script that controls an Office/Adobe app via COM. "
-                "The script has access to 'app' (COM object). Store output in 'result'. "
-                "Supported: Word, Excel, PowerPoint, Outlook, Photoshop, Access. "
-                "⚠️ Sandboxed: no imports, no file access, no eval/exec. "
-                "Apps run invisible by default (visible=false)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "app_name": {
-                        "type": "string",
-                        "enum": ["word", "excel", "powerpoint", "outlook",
-                                 "photoshop", "access"],
-                        "description": "Application to control.",
-                    },
-                    "script": {
-                        "type": "string",
-                        "description": "Python script. Use 'app' for COM object, store output in 'result'.",
-                    },
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Max execution time in seconds (default: 30).",
-                        "default": 30,
-                    },
-                    "visible": {
-                        "type": "boolean",
-                        "description": "Show app window. Default false (invisible background mode).",
-                        "default": False,
-                    },
-                },
-                "required": ["app_name", "script"],
-            },
-        ),
-
-        # ── Phase 3: Visual Diff ──
-        Tool(
-            name="visual_diff",
-            description=(
-                "Capture a 'before' screenshot for later comparison. "
-                "Call this BEFORE performing an action, then call "
-                "visual_diff_compare with the returned diff_id."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to capture. If omitted, full screen.",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "What you're about to do (for reference).",
-                        "default": "",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="visual_diff_compare",
-            description=(
-                "Compare current state with a previous 'before' capture. "
-                "Returns change percentage and changed region."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "diff_id": {
-                        "type": "string",
-                        "description": "The diff_id returned by visual_diff.",
-                    },
-                },
-                "required": ["diff_id"],
-            },
-        ),
-
-        # ── Phase 3: Memory ──
-        Tool(
-            name="memory_save",
-            description=(
-                "Save a value persistently across sessions. "
-                "Categories: general, preferences, projects, tasks."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Unique key for this memory."},
-                    "value": {"type": "string", "description": "The text/data to store."},
-                    "category": {
-                        "type": "string",
-                        "enum": ["general", "preferences", "projects", "tasks"],
-                        "default": "general",
-                    },
-                },
-                "required": ["key", "value"],
-            },
-        ),
-        Tool(
-            name="memory_recall",
-            description=(
-                "Recall stored memories. Pass key+category for specific lookup, "
-                "category only for listing, key only to search all, "
-                "or nothing to list all categories."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Key to look up."},
-                    "category": {
-                        "type": "string",
-                        "enum": ["general", "preferences", "projects", "tasks"],
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="memory_delete",
-            description="Delete a specific memory by key and category.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Key to delete."},
-                    "category": {
-                        "type": "string",
-                        "enum": ["general", "preferences", "projects", "tasks"],
-                        "default": "general",
-                    },
-                },
-                "required": ["key"],
-            },
-        ),
-        Tool(
-            name="memory_list",
-            description="List all stored memories organized by category.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-
-        # ── Phase 3: Clipboard History ──
-        Tool(
-            name="clipboard_history",
-            description=(
-                "Manage clipboard history. Actions: "
-                "'start' to begin monitoring, 'stop' to end, "
-                "'list' to see entries, 'search' to find text, 'clear' to wipe."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "enum": ["start", "stop", "list", "search", "clear"],
-                        "default": "list",
-                    },
-                    "search": {
-                        "type": "string",
-                        "description": "Text to search for (with action='search').",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Max entries to return (default: 20).",
-                        "default": 20,
-                    },
-                },
-            },
-        ),
-
-        # ── Phase 3: Web Scraper ──
-        Tool(
-            name="scrape_url",
-            description=(
-                "Extract content from a URL. "
-                "Formats: 'text' (clean text), 'links' (all links), "
-                "'tables' (HTML tables), 'html' (raw HTML)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {"type": "string", "description": "URL to scrape."},
-                    "selector": {
-                        "type": "string",
-                        "description": "CSS selector to filter content.",
-                    },
-                    "format": {
-                        "type": "string",
-                        "enum": ["text", "links", "tables", "html"],
-                        "default": "text",
-                    },
-                },
-                "required": ["url"],
-            },
-        ),
-
-        # ── Phase 3: Extensions ──
-        Tool(
-            name="extensions_list",
-            description="List all installed Marlow extensions with their permissions.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="extensions_install",
-            description="Install a Marlow extension from pip.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "package": {
-                        "type": "string",
-                        "description": "pip package name or GitHub URL.",
-                    },
-                },
-                "required": ["package"],
-            },
-        ),
-        Tool(
-            name="extensions_uninstall",
-            description="Uninstall a Marlow extension.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Extension name to uninstall.",
-                    },
-                },
-                "required": ["name"],
-            },
-        ),
-        Tool(
-            name="extensions_audit",
-            description="Audit an installed extension's security and permissions.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Extension name to audit.",
-                    },
-                },
-                "required": ["name"],
-            },
-        ),
-
-        # ── Phase 4: Folder Watcher ──
-        Tool(
-            name="watch_folder",
-            description=(
-                "Start monitoring a folder for file changes. "
-                "Returns a watch_id to track events. "
-                "Events: created, modified, deleted, moved."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Folder path to monitor.",
-                    },
-                    "events": {
-                        "type": "array",
-                        "items": {"type": "string", "enum": ["created", "modified", "deleted", "moved"]},
-                        "description": "Event types to watch (default: all).",
-                    },
-                    "recursive": {
-                        "type": "boolean",
-                        "description": "Watch subdirectories too (default: false).",
-                        "default": False,
-                    },
-                },
-                "required": ["path"],
-            },
-        ),
-        Tool(
-            name="unwatch_folder",
-            description="Stop monitoring a folder by watch_id.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "watch_id": {
-                        "type": "string",
-                        "description": "The watch_id returned by watch_folder.",
-                    },
-                },
-                "required": ["watch_id"],
-            },
-        ),
-        Tool(
-            name="get_watch_events",
-            description=(
-                "Get detected filesystem events. "
-                "Optionally filter by watch_id or timestamp."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "watch_id": {
-                        "type": "string",
-                        "description": "Filter to a specific watcher.",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Max events to return (default: 50).",
-                        "default": 50,
-                    },
-                    "since": {
-                        "type": "string",
-                        "description": "ISO timestamp — only events after this time.",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="list_watchers",
-            description="List all active folder watchers.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-
-        # ── Phase 4: Task Scheduler ──
-        Tool(
-            name="schedule_task",
-            description=(
-                "Schedule a recurring command. Runs in a background thread "
-                "at the specified interval. Use max_runs to limit executions. "
-                "Commands go through the same safety checks as run_command."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Unique name for this task.",
-                    },
-                    "command": {
-                        "type": "string",
-                        "description": "Shell command to execute.",
-                    },
-                    "interval_seconds": {
-                        "type": "integer",
-                        "description": "Run every N seconds (default: 300, min: 10).",
-                        "default": 300,
-                    },
-                    "shell": {
-                        "type": "string",
-                        "enum": ["powershell", "cmd"],
-                        "default": "powershell",
-                    },
-                    "max_runs": {
-                        "type": "integer",
-                        "description": "Stop after N runs (omit for unlimited).",
-                    },
-                },
-                "required": ["name", "command"],
-            },
-        ),
-        Tool(
-            name="list_scheduled_tasks",
-            description="List all scheduled tasks with their status and run counts.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="remove_task",
-            description="Remove a scheduled task by name.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_name": {
-                        "type": "string",
-                        "description": "Name of the task to remove.",
-                    },
-                },
-                "required": ["task_name"],
-            },
-        ),
-        Tool(
-            name="get_task_history",
-            description="Get execution history for scheduled tasks.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_name": {
-                        "type": "string",
-                        "description": "Filter to a specific task.",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Max entries to return (default: 20).",
-                        "default": 20,
-                    },
-                },
-            },
-        ),
-
-        # ── Safety ──
-        Tool(
-            name="restore_user_focus",
-            description=(
-                "Restore focus to the user's previously active window. "
-                "Marlow automatically preserves focus, but call this if "
-                "the user's window lost focus and needs manual correction."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="kill_switch",
-            description=(
-                "🛑 Emergency stop: immediately halt ALL Marlow automation. "
-                "Use 'activate' to stop everything, 'reset' to resume, "
-                "'status' to check current state."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "enum": ["activate", "reset", "status"],
-                        "description": "activate=stop all, reset=resume, status=check state.",
-                    },
-                },
-                "required": ["action"],
-            },
-        ),
-
-        # ── Phase 5: Voice Control + TTS ──
-        Tool(
-            name="speak",
-            description=(
-                "Speak text aloud using Windows SAPI5 text-to-speech. "
-                "Auto-detects Spanish/English. Uses system speakers."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "Text to speak aloud.",
-                    },
-                    "language": {
-                        "type": "string",
-                        "enum": ["auto", "es", "en"],
-                        "description": "Language: 'auto' (detect), 'es', or 'en'.",
-                        "default": "auto",
-                    },
-                    "voice": {
-                        "type": "string",
-                        "description": "Specific voice name (e.g., 'David', 'Sabina').",
-                    },
-                    "rate": {
-                        "type": "integer",
-                        "description": "Speech rate in words/min (default: 175).",
-                        "default": 175,
-                    },
-                },
-                "required": ["text"],
-            },
-        ),
-        Tool(
-            name="speak_and_listen",
-            description=(
-                "Speak text aloud, then listen for a voice response. "
-                "Combines TTS + mic recording + transcription. "
-                "Ideal for conversational flows."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "Text to speak first.",
-                    },
-                    "timeout": {
-                        "type": "integer",
-                        "description": "How long to listen after speaking (default: 10, max: 60).",
-                        "default": 10,
-                    },
-                    "language": {
-                        "type": "string",
-                        "enum": ["auto", "es", "en"],
-                        "description": "Language for TTS and transcription.",
-                        "default": "auto",
-                    },
-                    "voice": {
-                        "type": "string",
-                        "description": "Specific voice name for TTS.",
-                    },
-                },
-                "required": ["text"],
-            },
-        ),
-        Tool(
-            name="get_voice_hotkey_status",
-            description=(
-                "Check the status of the voice hotkey (Ctrl+Shift+M). "
-                "Shows if active, currently recording, last transcribed text, and errors."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-
-        # ── Adaptive Behavior ──
-        Tool(
-            name="get_suggestions",
-            description=(
-                "Analyze recent tool actions and detect repeating patterns. "
-                "Returns suggestions for sequences you perform frequently. "
-                "Dismissed patterns are filtered out."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="accept_suggestion",
-            description="Mark a pattern suggestion as accepted (acknowledged as useful).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pattern_id": {
-                        "type": "string",
-                        "description": "The pattern ID to accept.",
-                    },
-                },
-                "required": ["pattern_id"],
-            },
-        ),
-        Tool(
-            name="dismiss_suggestion",
-            description="Dismiss a pattern suggestion so it won't appear again.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pattern_id": {
-                        "type": "string",
-                        "description": "The pattern ID to dismiss.",
-                    },
-                },
-                "required": ["pattern_id"],
-            },
-        ),
-
-        # ── Workflows ──
-        Tool(
-            name="workflow_record",
-            description=(
-                "Start recording a new workflow. All subsequent tool calls "
-                "(except meta-tools) will be captured as steps. "
-                "Call workflow_stop when done."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Unique name for this workflow.",
-                    },
-                },
-                "required": ["name"],
-            },
-        ),
-        Tool(
-            name="workflow_stop",
-            description="Stop recording and save the current workflow.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="workflow_run",
-            description=(
-                "Replay a saved workflow. Executes each recorded step "
-                "with safety checks (kill switch + approval) before each. "
-                "Stops on first failure."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the workflow to run.",
-                    },
-                },
-                "required": ["name"],
-            },
-        ),
-        Tool(
-            name="workflow_list",
-            description="List all saved workflows with step counts and creation dates.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="workflow_delete",
-            description="Delete a saved workflow by name.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the workflow to delete.",
-                    },
-                },
-                "required": ["name"],
-            },
-        ),
+# ─────────────────────────────────────────────────────────────
 
-        # ── Self-Improve: Error Journal ──
-        Tool(
-            name="get_error_journal",
-            description=(
-                "Show the error journal — records which methods fail/work "
-                "on specific apps. Marlow uses this to skip methods that "
-                "are known to fail. Optionally filter by app/window."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window": {
-                        "type": "string",
-                        "description": "Filter by window/app name.",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="clear_error_journal",
-            description=(
-                "Clear error journal entries for a specific app, "
-                "or all entries if no window specified."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window": {
-                        "type": "string",
-                        "description": "Clear entries for this app only. Omit to clear all.",
-                    },
-                },
-            },
-        ),
+# Property schemas shared by several tools (same object, never mutated)
+_S_CDP_PORT = {"type": "integer", "description": "CDP port."}
+_S_WAIT_TIMEOUT = {
+    "type": "integer",
+    "description": "Max seconds to wait (default: 30, max: 120).",
+    "default": 30,
+}
+_S_WAIT_INTERVAL = {
+    "type": "number",
+    "description": "Seconds between checks (default: 1).",
+    "default": 1,
+}
+_S_SEARCH_WINDOW = {"type": "string", "description": "Window to search in."}
+_S_SEARCH_WINDOW_OR_ACTIVE = {
+    "type": "string",
+    "description": "Window to search in. If omitted, uses active window.",
+}
+_S_LIMIT_20 = {
+    "type": "integer",
+    "description": "Max entries to return (default: 20).",
+    "default": 20,
+}
+_S_RECORD_DURATION = {
+    "type": "integer",
+    "description": "Recording duration in seconds (default: 10, max: 300).",
+    "default": 10,
+}
+_S_NO_ARGS = {"type": "object", "properties": {}}
+_S_REGION_PROPS = {
+    "x": {"type": "integer"},
+    "y": {"type": "integer"},
+    "width": {"type": "integer"},
+    "height": {"type": "integer"},
+}
+_S_TEXT_TO_TYPE = {"type": "string", "description": "Text to type."}
+_S_SHELL = {"type": "string", "enum": ["powershell", "cmd"], "default": "powershell"}
+_MEMORY_CATEGORIES = ["general", "preferences", "projects", "tasks"]
+_S_MEMORY_CATEGORY = {"type": "string", "enum": _MEMORY_CATEGORIES, "default": "general"}
+_WHISPER_MODEL_SIZES = ["tiny", "base", "small", "medium"]
+
+# Built once at import — the tool set is static for the process lifetime,
+# so list_tools() returns this same list instead of rebuilding ~100 Tool
+# objects and their schemas on every discovery request.
+_TOOLS: list[Tool] = [
+    # ── UI Tree (Primary vision — 0 tokens) ──
+    Tool(
+        name="get_ui_tree",
+        description=(
+            "Read the Windows UI Automation Accessibility Tree for a window. "
+            "This is Marlow's primary 'vision' — understands what's on screen "
+            "without screenshots. Cost: 0 tokens. Speed: ~10-50ms. "
+            "ALWAYS try this before take_screenshot. "
+            "Depth is auto-tuned per app framework (Electron=5, WinUI=15, etc.)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {
+                    "type": "string",
+                    "description": "Window title to inspect. If omitted, uses the active window.",
+                },
+                "max_depth": {
+                    "description": (
+                        "Tree depth. 'auto' (default) picks optimal depth per app framework "
+                        "(WinUI/WPF=15, WinForms=12, Chromium=8, Electron=5). "
+                        "Pass integer to override."
+                    ),
+                    "default": "auto",
+                },
+                "include_invisible": {
+                    "type": "boolean",
+                    "description": "Include non-visible elements.",
+                    "default": False,
+                },
+            },
+        },
+    ),
+
+    # ── Screenshot (Last resort — ~1,500 tokens) ──
+    Tool(
+        name="take_screenshot",
+        description=(
+            "Take a screenshot of the screen or a specific window. "
+            "⚠️ Costs ~1,500 tokens. Use get_ui_tree first (0 tokens). "
+            "Use this only when UI tree is insufficient."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {
+                    "type": "string",
+                    "description": "Capture specific window only.",
+                },
+                "region": {
+                    "type": "object",
+                    "description": "Capture region: {x, y, width, height}.",
+                    "properties": _S_REGION_PROPS,
+                },
+                "quality": {
+                    "type": "integer",
+                    "description": "JPEG quality 1-100 (default: 85).",
+                    "default": 85,
+                },
+                "downscale": {
+                    "type": "number",
+                    "description": (
+                        "Resize factor 0.1-1.0 before encoding (default: 1.0). "
+                        "0.5 cuts payload and tokens ~4x; divide image coordinates "
+                        "by 'scale' to click."
+                    ),
+                    "default": 1.0,
+                },
+            },
+        },
+    ),
+
+    # ── Mouse ──
+    Tool(
+        name="click",
+        description=(
+            "Click a UI element by name (preferred) or at coordinates. "
+            "By name: finds element in Accessibility Tree and clicks silently "
+            "(works in background mode). By coordinates: real mouse click."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "element_name": {
+                    "type": "string",
+                    "description": "Name/text of element to click (e.g., 'Save', 'OK').",
+                },
+                "window_title": _S_SEARCH_WINDOW,
+                "x": {"type": "integer", "description": "X coordinate."},
+                "y": {"type": "integer", "description": "Y coordinate."},
+                "button": {
+                    "type": "string",
+                    "enum": ["left", "right", "middle"],
+                    "default": "left",
+                },
+                "double_click": {"type": "boolean", "default": False},
+            },
+        },
+    ),
+
+    # ── Keyboard ──
+    Tool(
+        name="type_text",
+        description=(
+            "Type text into an element by name (preferred) or at cursor position. "
+            "By name: finds text field and types silently (background compatible). "
+            "Direct: simulates keyboard at current cursor."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": _S_TEXT_TO_TYPE,
+                "element_name": {
+                    "type": "string",
+                    "description": "Name of text field (e.g., 'Search', 'Email').",
+                },
+                "window_title": {"type": "string"},
+                "clear_first": {"type": "boolean", "default": False},
+            },
+            "required": ["text"],
+        },
+    ),
+    Tool(
+        name="press_key",
+        description="Press a keyboard key. Examples: 'enter', 'tab', 'escape', 'f5', 'delete'.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Key to press.",
+                },
+                "times": {
+                    "type": "integer",
+                    "description": "Times to press (default: 1).",
+                    "default": 1,
+                },
+            },
+            "required": ["key"],
+        },
+    ),
+    Tool(
+        name="hotkey",
+        description=(
+            "Execute keyboard shortcut. Examples: "
+            "['ctrl','c'] for copy, ['ctrl','shift','s'] for save as, "
+            "['alt','f4'] to close."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Keys to press simultaneously.",
+                },
+            },
+            "required": ["keys"],
+        },
+    ),
+
+    # ── Windows ──
+    Tool(
+        name="list_windows",
+        description="List all open windows with titles, positions, and sizes.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "include_minimized": {"type": "boolean", "default": True},
+            },
+        },
+    ),
+    Tool(
+        name="focus_window",
+        description="Bring a window to the foreground.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {
+                    "type": "string",
+                    "description": "Title or partial title of window.",
+                },
+            },
+            "required": ["window_title"],
+        },
+    ),
+    Tool(
+        name="manage_window",
+        description=(
+            "Manage a window: minimize, maximize, restore, close, move, or resize."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {"type": "string"},
+                "action": {
+                    "type": "string",
+                    "enum": ["minimize", "maximize", "restore", "close",
+                             "move", "resize"],
+                },
+                "x": {"type": "integer", "description": "For move action."},
+                "y": {"type": "integer", "description": "For move action."},
+                "width": {"type": "integer", "description": "For resize action."},
+                "height": {"type": "integer", "description": "For resize action."},
+            },
+            "required": ["window_title", "action"],
+        },
+    ),
+
+    # ── System ──
+    Tool(
+        name="run_command",
+        description=(
+            "Execute a PowerShell or CMD command. "
+            "⚠️ Destructive commands (format, del /f, rm -rf, etc.) are BLOCKED."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "command": {"type": "string", "description": "Command to execute."},
+                "shell": _S_SHELL,
+                "timeout": {
+                    "type": "integer",
+                    "description": "Timeout in seconds (default: 30).",
+                    "default": 30,
+                },
+            },
+            "required": ["command"],
+        },
+    ),
+    Tool(
+        name="open_application",
+        description="Open an application by name (Start Menu) or file path.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "app_name": {
+                    "type": "string",
+                    "description": "App name (e.g., 'Notepad', 'Chrome').",
+                },
+                "app_path": {
+                    "type": "string",
+                    "description": "Full path to executable.",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="clipboard",
+        description="Read from or write to the system clipboard.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": ["read", "write"],
+                    "default": "read",
+                },
+                "text": {
+                    "type": "string",
+                    "description": "Text to write (for action='write').",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="system_info",
+        description="Get system info: OS, CPU, RAM, disk usage, top processes.",
+        inputSchema=_S_NO_ARGS,
+    ),
+
+    # ── Phase 2: OCR ──
+    Tool(
+        name="ocr_region",
+        description=(
+            "Extract text from a window or screen region using OCR. "
+            "Primary: Windows OCR (~50-200ms, built-in). Fallback: Tesseract (~200-500ms). "
+            "Cost: 0 tokens. Returns text + word bounding boxes for clicking."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {
+                    "type": "string",
+                    "description": "Window to OCR. If omitted, captures full screen.",
+                },
+                "region": {
+                    "type": "object",
+                    "description": "Specific region: {x, y, width, height}.",
+                    "properties": _S_REGION_PROPS,
+                },
+                "language": {
+                    "type": "string",
+                    "description": (
+                        "Language for OCR. Windows OCR: BCP-47 tag (e.g., 'en-US', 'es-MX'). "
+                        "Tesseract: ISO 639-3 (e.g., 'eng', 'spa'). Auto-detects if omitted."
+                    ),
+                },
+                "engine": {
+                    "type": "string",
+                    "enum": ["windows", "tesseract"],
+                    "description": "Force a specific OCR engine. Default: auto (Windows primary, Tesseract fallback).",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="list_ocr_languages",
+        description=(
+            "List available OCR languages for each engine (Windows OCR and Tesseract). "
+            "Use to check which languages are installed before running OCR."
+        ),
+        inputSchema=_S_NO_ARGS,
+    ),
+
+    # ── Phase 2: Smart Find (Escalation) ──
+    Tool(
+        name="smart_find",
+        description=(
+            "Find a UI element using escalating methods: "
+            "1) UI Automation with fuzzy search (0 tokens, ~10-50ms) → "
+            "2) OCR (0 tokens, ~50-200ms) → "
+            "3) Screenshot for LLM Vision (~1,500 tokens). "
+            "BEST tool for finding elements — automatically picks the cheapest method."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "target": {
+                    "type": "string",
+                    "description": "Text/name of element to find (e.g., 'File', 'Save').",
+                },
+                "window_title": _S_SEARCH_WINDOW,
+                "click_if_found": {
+                    "type": "boolean",
+                    "description": "Automatically click the element if found.",
+                    "default": False,
+                },
+            },
+            "required": ["target"],
+        },
+    ),
+    Tool(
+        name="find_elements",
+        description=(
+            "Multi-property fuzzy search for UI elements. "
+            "Searches name, automation_id, help_text, class_name with Levenshtein distance. "
+            "Returns top 5 candidates ranked by similarity score. "
+            "Use when you need to explore what elements exist or find approximate matches."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Text to search for (e.g., 'Save', 'btnSubmit', 'Edit').",
+                },
+                "window_title": _S_SEARCH_WINDOW_OR_ACTIVE,
+                "control_type": {
+                    "type": "string",
+                    "description": "Filter by control type (e.g., 'Button', 'Edit', 'MenuItem').",
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+
+    # ── Phase 2: Cascade Recovery ──
+    Tool(
+        name="cascade_find",
+        description=(
+            "Multi-step recovery pipeline for finding UI elements when smart_find fails. "
+            "Tries 5 progressively harder strategies within a timeout: "
+            "1) Wait & retry (app loading), 2) Check blocking dialogs, "
+            "3) Wide fuzzy search (low thresholds), 4) OCR text search, "
+            "5) Screenshot for LLM vision. Each step records in Error Journal."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "target": {
+                    "type": "string",
+                    "description": "Text/name of the element to find.",
+                },
+                "window_title": _S_SEARCH_WINDOW_OR_ACTIVE,
+                "timeout": {
+                    "type": "number",
+                    "description": "Maximum seconds for recovery (5-30, default 10).",
+                },
+            },
+            "required": ["target"],
+        },
+    ),
+
+    # ── Phase 3.1: Set-of-Mark Prompting ──
+    Tool(
+        name="get_annotated_screenshot",
+        description=(
+            "Take a screenshot with numbered labels [1], [2], [3]... drawn on each "
+            "interactive UI element. Returns the annotated image + element map. "
+            "Use this to visually identify elements, then som_click(index) to interact. "
+            "Cost: ~1,500 tokens (screenshot). Preferred over raw screenshot when you "
+            "need to identify clickable elements."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {
+                    "type": "string",
+                    "description": "Window to annotate. If omitted, uses active window.",
+                },
+                "interactive_only": {
+                    "type": "boolean",
+                    "description": (
+                        "If true (default), only label interactive elements "
+                        "(buttons, inputs, links, menu items, etc.)."
+                    ),
+                    "default": True,
+                },
+            },
+        },
+    ),
+    Tool(
+        name="som_click",
+        description=(
+            "Click a UI element by its Set-of-Mark index number from "
+            "get_annotated_screenshot. Example: after seeing [3] on 'Save' button, "
+            "call som_click(index=3) to click it."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "index": {
+                    "type": "integer",
+                    "description": "The [N] label number from the annotated screenshot.",
+                },
+                "window_title": {
+                    "type": "string",
+                    "description": (
+                        "If provided, re-annotates this window first to get fresh "
+                        "positions. Otherwise uses the last annotation."
+                    ),
+                },
+            },
+            "required": ["index"],
+        },
+    ),
+
+    # ── Phase 2: App Framework Detection ──
+    Tool(
+        name="detect_app_framework",
+        description=(
+            "Detect the UI framework of a window (Electron, CEF, Chromium, WPF, WinForms, "
+            "WinUI 3, UWP, Win32) by analyzing loaded DLLs. If no window specified, scans "
+            "all visible windows. Useful to choose the best automation strategy."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {
+                    "type": "string",
+                    "description": "Window to analyze. If omitted, scans all visible windows.",
+                },
+            },
+        },
+    ),
+
+    # ── Phase 2.1: CDP (Chrome DevTools Protocol) ──
+    Tool(
+        name="cdp_discover",
+        description=(
+            "Scan localhost ports for apps with CDP (Chrome DevTools Protocol) enabled. "
+            "Finds Electron apps, Chrome with --remote-debugging-port, etc. "
+            "Returns list of targets with port, title, URL, and WebSocket URL."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port_start": {
+                    "type": "integer",
+                    "description": "Start of port range to scan (default: 9222).",
+                    "default": 9222,
+                },
+                "port_end": {
+                    "type": "integer",
+                    "description": "End of port range to scan (default: 9250).",
+                    "default": 9250,
+                },
+            },
+        },
+    ),
+    Tool(
+        name="cdp_connect",
+        description=(
+            "Connect to a CDP endpoint on a given port. Establishes WebSocket "
+            "connection to the first debuggable page target."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port": {
+                    "type": "integer",
+                    "description": "Port number of the CDP endpoint.",
+                },
+            },
+            "required": ["port"],
+        },
+    ),
+    Tool(
+        name="cdp_disconnect",
+        description="Disconnect from a CDP endpoint.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port": {
+                    "type": "integer",
+                    "description": "Port number to disconnect from.",
+                },
+            },
+            "required": ["port"],
+        },
+    ),
+    Tool(
+        name="cdp_list_connections",
+        description="List all active CDP connections.",
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="cdp_send",
+        description=(
+            "Send a raw CDP command. For advanced use when specific CDP methods "
+            "are needed beyond the convenience tools."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port": _S_CDP_PORT,
+                "method": {
+                    "type": "string",
+                    "description": "CDP method (e.g., 'Network.enable', 'CSS.getComputedStyleForNode').",
+                },
+                "params": {
+                    "type": "object",
+                    "description": "Optional parameters for the CDP method.",
+                },
+            },
+            "required": ["port", "method"],
+        },
+    ),
+    Tool(
+        name="cdp_click",
+        description=(
+            "Click at page coordinates via CDP. 100% invisible — no focus steal, "
+            "no mouse movement. Coordinates are relative to page viewport."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port": _S_CDP_PORT,
+                "x": {
+                    "type": "integer",
+                    "description": "X coordinate in page viewport.",
+                },
+                "y": {
+                    "type": "integer",
+                    "description": "Y coordinate in page viewport.",
+                },
+            },
+            "required": ["port", "x", "y"],
+        },
+    ),
+    Tool(
+        name="cdp_type_text",
+        description=(
+            "Type text via CDP. 100% invisible — no focus steal, no keyboard events. "
+            "Focus the target input first with cdp_click or cdp_click_selector."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port": _S_CDP_PORT,
+                "text": _S_TEXT_TO_TYPE,
+            },
+            "required": ["port", "text"],
+        },
+    ),
+    Tool(
+        name="cdp_key_combo",
+        description=(
+            "Press a key combination via CDP (e.g., Ctrl+A, Enter, Escape). "
+            "100% invisible."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port": _S_CDP_PORT,
+                "key": {
+                    "type": "string",
+                    "description": "Key name (e.g., 'a', 'Enter', 'Tab', 'Escape').",
+                },
+                "modifiers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Modifier keys: 'ctrl', 'alt', 'shift', 'meta'.",
+                },
+            },
+            "required": ["port", "key"],
+        },
+    ),
+    Tool(
+        name="cdp_screenshot",
+        description=(
+            "Take screenshot via CDP. Works even if window is behind others or minimized. "
+            "Returns base64 image."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port": _S_CDP_PORT,
+                "format": {
+                    "type": "string",
+                    "enum": ["png", "jpeg"],
+                    "description": "Image format (default: png).",
+                    "default": "png",
+                },
+            },
+            "required": ["port"],
+        },
+    ),
+    Tool(
+        name="cdp_evaluate",
+        description=(
+            "Evaluate JavaScript expression in the page context via CDP. "
+            "Returns the result value and type."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port": _S_CDP_PORT,
+                "expression": {
+                    "type": "string",
+                    "description": "JavaScript expression to evaluate.",
+                },
+            },
+            "required": ["port", "expression"],
+        },
+    ),
+    Tool(
+        name="cdp_get_dom",
+        description=(
+            "Get the DOM tree of the page via CDP. Returns structured node tree "
+            "with tag names, attributes, and children."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port": _S_CDP_PORT,
+                "depth": {
+                    "type": "integer",
+                    "description": "Tree depth (-1 = full tree, default).",
+                    "default": -1,
+                },
+            },
+            "required": ["port"],
+        },
+    ),
+    Tool(
+        name="cdp_click_selector",
+        description=(
+            "Click an element by CSS selector via CDP. Executes "
+            "document.querySelector(selector).click() in the page."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port": _S_CDP_PORT,
+                "css_selector": {
+                    "type": "string",
+                    "description": "CSS selector (e.g., '#submit-btn', '.nav-link').",
+                },
+            },
+            "required": ["port", "css_selector"],
+        },
+    ),
+
+    Tool(
+        name="cdp_ensure",
+        description=(
+            "Ensure CDP is available for an Electron app. Checks existing "
+            "connections, scans ports, and if needed proposes a restart plan "
+            "for user confirmation. NEVER restarts automatically — returns "
+            "action_required='restart' so you can ask the user first."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "app_name": {
+                    "type": "string",
+                    "description": "App name (e.g., 'code', 'slack', 'notion', 'chrome').",
+                },
+                "preferred_port": {
+                    "type": "integer",
+                    "description": "Preferred CDP port. If omitted, uses known defaults.",
+                },
+            },
+            "required": ["app_name"],
+        },
+    ),
+    Tool(
+        name="cdp_restart_confirmed",
+        description=(
+            "Execute CDP restart AFTER user confirmation. Closes the app, "
+            "relaunches with --remote-debugging-port, waits for CDP, and "
+            "auto-connects. Only call after the user explicitly agreed."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "app_name": {
+                    "type": "string",
+                    "description": "App name to restart.",
+                },
+                "port": {
+                    "type": "integer",
+                    "description": "CDP port to use. If omitted, uses default for app.",
+                },
+            },
+            "required": ["app_name"],
+        },
+    ),
+    Tool(
+        name="cdp_get_knowledge_base",
+        description=(
+            "Get the CDP knowledge base: which apps needed restart, what ports "
+            "worked, and default port assignments for known Electron apps."
+        ),
+        inputSchema=_S_NO_ARGS,
+    ),
+
+    # ── Phase 2: Background Mode ──
+    Tool(
+        name="setup_background_mode",
+        description=(
+            "Configure background mode so Marlow works on a separate screen. "
+            "Auto-detects: 2+ monitors → dual_monitor, 1 monitor → offscreen."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "preferred_mode": {
+                    "type": "string",
+                    "enum": ["dual_monitor", "offscreen"],
+                    "description": "Force a specific mode. Auto-detects if omitted.",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="move_to_agent_screen",
+        description="Move a window to the agent workspace (second monitor or offscreen area).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {
+                    "type": "string",
+                    "description": "Window to move to agent screen.",
+                },
+            },
+            "required": ["window_title"],
+        },
+    ),
+    Tool(
+        name="move_to_user_screen",
+        description="Move a window back to the user's primary monitor.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {
+                    "type": "string",
+                    "description": "Window to move back to user screen.",
+                },
+            },
+            "required": ["window_title"],
+        },
+    ),
+    Tool(
+        name="get_agent_screen_state",
+        description="List all windows currently on the agent screen/workspace.",
+        inputSchema=_S_NO_ARGS,
+    ),
+
+    # ── Phase 2: Audio ──
+    Tool(
+        name="capture_system_audio",
+        description=(
+            "Record system audio (what you hear) via WASAPI loopback. "
+            "Captures audio from speakers/headphones. Max 300 seconds."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "duration_seconds": _S_RECORD_DURATION,
+            },
+        },
+    ),
+    Tool(
+        name="capture_mic_audio",
+        description="Record microphone audio. Max 300 seconds.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "duration_seconds": _S_RECORD_DURATION,
+            },
+        },
+    ),
+    Tool(
+        name="transcribe_audio",
+        description=(
+            "Transcribe an audio file using faster-whisper (CPU, int8). "
+            "Supports auto language detection. First call downloads the model (~150MB). "
+            "Use download_whisper_model first to avoid timeout on first transcription."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "audio_path": {
+                    "type": "string",
+                    "description": "Path to WAV audio file to transcribe.",
+                },
+                "language": {
+                    "type": "string",
+                    "description": "Language code (e.g., 'en', 'es') or 'auto'.",
+                    "default": "auto",
+                },
+                "model_size": {
+                    "type": "string",
+                    "enum": _WHISPER_MODEL_SIZES,
+                    "description": "Whisper model size (default: base).",
+                    "default": "base",
+                },
+            },
+            "required": ["audio_path"],
+        },
+    ),
+    Tool(
+        name="download_whisper_model",
+        description=(
+            "Pre-download a Whisper model so transcribe_audio doesn't timeout. "
+            "Downloads the model to local cache (~75MB tiny, ~150MB base, ~500MB small). "
+            "Run this BEFORE first transcription to avoid delays."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "model_size": {
+                    "type": "string",
+                    "enum": _WHISPER_MODEL_SIZES,
+                    "description": "Model to download (default: base).",
+                    "default": "base",
+                },
+            },
+        },
+    ),
+
+    # ── Phase 2: Voice ──
+    Tool(
+        name="listen_for_command",
+        description=(
+            "Listen for a voice command via microphone. "
+            "Starts recording immediately, transcribes, returns text. "
+            "Includes silence detection."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "duration_seconds": {
+                    "type": "integer",
+                    "description": "How long to listen (default: 10, max: 60).",
+                    "default": 10,
+                },
+                "language": {
+                    "type": "string",
+                    "description": "Language code or 'auto'.",
+                    "default": "auto",
+                },
+                "model_size": {
+                    "type": "string",
+                    "enum": _WHISPER_MODEL_SIZES,
+                    "default": "base",
+                },
+            },
+        },
+    ),
+
+    # ── Phase 2: COM Automation ──
+    Tool(
+        name="run_app_script",
+        description=(
+            "Run a Python script that controls an Office/Adobe app via COM. "
+            "The script has access to 'app' (COM object). Store output in 'result'. "
+            "Supported: Word, Excel, PowerPoint, Outlook, Photoshop, Access. "
+            "⚠️ Sandboxed: no imports, no file access, no eval/exec. "
+            "Apps run invisible by default (visible=false)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "app_name": {
+                    "type": "string",
+                    "enum": ["word", "excel", "powerpoint", "outlook",
+                             "photoshop", "access"],
+                    "description": "Application to control.",
+                },
+                "script": {
+                    "type": "string",
+                    "description": "Python script. Use 'app' for COM object, store output in 'result'.",
+                },
+                "timeout": {
+                    "type": "integer",
+                    "description": "Max execution time in seconds (default: 30).",
+                    "default": 30,
+                },
+                "visible": {
+                    "type": "boolean",
+                    "description": "Show app window. Default false (invisible background mode).",
+                    "default": False,
+                },
+            },
+            "required": ["app_name", "script"],
+        },
+    ),
+
+    # ── Phase 3: Visual Diff ──
+    Tool(
+        name="visual_diff",
+        description=(
+            "Capture a 'before' screenshot for later comparison. "
+            "Call this BEFORE performing an action, then call "
+            "visual_diff_compare with the returned diff_id."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {
+                    "type": "string",
+                    "description": "Window to capture. If omitted, full screen.",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "What you're about to do (for reference).",
+                    "default": "",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="visual_diff_compare",
+        description=(
+            "Compare current state with a previous 'before' capture. "
+            "Returns change percentage and changed region."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "diff_id": {
+                    "type": "string",
+                    "description": "The diff_id returned by visual_diff.",
+                },
+            },
+            "required": ["diff_id"],
+        },
+    ),
+
+    # ── Phase 3: Memory ──
+    Tool(
+        name="memory_save",
+        description=(
+            "Save a value persistently across sessions. "
+            "Categories: general, preferences, projects, tasks."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {"type": "string", "description": "Unique key for this memory."},
+                "value": {"type": "string", "description": "The text/data to store."},
+                "category": _S_MEMORY_CATEGORY,
+            },
+            "required": ["key", "value"],
+        },
+    ),
+    Tool(
+        name="memory_recall",
+        description=(
+            "Recall stored memories. Pass key+category for specific lookup, "
+            "category only for listing, key only to search all, "
+            "or nothing to list all categories."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {"type": "string", "description": "Key to look up."},
+                "category": {
+                    "type": "string",
+                    "enum": _MEMORY_CATEGORIES,
+                },
+            },
+        },
+    ),
+    Tool(
+        name="memory_delete",
+        description="Delete a specific memory by key and category.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {"type": "string", "description": "Key to delete."},
+                "category": _S_MEMORY_CATEGORY,
+            },
+            "required": ["key"],
+        },
+    ),
+    Tool(
+        name="memory_list",
+        description="List all stored memories organized by category.",
+        inputSchema=_S_NO_ARGS,
+    ),
+
+    # ── Phase 3: Clipboard History ──
+    Tool(
+        name="clipboard_history",
+        description=(
+            "Manage clipboard history. Actions: "
+            "'start' to begin monitoring, 'stop' to end, "
+            "'list' to see entries, 'search' to find text, 'clear' to wipe."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": ["start", "stop", "list", "search", "clear"],
+                    "default": "list",
+                },
+                "search": {
+                    "type": "string",
+                    "description": "Text to search for (with action='search').",
+                },
+                "limit": _S_LIMIT_20,
+            },
+        },
+    ),
+
+    # ── Phase 3: Web Scraper ──
+    Tool(
+        name="scrape_url",
+        description=(
+            "Extract content from a URL. "
+            "Formats: 'text' (clean text), 'links' (all links), "
+            "'tables' (HTML tables), 'html' (raw HTML)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {"type": "string", "description": "URL to scrape."},
+                "selector": {
+                    "type": "string",
+                    "description": "CSS selector to filter content.",
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["text", "links", "tables", "html"],
+                    "default": "text",
+                },
+            },
+            "required": ["url"],
+        },
+    ),
+
+    # ── Phase 3: Extensions ──
+    Tool(
+        name="extensions_list",
+        description="List all installed Marlow extensions with their permissions.",
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="extensions_install",
+        description="Install a Marlow extension from pip.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "package": {
+                    "type": "string",
+                    "description": "pip package name or GitHub URL.",
+                },
+            },
+            "required": ["package"],
+        },
+    ),
+    Tool(
+        name="extensions_uninstall",
+        description="Uninstall a Marlow extension.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Extension name to uninstall.",
+                },
+            },
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="extensions_audit",
+        description="Audit an installed extension's security and permissions.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Extension name to audit.",
+                },
+            },
+            "required": ["name"],
+        },
+    ),
+
+    # ── Phase 4: Folder Watcher ──
+    Tool(
+        name="watch_folder",
+        description=(
+            "Start monitoring a folder for file changes. "
+            "Returns a watch_id to track events. "
+            "Events: created, modified, deleted, moved."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Folder path to monitor.",
+                },
+                "events": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": ["created", "modified", "deleted", "moved"]},
+                    "description": "Event types to watch (default: all).",
+                },
+                "recursive": {
+                    "type": "boolean",
+                    "description": "Watch subdirectories too (default: false).",
+                    "default": False,
+                },
+            },
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="unwatch_folder",
+        description="Stop monitoring a folder by watch_id.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "watch_id": {
+                    "type": "string",
+                    "description": "The watch_id returned by watch_folder.",
+                },
+            },
+            "required": ["watch_id"],
+        },
+    ),
+    Tool(
+        name="get_watch_events",
+        description=(
+            "Get detected filesystem events. "
+            "Optionally filter by watch_id or timestamp."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "watch_id": {
+                    "type": "string",
+                    "description": "Filter to a specific watcher.",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Max events to return (default: 50).",
+                    "default": 50,
+                },
+                "since": {
+                    "type": "string",
+                    "description": "ISO timestamp — only events after this time.",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="list_watchers",
+        description="List all active folder watchers.",
+        inputSchema=_S_NO_ARGS,
+    ),
+
+    # ── Phase 4: Task Scheduler ──
+    Tool(
+        name="schedule_task",
+        description=(
+            "Schedule a recurring command. Runs in a background thread "
+            "at the specified interval. Use max_runs to limit executions. "
+            "Commands go through the same safety checks as run_command."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Unique name for this task.",
+                },
+                "command": {
+                    "type": "string",
+                    "description": "Shell command to execute.",
+                },
+                "interval_seconds": {
+                    "type": "integer",
+                    "description": "Run every N seconds (default: 300, min: 10).",
+                    "default": 300,
+                },
+                "shell": _S_SHELL,
+                "max_runs": {
+                    "type": "integer",
+                    "description": "Stop after N runs (omit for unlimited).",
+                },
+            },
+            "required": ["name", "command"],
+        },
+    ),
+    Tool(
+        name="list_scheduled_tasks",
+        description="List all scheduled tasks with their status and run counts.",
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="remove_task",
+        description="Remove a scheduled task by name.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_name": {
+                    "type": "string",
+                    "description": "Name of the task to remove.",
+                },
+            },
+            "required": ["task_name"],
+        },
+    ),
+    Tool(
+        name="get_task_history",
+        description="Get execution history for scheduled tasks.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_name": {
+                    "type": "string",
+                    "description": "Filter to a specific task.",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Max entries to return (default: 20, 0 = all).",
+                    "default": 20,
+                },
+            },
+        },
+    ),
+
+    # ── Safety ──
+    Tool(
+        name="restore_user_focus",
+        description=(
+            "Restore focus to the user's previously active window. "
+            "Marlow automatically preserves focus, but call this if "
+            "the user's window lost focus and needs manual correction."
+        ),
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="kill_switch",
+        description=(
+            "🛑 Emergency stop: immediately halt ALL Marlow automation. "
+            "Use 'activate' to stop everything, 'reset' to resume, "
+            "'status' to check current state."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": ["activate", "reset", "status"],
+                    "description": "activate=stop all, reset=resume, status=check state.",
+                },
+            },
+            "required": ["action"],
+        },
+    ),
+    Tool(
+        name="batch_execute",
+        description=(
+            "Run several Marlow tools in one request (e.g. focus_window → "
+            "type_text → press_key → get_ui_tree). Each call still passes the "
+            "full safety checks. Calls run in order unless max_concurrent > 1."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run, in order.",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool": {
+                                "type": "string",
+                                "description": "Tool name (e.g. 'type_text').",
+                            },
+                            "args": {
+                                "type": "object",
+                                "description": "Arguments for that tool.",
+                            },
+                        },
+                        "required": ["tool"],
+                    },
+                },
+                "max_concurrent": {
+                    "type": "integer",
+                    "description": "How many calls may run at once. Default: 1 (sequential).",
+                    "default": 1,
+                },
+                "stop_on_error": {
+                    "type": "boolean",
+                    "description": "Skip the remaining calls after a failure. Default: true.",
+                    "default": True,
+                },
+            },
+            "required": ["calls"],
+        },
+    ),
+
+    # ── Phase 5: Voice Control + TTS ──
+    Tool(
+        name="speak",
+        description=(
+            "Speak text aloud using Windows SAPI5 text-to-speech. "
+            "Auto-detects Spanish/English. Uses system speakers."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Text to speak aloud.",
+                },
+                "language": {
+                    "type": "string",
+                    "enum": ["auto", "es", "en"],
+                    "description": "Language: 'auto' (detect), 'es', or 'en'.",
+                    "default": "auto",
+                },
+                "voice": {
+                    "type": "string",
+                    "description": "Specific voice name (e.g., 'David', 'Sabina').",
+                },
+                "rate": {
+                    "type": "integer",
+                    "description": "Speech rate in words/min (default: 175).",
+                    "default": 175,
+                },
+            },
+            "required": ["text"],
+        },
+    ),
+    Tool(
+        name="speak_and_listen",
+        description=(
+            "Speak text aloud, then listen for a voice response. "
+            "Combines TTS + mic recording + transcription. "
+            "Ideal for conversational flows."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Text to speak first.",
+                },
+                "timeout": {
+                    "type": "integer",
+                    "description": "How long to listen after speaking (default: 10, max: 60).",
+                    "default": 10,
+                },
+                "language": {
+                    "type": "string",
+                    "enum": ["auto", "es", "en"],
+                    "description": "Language for TTS and transcription.",
+                    "default": "auto",
+                },
+                "voice": {
+                    "type": "string",
+                    "description": "Specific voice name for TTS.",
+                },
+            },
+            "required": ["text"],
+        },
+    ),
+    Tool(
+        name="get_voice_hotkey_status",
+        description=(
+            "Check the status of the voice hotkey (Ctrl+Shift+M). "
+            "Shows if active, currently recording, last transcribed text, and errors."
+        ),
+        inputSchema=_S_NO_ARGS,
+    ),
+
+    # ── Adaptive Behavior ──
+    Tool(
+        name="get_suggestions",
+        description=(
+            "Analyze recent tool actions and detect repeating patterns. "
+            "Returns suggestions for sequences you perform frequently. "
+            "Dismissed patterns are filtered out."
+        ),
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="accept_suggestion",
+        description="Mark a pattern suggestion as accepted (acknowledged as useful).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pattern_id": {
+                    "type": "string",
+                    "description": "The pattern ID to accept.",
+                },
+            },
+            "required": ["pattern_id"],
+        },
+    ),
+    Tool(
+        name="dismiss_suggestion",
+        description="Dismiss a pattern suggestion so it won't appear again.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pattern_id": {
+                    "type": "string",
+                    "description": "The pattern ID to dismiss.",
+                },
+            },
+            "required": ["pattern_id"],
+        },
+    ),
+
+    # ── Workflows ──
+    Tool(
+        name="workflow_record",
+        description=(
+            "Start recording a new workflow. All subsequent tool calls "
+            "(except meta-tools) will be captured as steps. "
+            "Call workflow_stop when done."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Unique name for this workflow.",
+                },
+            },
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="workflow_stop",
+        description="Stop recording and save the current workflow.",
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="workflow_run",
+        description=(
+            "Replay a saved workflow. Executes each recorded step "
+            "with safety checks (kill switch + approval) before each. "
+            "Stops on first failure."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Name of the workflow to run.",
+                },
+            },
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="workflow_list",
+        description="List all saved workflows with step counts and creation dates.",
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="workflow_delete",
+        description="Delete a saved workflow by name.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Name of the workflow to delete.",
+                },
+            },
+            "required": ["name"],
+        },
+    ),
+
+    # ── Self-Improve: Error Journal ──
+    Tool(
+        name="get_error_journal",
+        description=(
+            "Show the error journal — records which methods fail/work "
+            "on specific apps. Marlow uses this to skip methods that "
+            "are known to fail. Optionally filter by app/window."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window": {
+                    "type": "string",
+                    "description": "Filter by window/app name.",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="clear_error_journal",
+        description=(
+            "Clear error journal entries for a specific app, "
+            "or all entries if no window specified."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window": {
+                    "type": "string",
+                    "description": "Clear entries for this app only. Omit to clear all.",
+                },
+            },
+        },
+    ),
+
+    # ── Smart Wait ──
+    Tool(
+        name="wait_for_element",
+        description=(
+            "Wait for a UI element to appear in the Accessibility Tree. "
+            "Polls every interval seconds until found or timeout. "
+            "Returns element info with position when found."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Name/text of element to wait for (e.g., 'Save', 'OK').",
+                },
+                "window_title": _S_SEARCH_WINDOW,
+                "timeout": _S_WAIT_TIMEOUT,
+                "interval": _S_WAIT_INTERVAL,
+            },
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="wait_for_text",
+        description=(
+            "Wait for specific text to appear on screen via OCR. "
+            "Polls every interval seconds, case insensitive. "
+            "Returns text position and surrounding context when found."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Text to wait for.",
+                },
+                "window_title": {
+                    "type": "string",
+                    "description": "Window to OCR. If omitted, full screen.",
+                },
+                "timeout": _S_WAIT_TIMEOUT,
+                "interval": {
+                    "type": "number",
+                    "description": "Seconds between checks (default: 2).",
+                    "default": 2,
+                },
+            },
+            "required": ["text"],
+        },
+    ),
+    Tool(
+        name="wait_for_window",
+        description=(
+            "Wait for a window with the given title to appear. "
+            "Useful after open_application to wait for the app to load. "
+            "Returns window info with position when found."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Window title (or partial) to wait for.",
+                },
+                "timeout": _S_WAIT_TIMEOUT,
+                "interval": _S_WAIT_INTERVAL,
+            },
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="wait_for_idle",
+        description=(
+            "Wait until the screen or window stops changing (idle state). "
+            "Compares screenshots every second. When no change for "
+            "stable_seconds, considers idle. Useful for waiting for loading."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {
+                    "type": "string",
+                    "description": "Window to monitor. If omitted, full screen.",
+                },
+                "timeout": _S_WAIT_TIMEOUT,
+                "stable_seconds": {
+                    "type": "number",
+                    "description": "Seconds of no change = idle (default: 2, max: 10).",
+                    "default": 2,
+                },
+            },
+        },
+    ),
+
+    # ── Agent Screen Only ──
+    Tool(
+        name="set_agent_screen_only",
+        description=(
+            "Enable or disable agent_screen_only mode. When enabled, "
+            "open_application and manage_window auto-redirect windows "
+            "to the agent monitor (second screen). Disabled = windows "
+            "stay where opened/moved."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "enabled": {
+                    "type": "boolean",
+                    "description": "True to auto-redirect to agent screen, False to disable.",
+                },
+            },
+            "required": ["enabled"],
+        },
+    ),
+
+    # ── Voice Overlay ──
+    Tool(
+        name="toggle_voice_overlay",
+        description=(
+            "Show or hide the floating voice overlay window. "
+            "The overlay displays voice control status (idle/listening/processing), "
+            "transcribed text, and a mini-log of recent interactions."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "visible": {
+                    "type": "boolean",
+                    "description": "True to show, False to hide.",
+                },
+            },
+            "required": ["visible"],
+        },
+    ),
+
+    # ── Help / Capabilities ──
+    Tool(
+        name="get_capabilities",
+        description=(
+            "List all Marlow MCP tools organized by category. "
+            "Returns tool names, descriptions (EN/ES), and parameters. "
+            "Optionally filter by category name."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "string",
+                    "description": (
+                        "Filter to a specific category. Options: Core, System, "
+                        "Background, Audio, Intelligence, Memory, Clipboard, "
+                        "Web, Extensions, Automation, Adaptive, Workflow, "
+                        "Self-Improve, Wait, UX, Security, Help."
+                    ),
+                },
+            },
+        },
+    ),
+    Tool(
+        name="get_version",
+        description=(
+            "Get Marlow version, total tool count, and current system state "
+            "(kill switch, confirmation mode, background mode, voice hotkey)."
+        ),
+        inputSchema=_S_NO_ARGS,
+    ),
+
+    # ── Monitor (UIA Events) ──
+    Tool(
+        name="start_ui_monitor",
+        description=(
+            "Start real-time UI event monitoring. Detects window opens/closes "
+            "and focus changes without polling, using Windows UI Automation COM events. "
+            "Events accumulate in a buffer — retrieve them with get_ui_events."
+        ),
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="stop_ui_monitor",
+        description=(
+            "Stop the real-time UI event monitor. "
+            "Events already captured are discarded."
+        ),
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="get_ui_events",
+        description=(
+            "Get recent UI events from the monitor. Returns window opens/closes "
+            "and focus changes with timestamps, process names, and element info. "
+            "Requires start_ui_monitor to be running."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "event_type": {
+                    "type": "string",
+                    "description": "Filter by event type: window_opened, window_closed, focus_changed",
+                    "enum": ["window_opened", "window_closed", "focus_changed"],
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Max events to return (default 20, max 500)",
+                },
+                "since": {
+                    "type": "string",
+                    "description": "ISO timestamp — only return events after this time",
+                },
+            },
+        },
+    ),
+
+    # ── Dialog Handler ──
+    Tool(
+        name="handle_dialog",
+        description=(
+            "Detect and handle active dialogs (error, save, update, confirmation). "
+            "Actions: 'report' (scan and return info), 'dismiss' (click Cancel/Close), "
+            "'auto' (handle automatically: dismiss OK-only/updates, report errors/saves). "
+            "If window_title given, scans that window; otherwise scans all windows."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "description": "How to handle: report (default), dismiss, or auto",
+                    "enum": ["report", "dismiss", "auto"],
+                },
+                "window_title": {
+                    "type": "string",
+                    "description": "Specific dialog window to handle (optional — scans all if omitted)",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="get_dialog_info",
+        description=(
+            "Get complete info about a dialog window: title, message text, "
+            "available buttons, inferred dialog type (error/save/update/confirmation), "
+            "and suggested action. Use this to understand what a dialog is asking."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {
+                    "type": "string",
+                    "description": "Title of the dialog window to inspect",
+                },
+            },
+            "required": ["window_title"],
+        },
+    ),
+
+    # ── Diagnostics ──
+    Tool(
+        name="run_diagnostics",
+        description=(
+            "Run system diagnostics: check Python, monitors, microphone, "
+            "Tesseract OCR, TTS engines, Whisper, system info, and safety config. "
+            "Returns structured results for troubleshooting."
+        ),
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="get_inspiration",
+        description=(
+            "Get ideas and tips for what Marlow can do. Returns random "
+            "examples like voice control, workflow recording, CDP automation, "
+            "background mode, and more. Great for new users."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "count": {
+                    "type": "integer",
+                    "description": "Number of tips to return (1-15, default 3)",
+                },
+            },
+        },
+    ),
+
+    # ── Learning from Demonstration (LfD) ──
+    Tool(
+        name="demo_start",
+        description=(
+            "Start recording a user demonstration. Marlow observes the user "
+            "working on the desktop and captures UIA events (window opens, "
+            "focus changes, clicks) to build a timeline. Call demo_stop when done."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Name for this demonstration (e.g. 'Save file in Notepad').",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Optional description of what the demo covers.",
+                },
+            },
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="demo_stop",
+        description=(
+            "Stop recording the current demonstration. Extracts a reproducible "
+            "plan from the captured event timeline and saves it to disk. "
+            "Returns the extracted steps for review."
+        ),
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="demo_status",
+        description=(
+            "Check the current demonstration recording status: "
+            "whether recording is active, event count, and duration."
+        ),
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="demo_list",
+        description="List all saved demonstrations with their event and step counts.",
+        inputSchema=_S_NO_ARGS,
+    ),
+    Tool(
+        name="demo_replay",
+        description=(
+            "Load a saved demonstration and return its extracted plan steps. "
+            "The steps can then be executed by Marlow to replay the user's actions."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "Filename of the saved demonstration JSON.",
+                },
+            },
+            "required": ["filename"],
+        },
+    ),
+]
 
-        # ── Smart Wait ──
-        Tool(
-            name="wait_for_element",
-            description=(
-                "Wait for a UI element to appear in the Accessibility Tree. "
-                "Polls every interval seconds until found or timeout. "
-                "Returns element info with position when found."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name/text of element to wait for (e.g., 'Save', 'OK').",
-                    },
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to search in.",
-                    },
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Max seconds to wait (default: 30, max: 120).",
-                        "default": 30,
-                    },
-                    "interval": {
-                        "type": "number",
-                        "description": "Seconds between checks (default: 1).",
-                        "default": 1,
-                    },
-                },
-                "required": ["name"],
-            },
-        ),
-        Tool(
-            name="wait_for_text",
-            description=(
-                "Wait for specific text to appear on screen via OCR. "
-                "Polls every interval seconds, case insensitive. "
-                "Returns text position and surrounding context when found."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "Text to wait for.",
-                    },
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to OCR. If omitted, full screen.",
-                    },
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Max seconds to wait (default: 30, max: 120).",
-                        "default": 30,
-                    },
-                    "interval": {
-                        "type": "number",
-                        "description": "Seconds between checks (default: 2).",
-                        "default": 2,
-                    },
-                },
-                "required": ["text"],
-            },
-        ),
-        Tool(
-            name="wait_for_window",
-            description=(
-                "Wait for a window with the given title to appear. "
-                "Useful after open_application to wait for the app to load. "
-                "Returns window info with position when found."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Window title (or partial) to wait for.",
-                    },
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Max seconds to wait (default: 30, max: 120).",
-                        "default": 30,
-                    },
-                    "interval": {
-                        "type": "number",
-                        "description": "Seconds between checks (default: 1).",
-                        "default": 1,
-                    },
-                },
-                "required": ["title"],
-            },
-        ),
-        Tool(
-            name="wait_for_idle",
-            description=(
-                "Wait until the screen or window stops changing (idle state). "
-                "Compares screenshots every second. When no change for "
-                "stable_seconds, considers idle. Useful for waiting for loading."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {
-                        "type": "string",
-                        "description": "Window to monitor. If omitted, full screen.",
-                    },
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Max seconds to wait (default: 30, max: 120).",
-                        "default": 30,
-                    },
-                    "stable_seconds": {
-                        "type": "number",
-                        "description": "Seconds of no change = idle (default: 2, max: 10).",
-                        "default": 2,
-                    },
-                },
-            },
-        ),
 
-        # ── Agent Screen Only ──
-        Tool(
-            name="set_agent_screen_only",
-            description=(
-                "Enable or disable agent_screen_only mode. When enabled, "
-                "open_application and manage_window auto-redirect windows "
-                "to the agent monitor (second screen). Disabled = windows "
-                "stay where opened/moved."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "enabled": {
-                        "type": "boolean",
-                        "description": "True to auto-redirect to agent screen, False to disable.",
-                    },
-                },
-                "required": ["enabled"],
-            },
-        ),
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """Register all Marlow tools with the MCP server."""
+    return _TOOLS
 
-        # ── Voice Overlay ──
-        Tool(
-            name="toggle_voice_overlay",
-            description=(
-                "Show or hide the floating voice overlay window. "
-                "The overlay displays voice control status (idle/listening/processing), "
-                "transcribed text, and a mini-log of recent interactions."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "visible": {
-                        "type": "boolean",
-                        "description": "True to show, False to hide.",
-                    },
-                },
-                "required": ["visible"],
-            },
-        ),
 
-        # ── Help / Capabilities ──
-        Tool(
-            name="get_capabilities",
-            description=(
-                "List all Marlow MCP tools organized by category. "
-                "Returns tool names, descriptions (EN/ES), and parameters. "
-                "Optionally filter by category name."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "description": (
-                            "Filter to a specific category. Options: Core, System, "
-                            "Background, Audio, Intelligence, Memory, Clipboard, "
-                            "Web, Extensions, Automation, Adaptive, Workflow, "
-                            "Self-Improve, Wait, UX, Security, Help."
-                        ),
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="get_version",
-            description=(
-                "Get Marlow version, total tool count, and current system state "
-                "(kill switch, confirmation mode, background mode, voice hotkey)."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
+# The SDK's tools/list handler re-wraps the list in a fresh ListToolsResult
+# (pydantic validation) and refills its tool cache on every request. The
+# result never changes, so compute it once through the SDK handler (which
+# also primes the cache used for input validation) and reuse it.
+_sdk_list_tools_handler = app.request_handlers[ListToolsRequest]
+_list_tools_result = None
 
-        # ── Monitor (UIA Events) ──
-        Tool(
-            name="start_ui_monitor",
-            description=(
-                "Start real-time UI event monitoring. Detects window opens/closes "
-                "and focus changes without polling, using Windows UI Automation COM events. "
-                "Events accumulate in a buffer — retrieve them with get_ui_events."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="stop_ui_monitor",
-            description=(
-                "Stop the real-time UI event monitor. "
-                "Events already captured are discarded."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="get_ui_events",
-            description=(
-                "Get recent UI events from the monitor. Returns window opens/closes "
-                "and focus changes with timestamps, process names, and element info. "
-                "Requires start_ui_monitor to be running."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "event_type": {
-                        "type": "string",
-                        "description": "Filter by event type: window_opened, window_closed, focus_changed",
-                        "enum": ["window_opened", "window_closed", "focus_changed"],
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Max events to return (default 20, max 500)",
-                    },
-                    "since": {
-                        "type": "string",
-                        "description": "ISO timestamp — only return events after this time",
-                    },
-                },
-            },
-        ),
 
-        # ── Dialog Handler ──
-        Tool(
-            name="handle_dialog",
-            description=(
-                "Detect and handle active dialogs (error, save, update, confirmation). "
-                "Actions: 'report' (scan and return info), 'dismiss' (click Cancel/Close), "
-                "'auto' (handle automatically: dismiss OK-only/updates, report errors/saves). "
-                "If window_title given, scans that window; otherwise scans all windows."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "description": "How to handle: report (default), dismiss, or auto",
-                        "enum": ["report", "dismiss", "auto"],
-                    },
-                    "window_title": {
-                        "type": "string",
-                        "description": "Specific dialog window to handle (optional — scans all if omitted)",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="get_dialog_info",
-            description=(
-                "Get complete info about a dialog window: title, message text, "
-                "available buttons, inferred dialog type (error/save/update/confirmation), "
-                "and suggested action. Use this to understand what a dialog is asking."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {
-                        "type": "string",
-                        "description": "Title of the dialog window to inspect",
-                    },
-                },
-                "required": ["window_title"],
-            },
-        ),
+async def _cached_list_tools_handler(req):
+    global _list_tools_result
+    if _list_tools_result is None:
+        _list_tools_result = await _sdk_list_tools_handler(req)
+    return _list_tools_result
 
-        # ── Diagnostics ──
-        Tool(
-            name="run_diagnostics",
-            description=(
-                "Run system diagnostics: check Python, monitors, microphone, "
-                "Tesseract OCR, TTS engines, Whisper, system info, and safety config. "
-                "Returns structured results for troubleshooting."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="get_inspiration",
-            description=(
-                "Get ideas and tips for what Marlow can do. Returns random "
-                "examples like voice control, workflow recording, CDP automation, "
-                "background mode, and more. Great for new users."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "count": {
-                        "type": "integer",
-                        "description": "Number of tips to return (1-15, default 3)",
-                    },
-                },
-            },
-        ),
 
-        # ── Learning from Demonstration (LfD) ──
-        Tool(
-            name="demo_start",
-            description=(
-                "Start recording a user demonstration. Marlow observes the user "
-                "working on the desktop and captures UIA events (window opens, "
-                "focus changes, clicks) to build a timeline. Call demo_stop when done."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name for this demonstration (e.g. 'Save file in Notepad').",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Optional description of what the demo covers.",
-                    },
-                },
-                "required": ["name"],
-            },
-        ),
-        Tool(
-            name="demo_stop",
-            description=(
-                "Stop recording the current demonstration. Extracts a reproducible "
-                "plan from the captured event timeline and saves it to disk. "
-                "Returns the extracted steps for review."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="demo_status",
-            description=(
-                "Check the current demonstration recording status: "
-                "whether recording is active, event count, and duration."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="demo_list",
-            description="List all saved demonstrations with their event and step counts.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="demo_replay",
-            description=(
-                "Load a saved demonstration and return its extracted plan steps. "
-                "The steps can then be executed by Marlow to replay the user's actions."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "Filename of the saved demonstration JSON.",
-                    },
-                },
-                "required": ["filename"],
-            },
-        ),
-    ]
+app.request_handlers[ListToolsRequest] = _cached_list_tools_handler
+
+
+# Argument validation. Recent SDKs run jsonschema.validate() on every
+# call, which re-checks the schema against the metaschema each time; the
+# tool set is static, so build one validator per tool here and turn the
+# SDK's per-call validation off. Only SDKs with validate_input validate at
+# all, so only then do we take it over; older SDKs keep their behaviour
+# (no validation) and so does a missing jsonschema.
+_SDK_VALIDATES_INPUT = "validate_input" in inspect.signature(app.call_tool).parameters
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+_VALIDATORS = {} if jsonschema is None or not _SDK_VALIDATES_INPUT else {
+    t.name: jsonschema.validators.validator_for(t.inputSchema)(t.inputSchema)
+    for t in _TOOLS
+}
+
+
+def _validate_arguments(name: str, arguments: dict) -> None:
+    """Raise ValueError (reported as an isError result) on invalid arguments."""
+    validator = _VALIDATORS.get(name)
+    if validator is None or validator.is_valid(arguments):
+        return
+    error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+    raise ValueError(f"Input validation error: {error.message}")
 
 
 # ─────────────────────────────────────────────────────────────
 # Tool Execution (with safety checks)
 # ─────────────────────────────────────────────────────────────
 
-@app.call_tool()
+# Tools whose successful results are fixed-shape status dicts with no
+# user-visible text (no window content, clipboard, command output, etc.).
+# Sanitization is skipped for these unless the result carries an error,
+# since exception messages can echo arbitrary input.
+_SKIP_SANITIZE = frozenset({
+    "press_key", "hotkey",
+    "memory_save", "memory_delete",
+    "unwatch_folder", "remove_task",
+    "start_ui_monitor", "stop_ui_monitor",
+    "set_agent_screen_only", "toggle_voice_overlay",
+    "download_whisper_model",
+    "list_ocr_languages", "workflow_record", "workflow_delete", "demo_status",
+    "accept_suggestion", "dismiss_suggestion", "clear_error_journal",
+    "cdp_disconnect",
+    "get_capabilities", "get_version", "get_inspiration",
+})
+
+# Tools that redact their own text while building the result (single
+# walk), so the post-hoc sanitize_ui_tree pass is redundant on success.
+_SANITIZED_AT_SOURCE = frozenset({"get_ui_tree"})
+
+# Post-execution recorders, bound once (both are module singletons and
+# never raise)
+_record_action = adaptive._detector.record_action
+_workflow_manager = workflows._manager
+
+# Tools that must not go through focus save/restore: focus_window changes
+# focus on purpose and restore_user_focus would overwrite the saved hwnd.
+_SKIP_FOCUS = frozenset({"focus_window", "restore_user_focus"})
+
+# Tools that may fall back to a screenshot the agent has to look at
+_VISION_FALLBACK = frozenset({"smart_find", "cascade_find"})
+
+@(app.call_tool(validate_input=False) if _SDK_VALIDATES_INPUT else app.call_tool())
 async def call_tool(name: str, arguments: dict) -> list[TextContent | ImageContent]:
     """
     Execute a tool with safety checks.
@@ -2087,11 +2235,23 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent | ImageConte
     6. Sanitize output
     7. Restore user focus
     """
+    # Names arrive freshly decoded from JSON; interning makes the set/dict
+    # lookups and == checks below hit CPython's identity fast path
+    name = sys.intern(name)
+    _validate_arguments(name, arguments)
+
+    # ── Kill switch tool (always allowed, no focus round-trip) ──
+    if name == "kill_switch":
+        return await _handle_kill_switch(arguments)
 
     # ── Save user's active window before any action ──
-    # Skip for focus_window (intentionally changes focus) and
-    # restore_user_focus (would overwrite the saved hwnd)
-    _skip_focus = name in ("focus_window", "restore_user_focus")
+    # Skip for the _SKIP_FOCUS tools (or a batch containing one)
+    _skip_focus = name in _SKIP_FOCUS
+    if name == "batch_execute":
+        _skip_focus = any(
+            isinstance(c, dict) and c.get("tool") in _SKIP_FOCUS
+            for c in arguments.get("calls") or ()
+        )
     if not _skip_focus:
         focus.save_user_focus()
 
@@ -2105,15 +2265,31 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent | ImageConte
 
 async def _call_tool_inner(name: str, arguments: dict) -> list[TextContent | ImageContent]:
     """Inner tool execution — focus save/restore is handled by call_tool."""
+    if name == "batch_execute":
+        return await _handle_batch_execute(arguments)
 
-    # ── Kill switch tool (always allowed) ──
-    if name == "kill_switch":
-        return await _handle_kill_switch(arguments)
+    result = await _execute_tool(name, arguments)
+    return _format_result(name, result)
+
+
+async def _execute_tool(name: str, arguments: dict) -> dict | str:
+    """
+    Safety check, dispatch and post-processing for a single tool call.
+
+    Returns the sanitized result dict, or the safety engine's refusal
+    message (str) if the call was not approved.
+    """
 
     # ── Safety check for all other tools ──
     approved, reason = await safety.approve_action(name, name, arguments)
     if not approved:
-        return [TextContent(type="text", text=reason)]
+        return reason
+
+    # ── Same call failing over and over: return its error, don't rerun ──
+    loop_key = loop_guard.call_key(name, arguments)
+    aborted = loop_guard.check(loop_key)
+    if aborted is not None:
+        return aborted
 
     # ── Execute the tool ──
     try:
@@ -2122,6 +2298,8 @@ async def _call_tool_inner(name: str, arguments: dict) -> list[TextContent | Ima
         logger.error(f"Tool execution error: {name}: {e}")
         result = {"error": str(e)}
 
+    ui_cache.tool_finished(name)
+
     # ── Agent screen only: auto-move after open_application ──
     if (
         name == "open_application"
@@ -2137,458 +2315,507 @@ async def _call_tool_inner(name: str, arguments: dict) -> list[TextContent | Ima
             pass  # Best effort — don't break open_application
 
     # ── Adaptive behavior: record action ──
-    try:
-        adaptive._detector.record_action(name, arguments)
-        if workflows._manager.is_recording:
-            success = isinstance(result, dict) and "error" not in result
-            workflows._manager.record_step(name, arguments, success)
-    except Exception:
-        pass  # Never break tool execution for adaptive tracking
+    _record_action(name, arguments)
+    if _workflow_manager.is_recording:
+        success = isinstance(result, dict) and "error" not in result
+        _workflow_manager.record_step(name, arguments, success)
 
     # ── Sanitize output (redact sensitive data) ──
-    if isinstance(result, dict):
+    if isinstance(result, dict) and (
+        (name not in _SKIP_SANITIZE and name not in _SANITIZED_AT_SOURCE)
+        or "error" in result
+    ):
         result = sanitizer.sanitize_ui_tree(result)
 
+    loop_guard.record(loop_key, result)
+    return result
+
+
+# Tool results are read by MCP clients, not people, so they are sent as
+# compact JSON (roughly half the bytes of indent=2). MARLOW_PRETTY_JSON=1
+# restores 2-space indentation for debugging.
+_PRETTY_JSON = os.environ.get("MARLOW_PRETTY_JSON") == "1"
+_JSON_KWARGS = (
+    {"indent": 2} if _PRETTY_JSON else {"separators": (",", ":")}
+)
+
+# orjson (optional) serializes tool results in C, several times faster
+# than the stdlib on large UI trees; json is used when it isn't installed
+# or can't encode a value (ints beyond 64 bits, ...).
+# _json_dumps_indented is for output that is always indented for humans
+# (kill switch status), regardless of MARLOW_PRETTY_JSON.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (
+        orjson.OPT_INDENT_2 if _PRETTY_JSON else 0
+    )
+
+    def _json_dumps(result) -> str:
+        try:
+            return orjson.dumps(result, option=_ORJSON_OPTIONS, default=str).decode("utf-8")
+        except orjson.JSONEncodeError:
+            return json.dumps(result, ensure_ascii=False, default=str, **_JSON_KWARGS)
+
+    def _json_dumps_indented(result) -> str:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2, default=str).decode("utf-8")
+        except orjson.JSONEncodeError:
+            return json.dumps(result, ensure_ascii=False, default=str, indent=2)
+else:
+    def _json_dumps(result) -> str:
+        return json.dumps(result, ensure_ascii=False, default=str, **_JSON_KWARGS)
+
+    def _json_dumps_indented(result) -> str:
+        return json.dumps(result, ensure_ascii=False, default=str, indent=2)
+
+
+def _text_content(text: str) -> TextContent:
+    """
+    TextContent for a str we built ourselves. model_construct skips
+    pydantic's field validation, which can't fail here; the SDK takes
+    model instances as-is when it wraps them in the CallToolResult.
+    """
+    return TextContent.model_construct(type="text", text=text)
+
+
+def _format_result(name: str, result: dict | str) -> list[TextContent | ImageContent]:
+    """Turn an executed tool's result into MCP content blocks."""
+    if isinstance(result, str):
+        return [_text_content(result)]
+
     # ── Handle screenshot results (return as image) ──
-    if name == "take_screenshot" and "image_base64" in result:
-        import base64
+    # Tools hand back raw image bytes; base64 happens once, here at the edge.
+    if name == "take_screenshot" and "image_bytes" in result:
         return [
             ImageContent(
                 type="image",
-                data=result["image_base64"],
+                data=base64.b64encode(result.pop("image_bytes")).decode("ascii"),
                 mimeType="image/jpeg",
             ),
-            TextContent(
-                type="text",
-                text=f"Screenshot: {result.get('width')}x{result.get('height')} "
-                     f"({result.get('size_kb')}KB) — Source: {result.get('source')}",
-            ),
+            _text_content(screenshot.describe(result)),
         ]
 
     # ── Handle SoM annotated screenshot (return annotated PNG + element map) ──
-    if name == "get_annotated_screenshot" and "image_base64" in result:
-        import json
-        image_data = result.pop("image_base64")
+    if name == "get_annotated_screenshot" and "image_bytes" in result:
+        image_data = base64.b64encode(result.pop("image_bytes")).decode("ascii")
         return [
             ImageContent(
                 type="image",
                 data=image_data,
                 mimeType="image/png",
             ),
-            TextContent(
-                type="text",
-                text=json.dumps(result, indent=2, ensure_ascii=False, default=str),
-            ),
+            _text_content(_json_dumps(result)),
         ]
 
     # ── Handle smart_find / cascade_find with screenshot fallback (return image + context) ──
-    if name in ("smart_find", "cascade_find") and result.get("requires_vision") and "image_base64" in result:
-        import json
-        image_data = result.pop("image_base64")
+    if name in _VISION_FALLBACK and result.get("requires_vision") and "image_bytes" in result:
+        image_data = base64.b64encode(result.pop("image_bytes")).decode("ascii")
         return [
             ImageContent(
                 type="image",
                 data=image_data,
                 mimeType="image/jpeg",
             ),
-            TextContent(
-                type="text",
-                text=json.dumps(result, indent=2, ensure_ascii=False, default=str),
-            ),
+            _text_content(_json_dumps(result)),
         ]
 
     # ── Return as text ──
-    import json
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2, ensure_ascii=False, default=str),
-    )]
+    return [_text_content(_json_dumps(result))]
+
+
+# Tool name → handler taking the arguments dict. Built once at import;
+# the lambdas resolve module globals when called, so lazily imported
+# tool modules still load on first use.
+_TOOL_HANDLERS: dict[str, Callable[[dict], Awaitable[dict]]] = {
+    # UI Tree
+    "get_ui_tree": lambda args: ui_tree.get_ui_tree(
+        window_title=args.get("window_title"),
+        max_depth=args.get("max_depth", "auto"),
+        include_invisible=args.get("include_invisible", False),
+        sanitize=sanitizer.sanitize,
+    ),
+    # Screenshot
+    "take_screenshot": lambda args: screenshot.take_screenshot(
+        window_title=args.get("window_title"),
+        region=args.get("region"),
+        quality=args.get("quality", 85),
+        downscale=args.get("downscale", 1.0),
+    ),
+    # Mouse
+    "click": lambda args: mouse.click(
+        element_name=args.get("element_name"),
+        window_title=args.get("window_title"),
+        x=args.get("x"),
+        y=args.get("y"),
+        button=args.get("button", "left"),
+        double_click=args.get("double_click", False),
+    ),
+    # Keyboard
+    "type_text": lambda args: keyboard.type_text(
+        text=args["text"],
+        element_name=args.get("element_name"),
+        window_title=args.get("window_title"),
+        clear_first=args.get("clear_first", False),
+    ),
+    "press_key": lambda args: keyboard.press_key(
+        key=args["key"],
+        times=args.get("times", 1),
+    ),
+    "hotkey": lambda args: keyboard.hotkey(*args["keys"]),
+    # Windows
+    "list_windows": lambda args: windows.list_windows(
+        include_minimized=args.get("include_minimized", True),
+    ),
+    "focus_window": lambda args: windows.focus_window(
+        window_title=args["window_title"],
+    ),
+    "manage_window": lambda args: _manage_window_with_redirect(args),
+    # System
+    "run_command": lambda args: system.run_command(
+        command=args["command"],
+        shell=args.get("shell", "powershell"),
+        timeout=args.get("timeout", 30),
+    ),
+    "open_application": lambda args: system.open_application(
+        app_name=args.get("app_name"),
+        app_path=args.get("app_path"),
+    ),
+    "clipboard": lambda args: system.clipboard(
+        action=args.get("action", "read"),
+        text=args.get("text"),
+    ),
+    "system_info": lambda args: system.system_info(),
+    # Phase 2: OCR
+    "ocr_region": lambda args: ocr.ocr_region(
+        window_title=args.get("window_title"),
+        region=args.get("region"),
+        language=args.get("language"),
+        engine=args.get("engine"),
+    ),
+    "list_ocr_languages": lambda args: ocr.list_ocr_languages(),
+    # Phase 2: Smart Find
+    "smart_find": lambda args: escalation.smart_find(
+        target=args["target"],
+        window_title=args.get("window_title"),
+        click_if_found=args.get("click_if_found", False),
+    ),
+    "find_elements": lambda args: escalation.find_elements(
+        query=args["query"],
+        window_title=args.get("window_title"),
+        control_type=args.get("control_type"),
+    ),
+    "cascade_find": lambda args: cascade_recovery.cascade_find(
+        target=args["target"],
+        window_title=args.get("window_title"),
+        timeout=args.get("timeout", 10),
+    ),
+    # SoM (Set-of-Mark)
+    "get_annotated_screenshot": lambda args: som.get_annotated_screenshot(
+        window_title=args.get("window_title"),
+        interactive_only=args.get("interactive_only", True),
+    ),
+    "som_click": lambda args: som.som_click(
+        index=args["index"],
+        window_title=args.get("window_title"),
+    ),
+    "detect_app_framework": lambda args: app_detector.detect_app_framework(
+        window_title=args.get("window_title"),
+    ),
+    # Phase 2.1: CDP
+    "cdp_discover": lambda args: cdp_manager.cdp_discover(
+        port_start=args.get("port_start", 9222),
+        port_end=args.get("port_end", 9250),
+    ),
+    "cdp_connect": lambda args: cdp_manager.cdp_connect(
+        port=args["port"],
+    ),
+    "cdp_disconnect": lambda args: cdp_manager.cdp_disconnect(
+        port=args["port"],
+    ),
+    "cdp_list_connections": lambda args: cdp_manager.cdp_list_connections(),
+    "cdp_send": lambda args: cdp_manager.cdp_send(
+        port=args["port"],
+        method=args["method"],
+        params=args.get("params"),
+    ),
+    "cdp_click": lambda args: cdp_manager.cdp_click(
+        port=args["port"],
+        x=args["x"],
+        y=args["y"],
+    ),
+    "cdp_type_text": lambda args: cdp_manager.cdp_type_text(
+        port=args["port"],
+        text=args["text"],
+    ),
+    "cdp_key_combo": lambda args: cdp_manager.cdp_key_combo(
+        port=args["port"],
+        key=args["key"],
+        modifiers=args.get("modifiers"),
+    ),
+    "cdp_screenshot": lambda args: cdp_manager.cdp_screenshot(
+        port=args["port"],
+        format=args.get("format", "png"),
+    ),
+    "cdp_evaluate": lambda args: cdp_manager.cdp_evaluate(
+        port=args["port"],
+        expression=args["expression"],
+    ),
+    "cdp_get_dom": lambda args: cdp_manager.cdp_get_dom(
+        port=args["port"],
+        depth=args.get("depth", -1),
+    ),
+    "cdp_click_selector": lambda args: cdp_manager.cdp_click_selector(
+        port=args["port"],
+        css_selector=args["css_selector"],
+    ),
+    "cdp_ensure": lambda args: cdp_manager.cdp_ensure(
+        app_name=args["app_name"],
+        preferred_port=args.get("preferred_port"),
+    ),
+    "cdp_restart_confirmed": lambda args: cdp_manager.cdp_restart_confirmed(
+        app_name=args["app_name"],
+        port=args.get("port"),
+    ),
+    "cdp_get_knowledge_base": lambda args: cdp_manager.cdp_get_knowledge_base(),
+    # Phase 2: Background Mode
+    "setup_background_mode": lambda args: background.setup_background_mode(
+        preferred_mode=args.get("preferred_mode"),
+    ),
+    "move_to_agent_screen": lambda args: background.move_to_agent_screen(
+        window_title=args["window_title"],
+    ),
+    "move_to_user_screen": lambda args: background.move_to_user_screen(
+        window_title=args["window_title"],
+    ),
+    "get_agent_screen_state": lambda args: background.get_agent_screen_state(),
+    # Phase 2: Audio
+    "capture_system_audio": lambda args: audio.capture_system_audio(
+        duration_seconds=args.get("duration_seconds", 10),
+    ),
+    "capture_mic_audio": lambda args: audio.capture_mic_audio(
+        duration_seconds=args.get("duration_seconds", 10),
+    ),
+    "transcribe_audio": lambda args: audio.transcribe_audio(
+        audio_path=args["audio_path"],
+        language=args.get("language", "auto"),
+        model_size=args.get("model_size", "base"),
+    ),
+    "download_whisper_model": lambda args: audio.download_whisper_model(
+        model_size=args.get("model_size", "base"),
+    ),
+    # Phase 2: Voice
+    "listen_for_command": lambda args: voice.listen_for_command(
+        duration_seconds=args.get("duration_seconds", 10),
+        language=args.get("language", "auto"),
+        model_size=args.get("model_size", "base"),
+    ),
+    # Phase 2: COM Automation
+    "run_app_script": lambda args: app_script.run_app_script(
+        app_name=args["app_name"],
+        script=args["script"],
+        timeout=args.get("timeout", 30),
+        visible=args.get("visible", False),
+    ),
+    # Safety
+    # Phase 3: Visual Diff
+    "visual_diff": lambda args: visual_diff.visual_diff(
+        window_title=args.get("window_title"),
+        description=args.get("description", ""),
+    ),
+    "visual_diff_compare": lambda args: visual_diff.visual_diff_compare(
+        diff_id=args["diff_id"],
+    ),
+    # Phase 3: Memory
+    "memory_save": lambda args: memory.memory_save(
+        key=args["key"],
+        value=args["value"],
+        category=args.get("category", "general"),
+    ),
+    "memory_recall": lambda args: memory.memory_recall(
+        key=args.get("key"),
+        category=args.get("category"),
+    ),
+    "memory_delete": lambda args: memory.memory_delete(
+        key=args["key"],
+        category=args.get("category", "general"),
+    ),
+    "memory_list": lambda args: memory.memory_list(),
+    # Phase 3: Clipboard History
+    "clipboard_history": lambda args: clipboard_ext.clipboard_history(
+        action=args.get("action", "list"),
+        search=args.get("search"),
+        limit=args.get("limit", 20),
+    ),
+    # Phase 3: Web Scraper
+    "scrape_url": lambda args: scraper.scrape_url(
+        url=args["url"],
+        selector=args.get("selector"),
+        format=args.get("format", "text"),
+    ),
+    # Phase 3: Extensions
+    "extensions_list": lambda args: ext_registry.extensions_list(),
+    "extensions_install": lambda args: ext_registry.extensions_install(
+        package=args["package"],
+    ),
+    "extensions_uninstall": lambda args: ext_registry.extensions_uninstall(
+        name=args["name"],
+    ),
+    "extensions_audit": lambda args: ext_registry.extensions_audit(
+        name=args["name"],
+    ),
+    # Phase 4: Folder Watcher
+    "watch_folder": lambda args: watcher.watch_folder(
+        path=args["path"],
+        events=args.get("events"),
+        recursive=args.get("recursive", False),
+    ),
+    "unwatch_folder": lambda args: watcher.unwatch_folder(
+        watch_id=args["watch_id"],
+    ),
+    "get_watch_events": lambda args: watcher.get_watch_events(
+        watch_id=args.get("watch_id"),
+        limit=args.get("limit", 50),
+        since=args.get("since"),
+    ),
+    "list_watchers": lambda args: watcher.list_watchers(),
+    # Phase 4: Task Scheduler
+    "schedule_task": lambda args: scheduler.schedule_task(
+        name=args["name"],
+        command=args["command"],
+        interval_seconds=args.get("interval_seconds", 300),
+        shell=args.get("shell", "powershell"),
+        max_runs=args.get("max_runs"),
+    ),
+    "list_scheduled_tasks": lambda args: scheduler.list_scheduled_tasks(),
+    "remove_task": lambda args: scheduler.remove_task(
+        task_name=args["task_name"],
+    ),
+    "get_task_history": lambda args: scheduler.get_task_history(
+        task_name=args.get("task_name"),
+        limit=args.get("limit", 20),
+    ),
+    # Adaptive Behavior
+    "get_suggestions": lambda args: adaptive.get_suggestions(),
+    "accept_suggestion": lambda args: adaptive.accept_suggestion(
+        pattern_id=args["pattern_id"],
+    ),
+    "dismiss_suggestion": lambda args: adaptive.dismiss_suggestion(
+        pattern_id=args["pattern_id"],
+    ),
+    # Workflows
+    "workflow_record": lambda args: workflows.workflow_record(
+        name=args["name"],
+    ),
+    "workflow_stop": lambda args: workflows.workflow_stop(),
+    "workflow_run": lambda args: workflows.workflow_run(
+        name=args["name"],
+        safety_engine=safety,
+        dispatch_fn=_dispatch_tool,
+    ),
+    "workflow_list": lambda args: workflows.workflow_list(),
+    "workflow_delete": lambda args: workflows.workflow_delete(
+        name=args["name"],
+    ),
+    # Self-Improve: Error Journal
+    "get_error_journal": lambda args: error_journal.get_error_journal(
+        window=args.get("window"),
+    ),
+    "clear_error_journal": lambda args: error_journal.clear_error_journal(
+        window=args.get("window"),
+    ),
+    # Smart Wait
+    "wait_for_element": lambda args: wait.wait_for_element(
+        name=args["name"],
+        window_title=args.get("window_title"),
+        timeout=args.get("timeout", 30),
+        interval=args.get("interval", 1),
+    ),
+    "wait_for_text": lambda args: wait.wait_for_text(
+        text=args["text"],
+        window_title=args.get("window_title"),
+        timeout=args.get("timeout", 30),
+        interval=args.get("interval", 2),
+    ),
+    "wait_for_window": lambda args: wait.wait_for_window(
+        title=args["title"],
+        timeout=args.get("timeout", 30),
+        interval=args.get("interval", 1),
+    ),
+    "wait_for_idle": lambda args: wait.wait_for_idle(
+        window_title=args.get("window_title"),
+        timeout=args.get("timeout", 30),
+        stable_seconds=args.get("stable_seconds", 2),
+    ),
+    # Safety
+    "restore_user_focus": lambda args: focus.restore_user_focus_tool(),
+    # Phase 5: Voice Control + TTS
+    "speak": lambda args: tts.speak(
+        text=args["text"],
+        language=args.get("language", "auto"),
+        voice=args.get("voice"),
+        rate=args.get("rate", 175),
+    ),
+    "speak_and_listen": lambda args: tts.speak_and_listen(
+        text=args["text"],
+        timeout=args.get("timeout", 10),
+        language=args.get("language", "auto"),
+        voice=args.get("voice"),
+    ),
+    "get_voice_hotkey_status": lambda args: voice_hotkey.get_voice_hotkey_status(),
+    # Agent Screen Only
+    "set_agent_screen_only": lambda args: background.set_agent_screen_only(
+        enabled=args["enabled"],
+    ),
+    # Voice Overlay
+    "toggle_voice_overlay": lambda args: voice_overlay.toggle_voice_overlay(
+        visible=args["visible"],
+    ),
+    # Monitor (UIA Events)
+    "start_ui_monitor": lambda args: uia_events.start_ui_monitor(),
+    "stop_ui_monitor": lambda args: uia_events.stop_ui_monitor(),
+    "get_ui_events": lambda args: uia_events.get_ui_events(
+        event_type=args.get("event_type"),
+        limit=args.get("limit", 20),
+        since=args.get("since"),
+    ),
+    # Dialog Handler
+    "handle_dialog": lambda args: dialog_handler.handle_dialog(
+        action=args.get("action", "report"),
+        window_title=args.get("window_title"),
+    ),
+    "get_dialog_info": lambda args: dialog_handler.get_dialog_info(
+        window_title=args["window_title"],
+    ),
+    # Help / Capabilities
+    "get_capabilities": lambda args: help_mod.get_capabilities(
+        category=args.get("category"),
+    ),
+    "get_version": lambda args: help_mod.get_version(
+        safety_status=safety.get_status(),
+        background_mode=background._manager.mode,
+        voice_hotkey_active=voice_hotkey._hotkey_active,
+    ),
+    # Diagnostics
+    "run_diagnostics": lambda args: setup_wizard.run_diagnostics(),
+    "get_inspiration": lambda args: help_mod.get_inspiration(
+        count=args.get("count", 3),
+    ),
+    # Learning from Demonstration (LfD)
+    "demo_start": lambda args: _demo_start(args),
+    "demo_stop": lambda args: _demo_stop(args),
+    "demo_status": lambda args: _demo_status(args),
+    "demo_list": lambda args: _demo_list(args),
+    "demo_replay": lambda args: _demo_replay(args),
+}
 
 
 async def _dispatch_tool(name: str, arguments: dict) -> dict:
     """Route tool call to the correct function."""
-
-    tool_map = {
-        # UI Tree
-        "get_ui_tree": lambda args: ui_tree.get_ui_tree(
-            window_title=args.get("window_title"),
-            max_depth=args.get("max_depth", "auto"),
-            include_invisible=args.get("include_invisible", False),
-        ),
-        # Screenshot
-        "take_screenshot": lambda args: screenshot.take_screenshot(
-            window_title=args.get("window_title"),
-            region=args.get("region"),
-            quality=args.get("quality", 85),
-        ),
-        # Mouse
-        "click": lambda args: mouse.click(
-            element_name=args.get("element_name"),
-            window_title=args.get("window_title"),
-            x=args.get("x"),
-            y=args.get("y"),
-            button=args.get("button", "left"),
-            double_click=args.get("double_click", False),
-        ),
-        # Keyboard
-        "type_text": lambda args: keyboard.type_text(
-            text=args["text"],
-            element_name=args.get("element_name"),
-            window_title=args.get("window_title"),
-            clear_first=args.get("clear_first", False),
-        ),
-        "press_key": lambda args: keyboard.press_key(
-            key=args["key"],
-            times=args.get("times", 1),
-        ),
-        "hotkey": lambda args: keyboard.hotkey(*args["keys"]),
-        # Windows
-        "list_windows": lambda args: windows.list_windows(
-            include_minimized=args.get("include_minimized", True),
-        ),
-        "focus_window": lambda args: windows.focus_window(
-            window_title=args["window_title"],
-        ),
-        "manage_window": lambda args: _manage_window_with_redirect(args),
-        # System
-        "run_command": lambda args: system.run_command(
-            command=args["command"],
-            shell=args.get("shell", "powershell"),
-            timeout=args.get("timeout", 30),
-        ),
-        "open_application": lambda args: system.open_application(
-            app_name=args.get("app_name"),
-            app_path=args.get("app_path"),
-        ),
-        "clipboard": lambda args: system.clipboard(
-            action=args.get("action", "read"),
-            text=args.get("text"),
-        ),
-        "system_info": lambda args: system.system_info(),
-        # Phase 2: OCR
-        "ocr_region": lambda args: ocr.ocr_region(
-            window_title=args.get("window_title"),
-            region=args.get("region"),
-            language=args.get("language"),
-            engine=args.get("engine"),
-        ),
-        "list_ocr_languages": lambda args: ocr.list_ocr_languages(),
-        # Phase 2: Smart Find
-        "smart_find": lambda args: escalation.smart_find(
-            target=args["target"],
-            window_title=args.get("window_title"),
-            click_if_found=args.get("click_if_found", False),
-        ),
-        "find_elements": lambda args: escalation.find_elements(
-            query=args["query"],
-            window_title=args.get("window_title"),
-            control_type=args.get("control_type"),
-        ),
-        "cascade_find": lambda args: cascade_recovery.cascade_find(
-            target=args["target"],
-            window_title=args.get("window_title"),
-            timeout=args.get("timeout", 10),
-        ),
-        # SoM (Set-of-Mark)
-        "get_annotated_screenshot": lambda args: som.get_annotated_screenshot(
-            window_title=args.get("window_title"),
-            interactive_only=args.get("interactive_only", True),
-        ),
-        "som_click": lambda args: som.som_click(
-            index=args["index"],
-            window_title=args.get("window_title"),
-        ),
-        "detect_app_framework": lambda args: app_detector.detect_app_framework(
-            window_title=args.get("window_title"),
-        ),
-        # Phase 2.1: CDP
-        "cdp_discover": lambda args: cdp_manager.cdp_discover(
-            port_start=args.get("port_start", 9222),
-            port_end=args.get("port_end", 9250),
-        ),
-        "cdp_connect": lambda args: cdp_manager.cdp_connect(
-            port=args["port"],
-        ),
-        "cdp_disconnect": lambda args: cdp_manager.cdp_disconnect(
-            port=args["port"],
-        ),
-        "cdp_list_connections": lambda args: cdp_manager.cdp_list_connections(),
-        "cdp_send": lambda args: cdp_manager.cdp_send(
-            port=args["port"],
-            method=args["method"],
-            params=args.get("params"),
-        ),
-        "cdp_click": lambda args: cdp_manager.cdp_click(
-            port=args["port"],
-            x=args["x"],
-            y=args["y"],
-        ),
-        "cdp_type_text": lambda args: cdp_manager.cdp_type_text(
-            port=args["port"],
-            text=args["text"],
-        ),
-        "cdp_key_combo": lambda args: cdp_manager.cdp_key_combo(
-            port=args["port"],
-            key=args["key"],
-            modifiers=args.get("modifiers"),
-        ),
-        "cdp_screenshot": lambda args: cdp_manager.cdp_screenshot(
-            port=args["port"],
-            format=args.get("format", "png"),
-        ),
-        "cdp_evaluate": lambda args: cdp_manager.cdp_evaluate(
-            port=args["port"],
-            expression=args["expression"],
-        ),
-        "cdp_get_dom": lambda args: cdp_manager.cdp_get_dom(
-            port=args["port"],
-            depth=args.get("depth", -1),
-        ),
-        "cdp_click_selector": lambda args: cdp_manager.cdp_click_selector(
-            port=args["port"],
-            css_selector=args["css_selector"],
-        ),
-        "cdp_ensure": lambda args: cdp_manager.cdp_ensure(
-            app_name=args["app_name"],
-            preferred_port=args.get("preferred_port"),
-        ),
-        "cdp_restart_confirmed": lambda args: cdp_manager.cdp_restart_confirmed(
-            app_name=args["app_name"],
-            port=args.get("port"),
-        ),
-        "cdp_get_knowledge_base": lambda args: cdp_manager.cdp_get_knowledge_base(),
-        # Phase 2: Background Mode
-        "setup_background_mode": lambda args: background.setup_background_mode(
-            preferred_mode=args.get("preferred_mode"),
-        ),
-        "move_to_agent_screen": lambda args: background.move_to_agent_screen(
-            window_title=args["window_title"],
-        ),
-        "move_to_user_screen": lambda args: background.move_to_user_screen(
-            window_title=args["window_title"],
-        ),
-        "get_agent_screen_state": lambda args: background.get_agent_screen_state(),
-        # Phase 2: Audio
-        "capture_system_audio": lambda args: audio.capture_system_audio(
-            duration_seconds=args.get("duration_seconds", 10),
-        ),
-        "capture_mic_audio": lambda args: audio.capture_mic_audio(
-            duration_seconds=args.get("duration_seconds", 10),
-        ),
-        "transcribe_audio": lambda args: audio.transcribe_audio(
-            audio_path=args["audio_path"],
-            language=args.get("language", "auto"),
-            model_size=args.get("model_size", "base"),
-        ),
-        "download_whisper_model": lambda args: audio.download_whisper_model(
-            model_size=args.get("model_size", "base"),
-        ),
-        # Phase 2: Voice
-        "listen_for_command": lambda args: voice.listen_for_command(
-            duration_seconds=args.get("duration_seconds", 10),
-            language=args.get("language", "auto"),
-            model_size=args.get("model_size", "base"),
-        ),
-        # Phase 2: COM Automation
-        "run_app_script": lambda args: app_script.run_app_script(
-            app_name=args["app_name"],
-            script=args["script"],
-            timeout=args.get("timeout", 30),
-            visible=args.get("visible", False),
-        ),
-        # Safety
-        # Phase 3: Visual Diff
-        "visual_diff": lambda args: visual_diff.visual_diff(
-            window_title=args.get("window_title"),
-            description=args.get("description", ""),
-        ),
-        "visual_diff_compare": lambda args: visual_diff.visual_diff_compare(
-            diff_id=args["diff_id"],
-        ),
-        # Phase 3: Memory
-        "memory_save": lambda args: memory.memory_save(
-            key=args["key"],
-            value=args["value"],
-            category=args.get("category", "general"),
-        ),
-        "memory_recall": lambda args: memory.memory_recall(
-            key=args.get("key"),
-            category=args.get("category"),
-        ),
-        "memory_delete": lambda args: memory.memory_delete(
-            key=args["key"],
-            category=args.get("category", "general"),
-        ),
-        "memory_list": lambda args: memory.memory_list(),
-        # Phase 3: Clipboard History
-        "clipboard_history": lambda args: clipboard_ext.clipboard_history(
-            action=args.get("action", "list"),
-            search=args.get("search"),
-            limit=args.get("limit", 20),
-        ),
-        # Phase 3: Web Scraper
-        "scrape_url": lambda args: scraper.scrape_url(
-            url=args["url"],
-            selector=args.get("selector"),
-            format=args.get("format", "text"),
-        ),
-        # Phase 3: Extensions
-        "extensions_list": lambda args: ext_registry.extensions_list(),
-        "extensions_install": lambda args: ext_registry.extensions_install(
-            package=args["package"],
-        ),
-        "extensions_uninstall": lambda args: ext_registry.extensions_uninstall(
-            name=args["name"],
-        ),
-        "extensions_audit": lambda args: ext_registry.extensions_audit(
-            name=args["name"],
-        ),
-        # Phase 4: Folder Watcher
-        "watch_folder": lambda args: watcher.watch_folder(
-            path=args["path"],
-            events=args.get("events"),
-            recursive=args.get("recursive", False),
-        ),
-        "unwatch_folder": lambda args: watcher.unwatch_folder(
-            watch_id=args["watch_id"],
-        ),
-        "get_watch_events": lambda args: watcher.get_watch_events(
-            watch_id=args.get("watch_id"),
-            limit=args.get("limit", 50),
-            since=args.get("since"),
-        ),
-        "list_watchers": lambda args: watcher.list_watchers(),
-        # Phase 4: Task Scheduler
-        "schedule_task": lambda args: scheduler.schedule_task(
-            name=args["name"],
-            command=args["command"],
-            interval_seconds=args.get("interval_seconds", 300),
-            shell=args.get("shell", "powershell"),
-            max_runs=args.get("max_runs"),
-        ),
-        "list_scheduled_tasks": lambda args: scheduler.list_scheduled_tasks(),
-        "remove_task": lambda args: scheduler.remove_task(
-            task_name=args["task_name"],
-        ),
-        "get_task_history": lambda args: scheduler.get_task_history(
-            task_name=args.get("task_name"),
-            limit=args.get("limit", 20),
-        ),
-        # Adaptive Behavior
-        "get_suggestions": lambda args: adaptive.get_suggestions(),
-        "accept_suggestion": lambda args: adaptive.accept_suggestion(
-            pattern_id=args["pattern_id"],
-        ),
-        "dismiss_suggestion": lambda args: adaptive.dismiss_suggestion(
-            pattern_id=args["pattern_id"],
-        ),
-        # Workflows
-        "workflow_record": lambda args: workflows.workflow_record(
-            name=args["name"],
-        ),
-        "workflow_stop": lambda args: workflows.workflow_stop(),
-        "workflow_run": lambda args: workflows.workflow_run(
-            name=args["name"],
-            safety_engine=safety,
-            dispatch_fn=_dispatch_tool,
-        ),
-        "workflow_list": lambda args: workflows.workflow_list(),
-        "workflow_delete": lambda args: workflows.workflow_delete(
-            name=args["name"],
-        ),
-        # Self-Improve: Error Journal
-        "get_error_journal": lambda args: error_journal.get_error_journal(
-            window=args.get("window"),
-        ),
-        "clear_error_journal": lambda args: error_journal.clear_error_journal(
-            window=args.get("window"),
-        ),
-        # Smart Wait
-        "wait_for_element": lambda args: wait.wait_for_element(
-            name=args["name"],
-            window_title=args.get("window_title"),
-            timeout=args.get("timeout", 30),
-            interval=args.get("interval", 1),
-        ),
-        "wait_for_text": lambda args: wait.wait_for_text(
-            text=args["text"],
-            window_title=args.get("window_title"),
-            timeout=args.get("timeout", 30),
-            interval=args.get("interval", 2),
-        ),
-        "wait_for_window": lambda args: wait.wait_for_window(
-            title=args["title"],
-            timeout=args.get("timeout", 30),
-            interval=args.get("interval", 1),
-        ),
-        "wait_for_idle": lambda args: wait.wait_for_idle(
-            window_title=args.get("window_title"),
-            timeout=args.get("timeout", 30),
-            stable_seconds=args.get("stable_seconds", 2),
-        ),
-        # Safety
-        "restore_user_focus": lambda args: focus.restore_user_focus_tool(),
-        # Phase 5: Voice Control + TTS
-        "speak": lambda args: tts.speak(
-            text=args["text"],
-            language=args.get("language", "auto"),
-            voice=args.get("voice"),
-            rate=args.get("rate", 175),
-        ),
-        "speak_and_listen": lambda args: tts.speak_and_listen(
-            text=args["text"],
-            timeout=args.get("timeout", 10),
-            language=args.get("language", "auto"),
-            voice=args.get("voice"),
-        ),
-        "get_voice_hotkey_status": lambda args: voice_hotkey.get_voice_hotkey_status(),
-        # Agent Screen Only
-        "set_agent_screen_only": lambda args: background.set_agent_screen_only(
-            enabled=args["enabled"],
-        ),
-        # Voice Overlay
-        "toggle_voice_overlay": lambda args: voice_overlay.toggle_voice_overlay(
-            visible=args["visible"],
-        ),
-        # Monitor (UIA Events)
-        "start_ui_monitor": lambda args: uia_events.start_ui_monitor(),
-        "stop_ui_monitor": lambda args: uia_events.stop_ui_monitor(),
-        "get_ui_events": lambda args: uia_events.get_ui_events(
-            event_type=args.get("event_type"),
-            limit=args.get("limit", 20),
-            since=args.get("since"),
-        ),
-        # Dialog Handler
-        "handle_dialog": lambda args: dialog_handler.handle_dialog(
-            action=args.get("action", "report"),
-            window_title=args.get("window_title"),
-        ),
-        "get_dialog_info": lambda args: dialog_handler.get_dialog_info(
-            window_title=args["window_title"],
-        ),
-        # Help / Capabilities
-        "get_capabilities": lambda args: help_mod.get_capabilities(
-            category=args.get("category"),
-        ),
-        "get_version": lambda args: help_mod.get_version(
-            safety_status=safety.get_status(),
-            background_mode=background._manager.mode,
-            voice_hotkey_active=voice_hotkey._hotkey_active,
-        ),
-        # Diagnostics
-        "run_diagnostics": lambda args: setup_wizard.run_diagnostics(),
-        "get_inspiration": lambda args: help_mod.get_inspiration(
-            count=args.get("count", 3),
-        ),
-        # Learning from Demonstration (LfD)
-        "demo_start": lambda args: _demo_start(args),
-        "demo_stop": lambda args: _demo_stop(args),
-        "demo_status": lambda args: _demo_status(args),
-        "demo_list": lambda args: _demo_list(args),
-        "demo_replay": lambda args: _demo_replay(args),
-    }
-
-    handler = tool_map.get(name)
+    handler = _TOOL_HANDLERS.get(name)
     if handler:
         return await handler(arguments)
     else:
@@ -2841,6 +3068,23 @@ async def _demo_replay(args: dict) -> dict:
     return {"success": False, "error": "Demo not found"}
 
 
+# Poll delays while waiting for an opened app's window: most windows show
+# up within the first few hundred ms, so start short and back off (~3s).
+_AUTO_MOVE_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8, 1.45)
+
+
+@functools.lru_cache(maxsize=64)
+def _title_pattern_for(app_name: str) -> str:
+    """
+    title_re matching the window of an opened app ("C:\\...\\notepad.exe"
+    → ".*notepad.*"), or "" if the name has no usable stem. Cached since
+    the same apps are opened over and over; pywinauto compiles the pattern
+    through re's own cache.
+    """
+    search = app_name.rsplit("\\", 1)[-1].split(".", 1)[0]
+    return f".*{re.escape(search)}.*" if search else ""
+
+
 async def _auto_move_to_agent(app_name: str) -> None:
     """
     After open_application, wait for window to appear and move to agent screen.
@@ -2848,20 +3092,21 @@ async def _auto_move_to_agent(app_name: str) -> None:
 
     / Después de abrir app, esperar ventana y mover al monitor del agente.
     """
-    import asyncio as _aio
-    import re
-
     # Wait for the window to appear (up to 3 seconds)
-    search = app_name.split("\\")[-1].split(".")[0]  # "notepad.exe" → "notepad"
-    if not search:
+    title_re = _title_pattern_for(app_name)
+    if not title_re:
+        return
+
+    try:
+        from pywinauto import Desktop
+        desktop = Desktop(backend="uia")
+    except Exception:
         return
 
-    for _ in range(6):
-        await _aio.sleep(0.5)
+    for delay in _AUTO_MOVE_DELAYS:
+        await asyncio.sleep(delay)
         try:
-            from pywinauto import Desktop
-            desktop = Desktop(backend="uia")
-            wins = desktop.windows(title_re=f".*{re.escape(search)}.*")
+            wins = desktop.windows(title_re=title_re)
             if wins:
                 title = wins[0].window_text()
                 await background.move_to_agent_screen(title)
@@ -2880,59 +3125,142 @@ async def _manage_window_with_redirect(args: dict) -> dict:
     / agent_screen_only esta activo.
     """
     action = args.get("action", "")
+    x = args.get("x")
+    y = args.get("y")
 
-    # Only intercept "move" actions
+    # Only intercept "move" actions. The redirect goes into locals: the
+    # caller records ``args`` afterwards and must see what was requested.
     if (
         action == "move"
         and config.automation.agent_screen_only
         and background.is_background_mode_active()
     ):
-        x = args.get("x")
-        y = args.get("y")
         if x is not None and y is not None and background.is_on_user_screen(x, y):
             # Redirect to agent monitor
             coords = background.get_agent_move_coords()
             if coords:
-                args = dict(args)
-                args["x"] = coords[0]
-                args["y"] = coords[1]
+                x, y = coords[0], coords[1]
 
     return await windows.manage_window(
         window_title=args["window_title"],
         action=args["action"],
-        x=args.get("x"),
-        y=args.get("y"),
+        x=x,
+        y=y,
         width=args.get("width"),
         height=args.get("height"),
     )
 
 
-async def _handle_kill_switch(arguments: dict) -> list[TextContent]:
-    """Handle kill switch commands."""
-    action = arguments.get("action", "status")
+async def _handle_batch_execute(arguments: dict) -> list[TextContent | ImageContent]:
+    """
+    Run a list of tool calls in one MCP round trip.
 
-    if action == "activate":
-        safety._trigger_kill()
-        return [TextContent(
-            type="text",
-            text="🛑 KILL SWITCH ACTIVATED — All Marlow automation has been stopped.\n"
-                 "Use kill_switch(action='reset') to resume.",
-        )]
-    elif action == "reset":
-        safety.reset_kill_switch()
-        return [TextContent(
-            type="text",
-            text="✅ Kill switch reset — Marlow automation can resume.",
-        )]
-    elif action == "status":
-        import json
-        status = safety.get_status()
+    Every sub-call is validated against its tool schema and goes through
+    _execute_tool (safety approval, adaptive recording, sanitization)
+    exactly as if it had been sent on its own.
+    Output is one header block per call followed by that call's content.
+
+    / Ejecuta varias herramientas en una sola peticion MCP.
+    """
+    calls = arguments.get("calls") or []
+    stop_on_error = arguments.get("stop_on_error", True)
+    max_concurrent = max(1, int(arguments.get("max_concurrent", 1) or 1))
+
+    if safety.is_killed:
         return [TextContent(
             type="text",
-            text=json.dumps(status, indent=2),
+            text="🛑 Kill switch is active — batch not executed.",
         )]
-    else:
+
+    outputs: list[list | None] = [None] * len(calls)
+    statuses = ["skipped"] * len(calls)
+    stopped = False
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def run_one(i: int, call) -> None:
+        nonlocal stopped
+        async with semaphore:
+            if stopped:
+                return
+            tool = call.get("tool") if isinstance(call, dict) else None
+            args = (call.get("args") or {}) if isinstance(call, dict) else {}
+            if isinstance(tool, str):
+                tool = sys.intern(tool)  # as call_tool does for top-level names
+            if not tool or tool in ("batch_execute", "kill_switch"):
+                result = {"error": f"Tool not allowed in a batch: {tool!r}"}
+            elif not isinstance(args, dict):
+                result = {"error": f"args must be an object, got {type(args).__name__}"}
+            else:
+                try:
+                    _validate_arguments(tool, args)
+                except ValueError as e:
+                    result = {"error": str(e)}
+                else:
+                    result = await _execute_tool(tool, args)
+            ok = isinstance(result, dict) and "error" not in result
+            statuses[i] = "ok" if ok else "error"
+            outputs[i] = _format_result(tool, result)
+            if not ok and stop_on_error:
+                stopped = True
+
+    await asyncio.gather(*(run_one(i, c) for i, c in enumerate(calls)))
+
+    content: list[TextContent | ImageContent] = [_text_content(_json_dumps({
+        "calls": len(calls),
+        "ok": statuses.count("ok"),
+        "errors": statuses.count("error"),
+        "skipped": statuses.count("skipped"),
+    }))]
+    for i, (call, status) in enumerate(zip(calls, statuses)):
+        tool = call.get("tool") if isinstance(call, dict) else None
+        content.append(_text_content(f"── [{i}] {tool}: {status} ──"))
+        if outputs[i]:
+            content.extend(outputs[i])
+    return content
+
+
+# Fixed kill switch responses — built once, returned as-is (only "status"
+# needs per-call content). The MCP SDK copies these into its result list.
+_KILL_ACTIVATED = [TextContent(
+    type="text",
+    text="🛑 KILL SWITCH ACTIVATED — All Marlow automation has been stopped.\n"
+         "Use kill_switch(action='reset') to resume.",
+)]
+_KILL_RESET = [TextContent(
+    type="text",
+    text="✅ Kill switch reset — Marlow automation can resume.",
+)]
+
+
+def _kill_activate() -> list[TextContent]:
+    safety._trigger_kill()
+    return _KILL_ACTIVATED
+
+
+def _kill_reset() -> list[TextContent]:
+    safety.reset_kill_switch()
+    return _KILL_RESET
+
+
+def _kill_status() -> list[TextContent]:
+    status = safety.get_status()
+    return [_text_content(_json_dumps_indented(status))]
+
+
+_KILL_ACTIONS: dict[str, Callable[[], list[TextContent]]] = {
+    "activate": _kill_activate,
+    "reset": _kill_reset,
+    "status": _kill_status,
+}
+
+
+async def _handle_kill_switch(arguments: dict) -> list[TextContent]:
+    """Handle kill switch commands."""
+    action = arguments.get("action", "status")
+    handler = _KILL_ACTIONS.get(action)
+    if handler is None:
         return [TextContent(type="text", text=f"Unknown action: {action}")]
+    return handler()
 
 
 # ─────────────────────────────────────────────────────────────
@@ -2941,13 +3269,138 @@ async def _handle_kill_switch(arguments: dict) -> list[TextContent]:
 
 async def _run_server():
     """Run the MCP server using stdio transport."""
+    await _auto_setup_background()
     async with stdio_server() as (read_stream, write_stream):
         init_options = app.create_initialization_options()
         await app.run(read_stream, write_stream, init_options)
 
 
-def main():
-    """Start the Marlow MCP server."""
+async def _serve_session(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, token: str,
+) -> None:
+    """
+    Run one MCP session over a socket connection.
+
+    Same newline-delimited JSON-RPC framing as stdio; the first line must
+    be the token from PERSISTENT_FILE, answered with an ``ok`` line. Every
+    session shares this process's ``app``, safety engine and
+    already-imported tool modules.
+
+    / Una sesion MCP sobre socket, compartiendo el mismo ``app``.
+    """
+    import hmac
+    import anyio
+    from mcp.shared.message import SessionMessage
+    from mcp.types import JSONRPCMessage
+
+    try:
+        first = await asyncio.wait_for(reader.readline(), timeout=5)
+    except (asyncio.TimeoutError, ConnectionError):
+        writer.close()
+        return
+    if not hmac.compare_digest(first.strip(), token.encode("ascii")):
+        logger.warning("Persistent server: rejected connection with bad token")
+        writer.close()
+        return
+    writer.write(b"ok\n")  # handshake ack — the bridge falls back without it
+    await writer.drain()
+
+    read_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_reader = anyio.create_memory_object_stream(0)
+
+    async def socket_reader():
+        async with read_writer:
+            while line := await reader.readline():
+                try:
+                    message = JSONRPCMessage.model_validate_json(line)
+                except Exception as exc:
+                    await read_writer.send(exc)
+                    continue
+                await read_writer.send(SessionMessage(message))
+
+    async def socket_writer():
+        async with write_reader:
+            async for session_message in write_reader:
+                data = session_message.message.model_dump_json(
+                    by_alias=True, exclude_none=True,
+                )
+                writer.write(data.encode("utf-8") + b"\n")
+                await writer.drain()
+
+    try:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(socket_reader)
+            tg.start_soon(socket_writer)
+            await app.run(
+                read_stream, write_stream, app.create_initialization_options(),
+            )
+            tg.cancel_scope.cancel()
+    except Exception as e:
+        logger.debug(f"Persistent session ended: {e}")
+    finally:
+        writer.close()
+
+
+async def _run_persistent(port: int) -> None:
+    """Accept MCP sessions on 127.0.0.1 until the process is stopped."""
+    import secrets
+    from marlow.bridge import PERSISTENT_FILE, PERSISTENT_HOST
+
+    await _auto_setup_background()
+    token = secrets.token_hex(16)
+    server = await asyncio.start_server(
+        lambda r, w: _serve_session(r, w, token), PERSISTENT_HOST, port,
+        limit=16 * 1024 * 1024,  # JSON-RPC lines can carry large arguments
+    )
+    bound_port = server.sockets[0].getsockname()[1]
+
+    PERSISTENT_FILE.write_text(json.dumps({
+        "port": bound_port,
+        "token": token,
+        "pid": os.getpid(),
+        "version": __version__,
+    }), encoding="utf-8")
+    try:
+        os.chmod(PERSISTENT_FILE, 0o600)
+    except OSError:
+        pass
+    logger.info(f"Persistent server listening on {PERSISTENT_HOST}:{bound_port}")
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        # A newer instance may have taken the file over — only remove ours
+        try:
+            info = json.loads(PERSISTENT_FILE.read_text(encoding="utf-8"))
+            if info.get("pid") == os.getpid():
+                PERSISTENT_FILE.unlink()
+        except (OSError, ValueError):
+            pass
+
+
+def _install_fast_event_loop() -> None:
+    """
+    Use winloop (Windows) / uvloop (elsewhere) for the asyncio loop if
+    installed — faster task scheduling and stream I/O. Optional; the
+    default loop is used when neither is available.
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as _fast_loop
+        else:
+            import uvloop as _fast_loop
+    except ImportError:
+        return
+    try:
+        _fast_loop.install()
+        logger.info(f"Event loop: {_fast_loop.__name__}")
+    except Exception as e:
+        logger.debug(f"Fast event loop unavailable: {e}")
+
+
+def _startup() -> None:
+    """One-time process setup shared by stdio and persistent modes."""
     ensure_dirs()
 
     # First-use setup wizard (runs once, then never again)
@@ -2972,27 +3425,52 @@ def main():
     except Exception as e:
         logger.warning(f"Voice hotkey failed to start: {e}")
 
-    # Auto-setup background mode if 2+ monitors detected
+
+async def _auto_setup_background() -> None:
+    """
+    Auto-setup background mode if 2+ monitors detected. Awaited first
+    thing on the server's own event loop instead of a throwaway one.
+    """
     try:
-        monitors = background._manager._enumerate_monitors()
-        if len(monitors) >= 2:
-            import asyncio as _aio
-            loop = _aio.new_event_loop()
-            try:
-                result = loop.run_until_complete(background.setup_background_mode())
-                if result.get("success"):
-                    logger.info(
-                        f"🖥️ Background mode auto-configured: {result.get('mode')} "
-                        f"({len(monitors)} monitors)"
-                    )
-            finally:
-                loop.close()
+        # Cheap count first; setup_background_mode() does the one enumeration
+        if background.monitor_count() >= 2:
+            result = await background.setup_background_mode()
+            if result.get("success"):
+                logger.info(
+                    f"🖥️ Background mode auto-configured: {result.get('mode')} "
+                    f"({result.get('monitors_detected')} monitors)"
+                )
     except Exception as e:
         logger.warning(f"Auto background mode failed: {e}")
 
+
+def main():
+    """Start the Marlow MCP server."""
+    _startup()
+
     # Run MCP server via stdio
+    _install_fast_event_loop()
     asyncio.run(_run_server())
 
 
+def serve_persistent():
+    """
+    Start a long-lived Marlow server that MCP clients attach to through
+    ``marlow.bridge`` instead of spawning a fresh process per session.
+
+    Port comes from MARLOW_PERSISTENT_PORT (default: any free port); the
+    chosen port and an access token are written to PERSISTENT_FILE.
+
+    / Servidor persistente: los clientes se conectan via marlow.bridge.
+    """
+    _startup()
+    port = int(os.environ.get("MARLOW_PERSISTENT_PORT", "0"))
+    _install_fast_event_loop()
+    try:
+        asyncio.run(_run_persistent(port))
+    except KeyboardInterrupt:
+        pass
+
+
 if __name__ == "__main__":
     main()
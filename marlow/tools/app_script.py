@@ -6,6 +6,9 @@ Scripts execute in a sandbox with restricted builtins — no imports,
 no file access, no eval/exec. Validated via AST analysis.
 
 Supported apps: Word, Excel, PowerPoint, Outlook, Photoshop, Access.
+Each app's COM object lives on its own worker thread and is reused
+across scripts; an instance Marlow launched is quit after
+_COM_IDLE_SECONDS without scripts and when Marlow exits.
 
 / Ejecuta scripts Python que controlan apps de Office y Adobe via COM.
 / Los scripts se ejecutan en un sandbox con builtins restringidos.
@@ -13,8 +16,12 @@ Supported apps: Word, Excel, PowerPoint, Outlook, Photoshop, Access.
 """
 
 import ast
+import queue
+import atexit
 import asyncio
 import logging
+import threading
+from concurrent.futures import Future
 from typing import Optional
 
 logger = logging.getLogger("marlow.tools.app_script")
@@ -29,6 +36,9 @@ SUPPORTED_APPS = {
     "access": "Access.Application",
 }
 
+# A launched app is released (and quit) after this long without scripts
+_COM_IDLE_SECONDS = 600
+
 # Forbidden AST node types — blocks imports, exec, eval at the syntax level
 _FORBIDDEN_NODE_TYPES = (
     ast.Import,
@@ -134,6 +144,146 @@ def _validate_script(script: str) -> Optional[str]:
     return None
 
 
+class _ComAppWorker(threading.Thread):
+    """
+    Daemon STA thread that keeps one application's COM object alive.
+
+    Scripts for the same app run one at a time on this thread, so COM is
+    initialized once and the app is connected (or launched) once instead
+    of on every call. An instance Marlow launched stays up between
+    scripts, so its open documents survive too, until the worker has been
+    idle for _COM_IDLE_SECONDS or Marlow exits — then it is quit.
+
+    / Thread STA que mantiene vivo el objeto COM de una aplicacion.
+    """
+
+    def __init__(self, prog_id: str):
+        super().__init__(name=f"marlow-com-{prog_id}", daemon=True)
+        self.prog_id = prog_id
+        self.retired = False  # set when a script hangs; see _retire_com_worker
+        self._inbox: queue.Queue = queue.Queue()
+        self._app = None
+        self._launched = False  # True if Dispatch started the instance
+
+    def submit(self, job) -> Future:
+        """Queue ``job(worker)`` to run on this thread."""
+        future: Future = Future()
+        self._inbox.put((job, future))
+        return future
+
+    def run(self) -> None:
+        import pythoncom
+        pythoncom.CoInitialize()
+        try:
+            while not self.retired:
+                try:
+                    # Only time out while holding an app to release
+                    job, future = self._inbox.get(
+                        timeout=_COM_IDLE_SECONDS if self._app is not None else None,
+                    )
+                except queue.Empty:
+                    self.release()
+                    continue
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(job(self))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            self._app = None
+            pythoncom.CoUninitialize()
+
+    def connect(self, visible: bool) -> tuple:
+        """
+        Return (app, connection_method), reusing the cached object while
+        it still answers (the user may have closed the app). ``visible``
+        applies to instances Marlow launched, new or reused; the user's
+        own instances keep their visibility.
+        """
+        import win32com.client
+
+        if self._app is not None:
+            try:
+                self._app.Name
+            except Exception:
+                self._app = None
+            else:
+                if not self._launched:
+                    return self._app, "GetActiveObject (existing instance)"
+                if bool(self._app.Visible) != visible:
+                    self._app.Visible = visible
+                return self._app, f"Dispatch (reused instance, visible={visible})"
+
+        try:
+            self._app = win32com.client.GetActiveObject(self.prog_id)
+            self._launched = False
+            return self._app, "GetActiveObject (existing instance)"
+        except Exception:
+            pass
+        app = win32com.client.Dispatch(self.prog_id)
+        app.Visible = visible
+        self._app, self._launched = app, True
+        return app, f"Dispatch (new instance, visible={visible})"
+
+    def release(self) -> None:
+        """
+        Drop the cached app, quitting it if Marlow launched it. Runs on
+        this thread. Unsaved changes in a launched instance are discarded.
+        """
+        app, launched = self._app, self._launched
+        self._app, self._launched = None, False
+        if app is None or not launched:
+            return
+        try:
+            app.DisplayAlerts = False  # no hidden "save changes?" prompt
+        except Exception:
+            pass
+        try:
+            app.Quit()
+        except Exception as e:
+            logger.debug(f"Quit {self.prog_id} failed: {e}")
+
+
+# ProgID → its worker thread
+_com_workers: dict[str, _ComAppWorker] = {}
+_com_lock = threading.Lock()
+
+
+def _get_com_worker(prog_id: str) -> _ComAppWorker:
+    """Start the worker thread for ``prog_id`` on first use."""
+    with _com_lock:
+        worker = _com_workers.get(prog_id)
+        if worker is None:
+            worker = _ComAppWorker(prog_id)
+            worker.start()
+            _com_workers[prog_id] = worker
+        return worker
+
+
+@atexit.register
+def _release_com_workers() -> None:
+    """Quit the app instances Marlow launched when the process exits."""
+    with _com_lock:
+        workers = list(_com_workers.values())
+    for worker in workers:
+        try:
+            worker.submit(_ComAppWorker.release).result(timeout=5)
+        except Exception:
+            pass  # busy or hung worker — leave it
+
+
+def _retire_com_worker(prog_id: str, worker: _ComAppWorker) -> None:
+    """
+    A script timed out. Leave its thread to finish (COM calls can't be
+    interrupted) and exit; later calls get a fresh worker.
+    """
+    with _com_lock:
+        if _com_workers.get(prog_id) is worker:
+            del _com_workers[prog_id]
+    worker.retired = True
+
+
 async def run_app_script(
     app_name: str,
     script: str,
@@ -161,7 +311,8 @@ async def run_app_script(
         timeout: Maximum execution time in seconds (default: 30).
         visible: Whether to show the app window (default: False).
                  When False, new instances run invisibly in the background.
-                 Existing instances keep their current visibility.
+                 Instances Marlow launched follow it on every call; the
+                 user's own instances keep their current visibility.
 
     Returns:
         Dictionary with script result or error.
@@ -184,31 +335,24 @@ async def run_app_script(
 
     prog_id = SUPPORTED_APPS[app_lower]
 
-    def _execute():
-        import pythoncom
-        pythoncom.CoInitialize()
+    try:
+        import pythoncom  # noqa: F401
+        import win32com.client  # noqa: F401
+    except ImportError:
+        return {
+            "error": "pywin32 not installed. Run: pip install pywin32",
+        }
 
+    def _execute(worker: _ComAppWorker):
         try:
-            import win32com.client
-
-            # Try to connect to running instance first
-            app = None
+            # Running instance first, else a new one (cached after that)
             try:
-                app = win32com.client.GetActiveObject(prog_id)
-                connection_method = "GetActiveObject (existing instance)"
-            except Exception:
-                pass
-
-            if app is None:
-                try:
-                    app = win32com.client.Dispatch(prog_id)
-                    app.Visible = visible
-                    connection_method = f"Dispatch (new instance, visible={visible})"
-                except Exception as e:
-                    return {
-                        "error": f"Failed to connect to {app_name}: {e}",
-                        "hint": f"Make sure {app_name.title()} is installed.",
-                    }
+                app, connection_method = worker.connect(visible)
+            except Exception as e:
+                return {
+                    "error": f"Failed to connect to {app_name}: {e}",
+                    "hint": f"Make sure {app_name.title()} is installed.",
+                }
 
             # Execute script in restricted sandbox
             # Only 'app' and 'result' are exposed; builtins limited to
@@ -257,23 +401,18 @@ async def run_app_script(
                 "result": result,
             }
 
-        except ImportError:
-            return {
-                "error": "pywin32 not installed. Run: pip install pywin32",
-            }
         except Exception as e:
             return {"error": str(e)}
-        finally:
-            pythoncom.CoUninitialize()
 
+    worker = _get_com_worker(prog_id)
     try:
-        loop = asyncio.get_running_loop()
         result = await asyncio.wait_for(
-            loop.run_in_executor(None, _execute),
+            asyncio.wrap_future(worker.submit(_execute)),
             timeout=timeout,
         )
         return result
     except asyncio.TimeoutError:
+        _retire_com_worker(prog_id, worker)
         return {
             "error": f"Script timed out after {timeout} seconds.",
             "hint": "Increase timeout or simplify the script.",
@@ -8,6 +8,9 @@ All blocking operations run in a thread executor to avoid
 blocking the MCP event loop.
 
 Audio files stored in ~/.marlow/audio/, auto-cleaned after 1 hour.
+In-process callers (listen_for_command, the voice hotkey) skip the file
+entirely: record_mic() returns samples in memory and transcribe_audio()
+accepts them directly.
 
 / Captura audio del sistema (WASAPI loopback), micrófono,
 / y transcribe usando faster-whisper (CPU, int8).
@@ -16,8 +19,11 @@ Audio files stored in ~/.marlow/audio/, auto-cleaned after 1 hour.
 import os
 import time
 import wave
+import queue
 import asyncio
 import logging
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Optional
 
@@ -30,9 +36,104 @@ AUDIO_DIR.mkdir(parents=True, exist_ok=True)
 # Maximum recording duration (seconds)
 MAX_DURATION = 300
 
-# Module-level whisper model cache
-_whisper_model = None
-_whisper_model_size = None
+# 16kHz mono is optimal for speech recognition (and what whisper expects)
+MIC_SAMPLE_RATE = 16000
+
+
+class _WhisperWorker(threading.Thread):
+    """
+    Daemon thread that owns the faster-whisper model.
+
+    Jobs (callables taking the model) are queued and run one at a time on
+    this thread, so the model is loaded once, never twice by concurrent
+    calls, and never used from two threads at once. The model stays
+    resident for the life of the process (all sessions of a persistent
+    server share it).
+
+    / Thread que mantiene el modelo whisper cargado y ejecuta los trabajos.
+    """
+
+    def __init__(self):
+        super().__init__(name="marlow-whisper", daemon=True)
+        self._inbox: queue.Queue = queue.Queue()
+        self.model = None
+        self.model_size: Optional[str] = None
+        self.device: Optional[str] = None
+
+    def submit(self, model_size: str, job) -> Future:
+        """Queue ``job(model)`` to run once ``model_size`` is loaded."""
+        future: Future = Future()
+        self._inbox.put((model_size, job, future))
+        return future
+
+    def run(self) -> None:
+        while True:
+            model_size, job, future = self._inbox.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if self.model is None or self.model_size != model_size:
+                    self._load(model_size)
+                future.set_result(job(self.model))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _load(self, model_size: str) -> None:
+        from faster_whisper import WhisperModel
+        from marlow.core.gpu_detect import get_gpu_info
+
+        config = get_gpu_info().recommended_whisper_config
+
+        if not _is_model_cached(model_size):
+            logger.info(
+                "Downloading whisper model '%s' (first time, ~150MB)...",
+                model_size,
+            )
+        else:
+            logger.info(
+                "Loading whisper model: %s (%s, %s)",
+                model_size, config["device"], config["compute_type"],
+            )
+
+        # Drop the previous model first so two never sit in memory together
+        self.model = None
+        self.model_size = None
+
+        # Half the cores for ctranslate2's intra-op threads leaves room for
+        # the UI automation work running alongside
+        cpu_threads = max(1, (os.cpu_count() or 2) // 2)
+        try:
+            self.model = WhisperModel(
+                model_size,
+                device=config["device"],
+                compute_type=config["compute_type"],
+                cpu_threads=cpu_threads,
+            )
+            self.device = config["device"]
+        except Exception:
+            logger.warning("GPU whisper failed, falling back to CPU")
+            self.model = WhisperModel(
+                model_size, device="cpu", compute_type="int8",
+                cpu_threads=cpu_threads,
+            )
+            self.device = "cpu"
+        self.model_size = model_size
+
+
+_whisper_worker: Optional[_WhisperWorker] = None
+_worker_lock = threading.Lock()
+
+
+def _get_whisper_worker() -> _WhisperWorker:
+    """Start the whisper worker thread on first use."""
+    global _whisper_worker
+    if _whisper_worker is None:
+        with _worker_lock:
+            if _whisper_worker is None:
+                worker = _WhisperWorker()
+                worker.start()
+                _whisper_worker = worker
+    return _whisper_worker
 
 
 def _cleanup_old_audio(max_age_seconds: int = 3600):
@@ -47,6 +148,26 @@ def _cleanup_old_audio(max_age_seconds: int = 3600):
         logger.debug(f"Audio cleanup error: {e}")
 
 
+def record_mic(duration_seconds: float, sample_rate: int = MIC_SAMPLE_RATE):
+    """
+    Record mono int16 audio from the default microphone into memory.
+    Blocking — run it in an executor. Raises ImportError without
+    sounddevice.
+
+    / Graba audio mono int16 del microfono en memoria (bloqueante).
+    """
+    import sounddevice as sd
+
+    recording = sd.rec(
+        int(duration_seconds * sample_rate),
+        samplerate=sample_rate,
+        channels=1,
+        dtype="int16",
+    )
+    sd.wait()  # Block until recording is done
+    return recording.reshape(-1)
+
+
 def _generate_filename(prefix: str) -> Path:
     """Generate a timestamped filename for audio."""
     ts = time.strftime("%Y%m%d_%H%M%S")
@@ -172,7 +293,7 @@ async def capture_mic_audio(duration_seconds: int = 10) -> dict:
     _cleanup_old_audio()
 
     try:
-        import sounddevice as sd
+        import sounddevice  # noqa: F401
         import soundfile as sf
     except ImportError:
         return {
@@ -180,17 +301,10 @@ async def capture_mic_audio(duration_seconds: int = 10) -> dict:
         }
 
     output_path = _generate_filename("mic")
-    sample_rate = 16000  # 16kHz is optimal for speech recognition
+    sample_rate = MIC_SAMPLE_RATE
 
     def _record():
-        recording = sd.rec(
-            int(duration_seconds * sample_rate),
-            samplerate=sample_rate,
-            channels=1,
-            dtype="int16",
-        )
-        sd.wait()  # Block until recording is done
-
+        recording = record_mic(duration_seconds, sample_rate)
         sf.write(str(output_path), recording, sample_rate)
 
         return {
@@ -244,77 +358,68 @@ async def download_whisper_model(model_size: str = "base") -> dict:
         return {"error": f"Invalid model_size. Choose from: {valid_sizes}"}
 
     try:
-        from faster_whisper import WhisperModel
+        from faster_whisper import WhisperModel  # noqa: F401
     except ImportError:
         return {"error": "faster-whisper not installed. Run: pip install faster-whisper"}
 
-    already_cached = _is_model_cached(model_size)
-    if already_cached:
+    worker = _get_whisper_worker()
+    if worker.model is not None and worker.model_size == model_size:
         return {
             "success": True,
             "model": model_size,
-            "status": "already_downloaded",
-            "hint": "Model is cached locally. transcribe_audio will start instantly.",
+            "device": worker.device,
+            "status": "already_loaded",
+            "hint": "Model is loaded in memory. transcribe_audio will start instantly.",
         }
 
+    already_cached = _is_model_cached(model_size)
     size_estimates = {"tiny": "~75MB", "base": "~150MB", "small": "~500MB", "medium": "~1.5GB"}
 
-    logger.info(
-        f"Downloading whisper model '{model_size}' ({size_estimates.get(model_size, '?')})..."
-    )
-
-    def _download():
-        from marlow.core.gpu_detect import get_gpu_info
-
-        gpu = get_gpu_info()
-        config = gpu.recommended_whisper_config
-
-        start = time.time()
-        try:
-            model = WhisperModel(
-                model_size, device=config["device"],
-                compute_type=config["compute_type"],
-            )
-            device_used = config["device"]
-        except Exception:
-            logger.warning("GPU whisper failed, falling back to CPU")
-            model = WhisperModel(model_size, device="cpu", compute_type="int8")
-            device_used = "cpu"
-        elapsed = round(time.time() - start, 1)
-
-        # Cache it for transcribe_audio
-        global _whisper_model, _whisper_model_size
-        _whisper_model = model
-        _whisper_model_size = model_size
-
-        return {
-            "success": True,
-            "model": model_size,
-            "device": device_used,
-            "status": "downloaded",
-            "download_time_seconds": elapsed,
-            "hint": "Model cached. transcribe_audio will now start instantly.",
-        }
+    if not already_cached:
+        logger.info(
+            f"Downloading whisper model '{model_size}' ({size_estimates.get(model_size, '?')})..."
+        )
 
+    # Loading through the worker downloads (if needed) and pre-warms the
+    # model that transcribe_audio will use
+    start = time.time()
     try:
-        loop = asyncio.get_running_loop()
         # 10-minute timeout for large model downloads
-        result = await asyncio.wait_for(
-            loop.run_in_executor(None, _download),
+        await asyncio.wait_for(
+            asyncio.wrap_future(worker.submit(model_size, lambda model: None)),
             timeout=600,
         )
-        return result
     except asyncio.TimeoutError:
         return {"error": f"Download timed out after 10 minutes for model '{model_size}'."}
     except Exception as e:
         logger.error(f"Model download error: {e}")
         return {"error": str(e)}
+    elapsed = round(time.time() - start, 1)
+
+    if already_cached:
+        return {
+            "success": True,
+            "model": model_size,
+            "device": worker.device,
+            "status": "already_downloaded",
+            "load_time_seconds": elapsed,
+            "hint": "Model is cached locally and now loaded. transcribe_audio will start instantly.",
+        }
+    return {
+        "success": True,
+        "model": model_size,
+        "device": worker.device,
+        "status": "downloaded",
+        "download_time_seconds": elapsed,
+        "hint": "Model cached. transcribe_audio will now start instantly.",
+    }
 
 
 async def transcribe_audio(
-    audio_path: str,
+    audio_path: Optional[str] = None,
     language: str = "auto",
     model_size: str = "base",
+    audio=None,
 ) -> dict:
     """
     Transcribe an audio file using faster-whisper (CPU, int8).
@@ -324,66 +429,50 @@ async def transcribe_audio(
         language: Language code (e.g., "en", "es") or "auto" for detection.
         model_size: Whisper model size: "tiny", "base", "small", "medium".
                    Default: "base" (good accuracy/speed balance on CPU).
+        audio: In-process alternative to audio_path — mono samples at
+               16kHz (numpy int16 as from record_mic(), or float32 in
+               [-1, 1]). Skips the WAV write and re-read; silence is
+               trimmed with VAD before decoding.
 
     Returns:
         Dictionary with transcribed text, language, and segments.
 
     / Transcribe un archivo de audio usando faster-whisper (CPU, int8).
     """
-    if not os.path.isfile(audio_path):
+    if audio is None and not (audio_path and os.path.isfile(audio_path)):
         return {"error": f"Audio file not found: {audio_path}"}
 
     try:
-        from faster_whisper import WhisperModel
+        from faster_whisper import WhisperModel  # noqa: F401
     except ImportError:
         return {
             "error": "faster-whisper not installed. Run: pip install faster-whisper",
         }
 
-    global _whisper_model, _whisper_model_size
-
-    first_load = _whisper_model is None or _whisper_model_size != model_size
-
-    def _transcribe():
-        global _whisper_model, _whisper_model_size
+    if audio is not None:
+        import numpy as np
 
-        # Cache model to avoid reloading
-        if _whisper_model is None or _whisper_model_size != model_size:
-            from marlow.core.gpu_detect import get_gpu_info
+        source = np.asarray(audio).reshape(-1)
+        if source.dtype == np.int16:
+            source = source.astype(np.float32) / 32768.0
+        else:
+            source = source.astype(np.float32, copy=False)
+    else:
+        source = audio_path
 
-            gpu = get_gpu_info()
-            config = gpu.recommended_whisper_config
-
-            if not _is_model_cached(model_size):
-                logger.info(
-                    "Downloading whisper model '%s' (first time, ~150MB)...",
-                    model_size,
-                )
-            else:
-                logger.info(
-                    "Loading whisper model: %s (%s, %s)",
-                    model_size, config["device"], config["compute_type"],
-                )
-
-            try:
-                _whisper_model = WhisperModel(
-                    model_size,
-                    device=config["device"],
-                    compute_type=config["compute_type"],
-                )
-            except Exception:
-                logger.warning("GPU whisper failed, falling back to CPU")
-                _whisper_model = WhisperModel(
-                    model_size, device="cpu", compute_type="int8",
-                )
-            _whisper_model_size = model_size
+    worker = _get_whisper_worker()
+    first_load = worker.model is None or worker.model_size != model_size
 
+    def _transcribe(model):
         # Transcribe
         lang = None if language == "auto" else language
-        segments, info = _whisper_model.transcribe(
-            audio_path,
+        segments, info = model.transcribe(
+            source,
             language=lang,
             beam_size=5,
+            # Live mic buffers are mostly silence around a short command:
+            # faster-whisper's bundled Silero VAD drops it before decoding
+            vad_filter=audio is not None,
         )
 
         # Collect segments
@@ -411,11 +500,10 @@ async def transcribe_audio(
         }
 
     try:
-        loop = asyncio.get_running_loop()
         # 5 minutes timeout: covers first-time model download + transcription
-        # Subsequent calls use the cached model and are much faster
+        # Subsequent calls use the resident model and are much faster
         result = await asyncio.wait_for(
-            loop.run_in_executor(None, _transcribe),
+            asyncio.wrap_future(worker.submit(model_size, _transcribe)),
             timeout=300,
         )
         if first_load:
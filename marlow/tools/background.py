@@ -19,6 +19,8 @@ from typing import Optional
 
 logger = logging.getLogger("marlow.tools.background")
 
+_SM_CMONITORS = 80
+
 
 class BackgroundManager:
     """Manages agent workspace for background automation."""
@@ -70,6 +72,15 @@ class BackgroundManager:
 _manager = BackgroundManager()
 
 
+def monitor_count() -> int:
+    """
+    Number of display monitors, without enumerating them.
+
+    / Numero de monitores conectados, sin enumerarlos.
+    """
+    return ctypes.windll.user32.GetSystemMetrics(_SM_CMONITORS)
+
+
 async def setup_background_mode(
     preferred_mode: Optional[str] = None,
 ) -> dict:
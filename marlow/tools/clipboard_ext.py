@@ -4,6 +4,11 @@ Marlow Clipboard History Tool
 Monitors the system clipboard and maintains a history of the last N entries.
 Supports listing, searching, and clearing the history.
 
+The monitor registers a message-only window with AddClipboardFormatListener
+and sleeps until Windows posts WM_CLIPBOARDUPDATE, so the clipboard is only
+read when it actually changed. If the listener can't be set up it falls
+back to checking once per second.
+
 / Monitorea el clipboard del sistema y mantiene un historial.
 """
 
@@ -20,6 +25,13 @@ _monitor_active = False
 _monitor_thread: Optional[threading.Thread] = None
 _max_history = 100
 
+# Clipboard listener (Win32)
+_WM_CLIPBOARDUPDATE = 0x031D
+_HWND_MESSAGE = -3
+_QS_ALLINPUT = 0x04FF
+_PM_REMOVE = 0x0001
+_STOP_CHECK_MS = 500  # how often an idle listener checks _monitor_active
+
 
 def _read_clipboard() -> str:
     """Read clipboard content via Win32 API."""
@@ -37,25 +49,134 @@ def _read_clipboard() -> str:
         return ""
 
 
+def _record_change(last_content: str) -> str:
+    """Append the clipboard to history if it changed; returns current content."""
+    current = _read_clipboard()
+    if current and current != last_content:
+        _history.append({
+            "content": current[:500],
+            "timestamp": datetime.now().isoformat(),
+            "length": len(current),
+        })
+
+        while len(_history) > _max_history:
+            _history.pop(0)
+
+        return current
+    return last_content
+
+
+def _listen_clipboard() -> bool:
+    """
+    Event-driven monitor loop. Returns False if the clipboard listener
+    could not be created (caller falls back to polling).
+
+    / Monitor por eventos (WM_CLIPBOARDUPDATE). Retorna False si no se
+    / pudo crear el listener.
+    """
+    import ctypes
+    import ctypes.wintypes as wt
+
+    try:
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+    except AttributeError:
+        return False
+
+    LRESULT = ctypes.c_ssize_t
+    WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wt.HWND, wt.UINT, wt.WPARAM, wt.LPARAM)
+
+    class WNDCLASSW(ctypes.Structure):
+        _fields_ = [
+            ("style", wt.UINT),
+            ("lpfnWndProc", WNDPROC),
+            ("cbClsExtra", ctypes.c_int),
+            ("cbWndExtra", ctypes.c_int),
+            ("hInstance", wt.HINSTANCE),
+            ("hIcon", wt.HICON),
+            ("hCursor", wt.HANDLE),
+            ("hbrBackground", wt.HBRUSH),
+            ("lpszMenuName", wt.LPCWSTR),
+            ("lpszClassName", wt.LPCWSTR),
+        ]
+
+    user32.DefWindowProcW.argtypes = [wt.HWND, wt.UINT, wt.WPARAM, wt.LPARAM]
+    user32.DefWindowProcW.restype = LRESULT
+    user32.CreateWindowExW.argtypes = [
+        wt.DWORD, wt.LPCWSTR, wt.LPCWSTR, wt.DWORD,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        wt.HWND, wt.HMENU, wt.HINSTANCE, wt.LPVOID,
+    ]
+    user32.CreateWindowExW.restype = wt.HWND
+    user32.UnregisterClassW.argtypes = [wt.LPCWSTR, wt.HINSTANCE]
+    for fn in (
+        user32.AddClipboardFormatListener,
+        user32.RemoveClipboardFormatListener,
+        user32.DestroyWindow,
+    ):
+        fn.argtypes = [wt.HWND]
+    kernel32.GetModuleHandleW.restype = wt.HMODULE
+
+    changed = [False]
+
+    def _wndproc(hwnd, msg, wparam, lparam):
+        if msg == _WM_CLIPBOARDUPDATE:
+            changed[0] = True
+            return 0
+        return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+    proc = WNDPROC(_wndproc)  # must outlive the window
+    hinstance = kernel32.GetModuleHandleW(None)
+    class_name = "MarlowClipboardListener"
+    wndclass = WNDCLASSW(
+        lpfnWndProc=proc, hInstance=hinstance, lpszClassName=class_name,
+    )
+    if not user32.RegisterClassW(ctypes.byref(wndclass)):
+        return False
+
+    hwnd = user32.CreateWindowExW(
+        0, class_name, None, 0, 0, 0, 0, 0,
+        _HWND_MESSAGE, None, hinstance, None,
+    )
+    try:
+        if not hwnd or not user32.AddClipboardFormatListener(hwnd):
+            return False
+
+        last_content = _read_clipboard()
+        msg = wt.MSG()
+        while _monitor_active:
+            user32.MsgWaitForMultipleObjects(
+                0, None, False, _STOP_CHECK_MS, _QS_ALLINPUT,
+            )
+            while user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, _PM_REMOVE):
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+            if changed[0]:
+                changed[0] = False
+                try:
+                    last_content = _record_change(last_content)
+                except Exception:
+                    pass
+        return True
+    finally:
+        if hwnd:
+            user32.RemoveClipboardFormatListener(hwnd)
+            user32.DestroyWindow(hwnd)
+        user32.UnregisterClassW(class_name, hinstance)
+
+
 def _monitor_clipboard():
     """Background thread that watches for clipboard changes."""
-    global _monitor_active
-    last_content = _read_clipboard()
+    try:
+        if _listen_clipboard():
+            return
+    except Exception as e:
+        logger.debug(f"Clipboard listener failed, polling instead: {e}")
 
+    last_content = _read_clipboard()
     while _monitor_active:
         try:
-            current = _read_clipboard()
-            if current and current != last_content:
-                _history.append({
-                    "content": current[:500],
-                    "timestamp": datetime.now().isoformat(),
-                    "length": len(current),
-                })
-
-                while len(_history) > _max_history:
-                    _history.pop(0)
-
-                last_content = current
+            last_content = _record_change(last_content)
         except Exception:
             pass
 
@@ -93,7 +214,7 @@ async def clipboard_history(
         _monitor_active = True
         _monitor_thread = threading.Thread(target=_monitor_clipboard, daemon=True)
         _monitor_thread.start()
-        return {"success": True, "status": "started", "checking_interval_seconds": 1}
+        return {"success": True, "status": "started", "change_detection": "clipboard_listener"}
 
     elif action == "stop":
         if not _monitor_active:
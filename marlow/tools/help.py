@@ -27,7 +27,7 @@ _TOOLS_CATALOG = [
                 "name": "take_screenshot",
                 "description_en": "Screenshot of screen, window, or region (~1,500 tokens)",
                 "description_es": "Captura de pantalla, ventana o region (~1,500 tokens)",
-                "params": ["window_title", "region", "quality"],
+                "params": ["window_title", "region", "quality", "downscale"],
             },
             {
                 "name": "click",
@@ -427,6 +427,12 @@ _TOOLS_CATALOG = [
     {
         "name": "Automation",
         "tools": [
+            {
+                "name": "batch_execute",
+                "description_en": "Run several tools in one request (each call safety-checked)",
+                "description_es": "Ejecutar varias herramientas en una sola peticion (cada una verificada)",
+                "params": ["calls", "max_concurrent", "stop_on_error"],
+            },
             {
                 "name": "watch_folder",
                 "description_en": "Monitor folder for file changes (watchdog)",
@@ -694,12 +700,13 @@ _TOTAL_TOOLS = sum(len(cat["tools"]) for cat in _TOOLS_CATALOG)
 # MCP Tools
 # ─────────────────────────────────────────────────────────────
 
-async def get_capabilities(category: str | None = None) -> dict:
-    """
-    List all Marlow MCP tools organized by category.
+# Catalog is static for the process lifetime, so results are memoized per
+# (lowercased) category. None = full catalog. Errors are not cached.
+_capabilities_cache: dict[str | None, dict] = {}
 
-    / Retorna catalogo completo o filtrado por categoria.
-    """
+
+def _build_capabilities(category: str | None) -> dict:
+    """Build the get_capabilities result for a category (or the full catalog)."""
     if category:
         # Filter to a single category (case-insensitive)
         match = None
@@ -726,6 +733,23 @@ async def get_capabilities(category: str | None = None) -> dict:
     }
 
 
+async def get_capabilities(category: str | None = None) -> dict:
+    """
+    List all Marlow MCP tools organized by category.
+
+    / Retorna catalogo completo o filtrado por categoria.
+    """
+    key = category.lower() if category else None
+    cached = _capabilities_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = _build_capabilities(category)
+    if "error" not in result:
+        _capabilities_cache[key] = result
+    return result
+
+
 async def get_version(
     safety_status: dict,
     background_mode: str | None,
@@ -12,9 +12,9 @@ Fallback engine: Tesseract (requires binary install)
 / Motor fallback: Tesseract (requiere instalar binario)
 """
 
+import asyncio
 import io
 import os
-import base64
 import logging
 import time
 from typing import Optional
@@ -43,6 +43,47 @@ def _find_tesseract() -> Optional[str]:
     return None
 
 
+# Windows OCR engines by requested language (None = user profile languages).
+# Creating an OcrEngine loads its recognizer, so it's done once per language.
+_engine_cache: dict[Optional[str], tuple] = {}
+
+
+def _get_windows_engine(language: Optional[str]) -> tuple:
+    """
+    Return a cached (OcrEngine, resolved_language), creating it on first use.
+    Engine is None if no OCR language is installed (not cached, so installing
+    a language pack later takes effect).
+
+    / Retorna un OcrEngine cacheado por idioma.
+    """
+    cached = _engine_cache.get(language)
+    if cached is not None:
+        return cached
+
+    from winrt.windows.media.ocr import OcrEngine
+
+    engine = None
+    resolved_language = None
+
+    if language:
+        try:
+            from winrt.windows.globalization import Language
+            lang_obj = Language(language)
+            if OcrEngine.is_language_supported(lang_obj):
+                engine = OcrEngine.try_create_from_language(lang_obj)
+                resolved_language = language
+        except Exception:
+            pass
+
+    if engine is None:
+        engine = OcrEngine.try_create_from_user_profile_languages()
+        resolved_language = "auto"
+
+    if engine is not None:
+        _engine_cache[language] = (engine, resolved_language)
+    return engine, resolved_language
+
+
 def _windows_ocr_available() -> bool:
     """Check if Windows OCR API is available."""
     try:
@@ -52,55 +93,46 @@ def _windows_ocr_available() -> bool:
         return False
 
 
-async def _ocr_windows(img: "Image.Image", language: Optional[str] = None) -> dict:
+async def _ocr_windows(
+    img: "Image.Image",
+    language: Optional[str] = None,
+    image_bytes: Optional[bytes] = None,
+) -> dict:
     """
     Run OCR using Windows.Media.Ocr API.
 
     Args:
         img: PIL Image to OCR (any mode — will be converted to RGBA).
         language: BCP-47 language tag (e.g., "en-US", "es-MX"). If None, auto-detects.
+        image_bytes: Already-encoded image (PNG/JPEG) for ``img``. When given,
+                     it is fed to BitmapDecoder directly, skipping the PIL
+                     decode + PNG re-encode.
 
     Returns:
         Dictionary with text, words (with bounding boxes), and metadata.
 
     / Ejecuta OCR usando la API Windows.Media.Ocr.
     """
-    from winrt.windows.media.ocr import OcrEngine
     from winrt.windows.graphics.imaging import BitmapDecoder
     from winrt.windows.storage.streams import InMemoryRandomAccessStream, DataWriter
 
-    # Create engine
-    engine = None
-    resolved_language = None
-
-    if language:
-        try:
-            from winrt.windows.globalization import Language
-            lang_obj = Language(language)
-            if OcrEngine.is_language_supported(lang_obj):
-                engine = OcrEngine.try_create_from_language(lang_obj)
-                resolved_language = language
-        except Exception:
-            pass
-
-    if engine is None:
-        engine = OcrEngine.try_create_from_user_profile_languages()
-        resolved_language = "auto"
+    engine, resolved_language = _get_windows_engine(language)
 
     if engine is None:
         return {"error": "Windows OCR: could not create engine (no OCR languages installed)"}
 
-    # Convert PIL image to PNG bytes and load via BitmapDecoder
-    # / Convertir imagen PIL a bytes PNG y cargar via BitmapDecoder
-    rgba_img = img.convert("RGBA")
-    buf = io.BytesIO()
-    rgba_img.save(buf, format="PNG")
-    png_bytes = buf.getvalue()
+    if image_bytes is None:
+        # Convert PIL image to PNG bytes and load via BitmapDecoder
+        # / Convertir imagen PIL a bytes PNG y cargar via BitmapDecoder
+        rgba_img = img.convert("RGBA")
+        buf = io.BytesIO()
+        rgba_img.save(buf, format="PNG")
+        image_bytes = buf.getvalue()
 
     stream = InMemoryRandomAccessStream()
     try:
         writer = DataWriter(stream)
-        writer.write_bytes(png_bytes)
+        writer.write_bytes(image_bytes)
         await writer.store_async()
         writer.detach_stream()
         stream.seek(0)
@@ -163,10 +195,16 @@ async def _ocr_tesseract(img: "Image.Image", language: str = "eng", preprocess:
 
     pytesseract.pytesseract.tesseract_cmd = tesseract_path
 
-    if preprocess:
-        img = _preprocess_image(img)
+    # Preprocessing and the tesseract subprocess are blocking — run them
+    # off the event loop so other tool calls aren't stalled meanwhile
+    def _run(img):
+        if preprocess:
+            img = _preprocess_image(img)
+        data = pytesseract.image_to_data(img, lang=language, output_type=pytesseract.Output.DICT)
+        text = pytesseract.image_to_string(img, lang=language)
+        return data, text
 
-    data = pytesseract.image_to_data(img, lang=language, output_type=pytesseract.Output.DICT)
+    data, full_text = await asyncio.to_thread(_run, img)
 
     words = []
     for i in range(len(data["text"])):
@@ -182,7 +220,7 @@ async def _ocr_tesseract(img: "Image.Image", language: str = "eng", preprocess:
                 "confidence": conf,
             })
 
-    full_text = pytesseract.image_to_string(img, lang=language).strip()
+    full_text = full_text.strip()
     avg_conf = sum(w["confidence"] for w in words) / len(words) if words else 0
 
     return {
@@ -201,10 +239,24 @@ def _preprocess_image(img) -> "Image":
     """
     Preprocess image for better Tesseract accuracy.
     Grayscale → 2x upscale → threshold.
+
+    Uses OpenCV's SIMD resize/threshold when installed (optional), PIL otherwise.
     """
     from PIL import Image
 
     img = img.convert("L")
+    try:
+        import cv2
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        pixels = cv2.resize(
+            np.asarray(img), None, fx=2, fy=2, interpolation=cv2.INTER_LANCZOS4,
+        )
+        _, pixels = cv2.threshold(pixels, 128, 255, cv2.THRESH_BINARY)
+        return Image.fromarray(pixels)
+
     img = img.resize((img.width * 2, img.height * 2), Image.LANCZOS)
     img = img.point(lambda p: 255 if p > 128 else 0)
     return img
@@ -251,9 +303,9 @@ async def ocr_region(
         if "error" in screenshot_result:
             return {"error": f"Screenshot failed: {screenshot_result['error']}"}
 
-        # Decode base64 image
-        image_data = base64.b64decode(screenshot_result["image_base64"])
-        img = Image.open(io.BytesIO(image_data))
+        # Image.open is lazy: the JPEG is only decoded if Tesseract needs pixels
+        image_bytes = screenshot_result["image_bytes"]
+        img = Image.open(io.BytesIO(image_bytes))
 
         source_size = {
             "width": screenshot_result.get("width"),
@@ -269,7 +321,7 @@ async def ocr_region(
         t0 = time.perf_counter()
 
         if use_windows and not use_tesseract:
-            result = await _ocr_windows(img, language=language)
+            result = await _ocr_windows(img, language=language, image_bytes=image_bytes)
 
             # If Windows OCR failed, try Tesseract as fallback
             if "error" in result and engine != "windows":
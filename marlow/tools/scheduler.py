@@ -4,13 +4,18 @@ Marlow Task Scheduler
 Schedules recurring tasks (commands) at regular intervals.
 Tasks run in daemon threads with output captured.
 
+Run history lives in a bounded in-memory ring buffer (the most recent
+_max_history runs); older entries drop off the front as new ones arrive.
+
 / Programador de tareas recurrentes con intervalos configurables.
 """
 
+import itertools
 import logging
 import subprocess
 import threading
 import time
+from collections import deque
 from datetime import datetime
 from typing import Optional
 
@@ -18,12 +23,26 @@ logger = logging.getLogger("marlow.tools.scheduler")
 
 # Module-level state
 _tasks: dict[str, dict] = {}
-_task_history: list[dict] = []
 _max_history = 200
+_task_history: deque[dict] = deque(maxlen=_max_history)
+
+_history_lock = threading.Lock()
 
-# Kill switch callback — set by server.py at startup
+# Kill switch — server.py registers SafetyEngine.kill_event at startup;
+# the callback form is kept for callers without an Event
+_kill_event: Optional[threading.Event] = None
 _kill_switch_check: Optional[callable] = None
 
+# How often a running command checks whether it should be terminated
+_KILL_POLL_SECONDS = 0.5
+_COMMAND_TIMEOUT = 60
+
+
+def set_kill_event(event: Optional[threading.Event]) -> None:
+    """Register an Event that is set while the kill switch is active."""
+    global _kill_event
+    _kill_event = event
+
 
 def set_kill_switch_check(fn: callable) -> None:
     """Register a callback that returns True if the kill switch is active."""
@@ -31,6 +50,18 @@ def set_kill_switch_check(fn: callable) -> None:
     _kill_switch_check = fn
 
 
+def _is_killed() -> bool:
+    if _kill_event is not None and _kill_event.is_set():
+        return True
+    return bool(_kill_switch_check and _kill_switch_check())
+
+
+def _record_history(entry: dict) -> None:
+    """Append an entry to the history ring buffer."""
+    with _history_lock:
+        _task_history.append(entry)
+
+
 class TaskRunner(threading.Thread):
     """Daemon thread that executes a command at regular intervals."""
 
@@ -44,6 +75,7 @@ class TaskRunner(threading.Thread):
         self.max_runs = max_runs
         self.run_count = 0
         self.active = True
+        self._stop_event = threading.Event()
 
     def run(self) -> None:
         while self.active:
@@ -51,18 +83,13 @@ class TaskRunner(threading.Thread):
                 self.active = False
                 break
 
-            # Wait the interval (check active flag every second)
-            for _ in range(self.interval):
-                if not self.active:
-                    return
-                time.sleep(1)
-
-            if not self.active:
+            # Wait the interval — stop() wakes us immediately
+            if self._stop_event.wait(self.interval) or not self.active:
                 return
 
             # Check kill switch before every execution
-            if _kill_switch_check and _kill_switch_check():
-                _task_history.append({
+            if _is_killed():
+                _record_history({
                     "task": self.task_name,
                     "error": "kill switch active — execution skipped",
                     "timestamp": datetime.now().isoformat(),
@@ -76,13 +103,21 @@ class TaskRunner(threading.Thread):
                 else:
                     cmd = ["cmd", "/c", self.command]
 
-                result = subprocess.run(
-                    cmd, capture_output=True, text=True, timeout=60,
-                )
+                result = self._execute(cmd)
+                if result is None:
+                    _record_history({
+                        "task": self.task_name,
+                        "error": (
+                            "task removed — command terminated" if not self.active
+                            else "kill switch activated — command terminated"
+                        ),
+                        "timestamp": datetime.now().isoformat(),
+                    })
+                    continue
 
                 self.run_count += 1
 
-                _task_history.append({
+                _record_history({
                     "task": self.task_name,
                     "command": self.command,
                     "exit_code": result.returncode,
@@ -93,25 +128,45 @@ class TaskRunner(threading.Thread):
                     "timestamp": datetime.now().isoformat(),
                 })
 
-                # Enforce max history limit
-                while len(_task_history) > _max_history:
-                    _task_history.pop(0)
-
             except subprocess.TimeoutExpired:
-                _task_history.append({
+                _record_history({
                     "task": self.task_name,
-                    "error": "timeout after 60s",
+                    "error": f"timeout after {_COMMAND_TIMEOUT}s",
                     "timestamp": datetime.now().isoformat(),
                 })
             except Exception as e:
-                _task_history.append({
+                _record_history({
                     "task": self.task_name,
                     "error": str(e),
                     "timestamp": datetime.now().isoformat(),
                 })
 
+    def _execute(self, cmd: list[str]) -> Optional[subprocess.CompletedProcess]:
+        """
+        Run ``cmd`` to completion. Returns None if the kill switch fired
+        (or the task was removed) while it ran — the process is terminated.
+        """
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+        deadline = time.monotonic() + _COMMAND_TIMEOUT
+        while True:
+            try:
+                stdout, stderr = proc.communicate(timeout=_KILL_POLL_SECONDS)
+                return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+            except subprocess.TimeoutExpired:
+                if _is_killed() or not self.active:
+                    proc.kill()
+                    proc.communicate()
+                    return None
+                if time.monotonic() >= deadline:
+                    proc.kill()
+                    proc.communicate()
+                    raise subprocess.TimeoutExpired(cmd, _COMMAND_TIMEOUT)
+
     def stop(self):
         self.active = False
+        self._stop_event.set()
 
 
 async def schedule_task(
@@ -220,19 +275,38 @@ async def get_task_history(task_name: str = None, limit: int = 20) -> dict:
     """
     Get execution history for scheduled tasks.
 
+    Served from the in-memory ring buffer (most recent runs).
+
     Args:
         task_name: Filter to a specific task name.
-        limit: Max entries to return.
+        limit: Max entries to return (0 returns all of them).
 
     Returns:
-        Dict with history list and total count.
+        Dict with history list (oldest first) and total count.
     """
-    filtered = _task_history
+    with _history_lock:
+        snapshot = list(_task_history)
+
+    if limit > 0:
+        matches = (
+            h for h in reversed(snapshot)
+            if not task_name or h.get("task") == task_name
+        )
+        recent = list(itertools.islice(matches, limit))
+        recent.reverse()
+    else:
+        # limit=0 has always meant "everything" (filtered[-0:])
+        recent = [
+            h for h in snapshot
+            if not task_name or h.get("task") == task_name
+        ][-limit:]
 
     if task_name:
-        filtered = [h for h in filtered if h.get("task") == task_name]
+        total = sum(1 for h in snapshot if h.get("task") == task_name)
+    else:
+        total = len(snapshot)
 
     return {
-        "history": filtered[-limit:],
-        "total": len(filtered),
+        "history": recent,
+        "total": total,
     }
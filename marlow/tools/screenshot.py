@@ -8,21 +8,114 @@ Includes:
 - Full screen capture
 - Per-window capture 
 - Region capture
-- Base64 encoding for MCP transport
+- Raw JPEG bytes (base64-encoded once, at the MCP edge in server.py)
+
+JPEG encoding uses libjpeg-turbo directly (PyTurboJPEG, optional) when
+available — fed straight from the mss BGRA framebuffer, or from the RGB
+pixels of window captures and downscaled images; otherwise PIL.
+
+On single-monitor systems, fullscreen and region captures read the frame
+through DXGI Desktop Duplication (dxcam, optional) instead of a GDI
+BitBlt; mss is used when dxcam is missing or unusable.
 """
 
 import io
-import base64
 import logging
 from typing import Optional
 
 logger = logging.getLogger("marlow.tools.screenshot")
 
+# TurboJPEG encoder — None until first use, False if unavailable
+_turbo = None
+
+# DXGI duplication (dxcam camera) — None until first use, False if unavailable
+_dxgi = None
+# Last full frame from the camera — grab() returns None while the screen
+# is static, and that frame is still what is on screen
+_dxgi_frame = None
+
+
+def _get_turbojpeg():
+    """Return a cached TurboJPEG encoder, or None if PyTurboJPEG/libturbojpeg is missing."""
+    global _turbo
+    if _turbo is None:
+        try:
+            from turbojpeg import TurboJPEG
+            _turbo = TurboJPEG()
+        except Exception as e:
+            logger.debug(f"TurboJPEG unavailable, using PIL encoder: {e}")
+            _turbo = False
+    return _turbo or None
+
+
+def _get_dxgi():
+    """
+    Return the cached dxcam camera for the primary output, or None.
+
+    The duplication is kept alive across calls, so only the first capture
+    pays for creating the D3D11 device. Only used with a single monitor,
+    where output coordinates and screen coordinates are the same.
+    """
+    global _dxgi
+    if _dxgi is None:
+        try:
+            from marlow.tools.background import monitor_count
+            if monitor_count() != 1:
+                return None  # re-checked next call: monitors can be plugged in
+            import dxcam
+            _dxgi = dxcam.create(output_color="BGRA")
+            if _dxgi is None:
+                raise RuntimeError("no duplication for the primary output")
+        except Exception as e:
+            logger.debug(f"DXGI capture unavailable, using mss: {e}")
+            _dxgi = False
+    return _dxgi or None
+
+
+def _grab_dxgi(left: int, top: int, width: int, height: int) -> Optional[object]:
+    """
+    Grab a BGRA frame (numpy, height x width x 4) through DXGI Desktop
+    Duplication, or None when unavailable or out of bounds.
+
+    The full output is always grabbed and cropped here, so that when the
+    screen has not changed (dxcam returns no new frame) the previous
+    frame can be cropped to any region instead.
+    """
+    global _dxgi, _dxgi_frame
+    camera = _get_dxgi()
+    if camera is None:
+        return None
+    try:
+        from marlow.tools.background import monitor_count
+        if monitor_count() != 1:
+            return None
+        if left < 0 or top < 0 or left + width > camera.width or top + height > camera.height:
+            return None
+        frame = camera.grab()
+        if frame is not None:
+            _dxgi_frame = frame
+        elif _dxgi_frame is None:
+            return None  # nothing captured yet
+        import numpy as np
+        return np.ascontiguousarray(_dxgi_frame[top:top + height, left:left + width])
+    except Exception as e:
+        # Duplication is lost on desktop switches (UAC, lock screen) or
+        # mode changes — recreate it on the next call
+        logger.debug(f"DXGI grab failed, using mss: {e}")
+        try:
+            camera.release()
+        except Exception:
+            pass
+        _dxgi = None
+        _dxgi_frame = None
+        return None
+
 
 async def take_screenshot(
     window_title: Optional[str] = None,
     region: Optional[dict] = None,
     quality: int = 85,
+    downscale: float = 1.0,
 ) -> dict:
     """
     Take a screenshot of the screen, a specific window, or a region.
@@ -35,12 +128,16 @@ async def take_screenshot(
                       full screen.
         region: Capture a specific region: {"x": 0, "y": 0, "width": 800, "height": 600}
         quality: JPEG quality (1-100). Lower = smaller file. Default: 85.
+        downscale: Resize factor applied before encoding (0.1-1.0).
+                   0.5 sends a quarter of the pixels. Default: 1.0 (full size).
 
     Returns:
         Dictionary with:
-        - image_base64: Base64 encoded image
+        - image_bytes: Raw JPEG bytes (server.py base64-encodes for MCP)
         - width, height: Image dimensions
         - format: Image format used
+        - scale, original_size: present when downscaled (divide image
+          coordinates by scale to get screen coordinates)
     
     / Captura una screenshot de la pantalla, ventana específica, o región.
     / NOTA: Cuesta ~1,500 tokens con LLM Vision. Siempre usa get_ui_tree() primero.
@@ -49,12 +146,14 @@ async def take_screenshot(
         import mss
         from PIL import Image
 
+        downscale = min(max(float(downscale or 1.0), 0.1), 1.0)
+
         if window_title:
-            return await _capture_window(window_title, quality)
+            return await _capture_window(window_title, quality, downscale)
         elif region:
-            return await _capture_region(region, quality)
+            return await _capture_region(region, quality, downscale)
         else:
-            return await _capture_fullscreen(quality)
+            return await _capture_fullscreen(quality, downscale)
 
     except ImportError as e:
         missing = str(e).split("'")[-2] if "'" in str(e) else str(e)
@@ -66,20 +165,24 @@ async def take_screenshot(
         return {"error": str(e)}
 
 
-async def _capture_fullscreen(quality: int) -> dict:
+async def _capture_fullscreen(quality: int, downscale: float = 1.0) -> dict:
     """Capture the full screen."""
     import mss
-    from PIL import Image
+
+    camera = _get_dxgi()
+    if camera is not None:
+        frame = _grab_dxgi(0, 0, camera.width, camera.height)
+        if frame is not None:
+            return _encode_bgra(frame, camera.width, camera.height, quality, "fullscreen", downscale)
 
     with mss.mss() as sct:
         monitor = sct.monitors[0]  # All monitors combined
         screenshot = sct.grab(monitor)
+        width, height = screenshot.size
+        return _encode_bgra(screenshot.bgra, width, height, quality, "fullscreen", downscale)
 
-        img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-        return _encode_image(img, quality, "fullscreen")
 
-
-async def _capture_window(window_title: str, quality: int) -> dict:
+async def _capture_window(window_title: str, quality: int, downscale: float = 1.0) -> dict:
     """Capture a specific window by title."""
     try:
         from marlow.core.uia_utils import find_window
@@ -91,17 +194,16 @@ async def _capture_window(window_title: str, quality: int) -> dict:
         # This is key for background mode
         img = target.capture_as_image()
 
-        return _encode_image(img, quality, f"window: {target.window_text()}")
+        return _encode_image(img, quality, f"window: {target.window_text()}", downscale)
 
     except Exception as e:
         logger.error(f"Window capture error: {e}")
         return {"error": str(e)}
 
 
-async def _capture_region(region: dict, quality: int) -> dict:
+async def _capture_region(region: dict, quality: int, downscale: float = 1.0) -> dict:
     """Capture a specific screen region."""
     import mss
-    from PIL import Image
 
     monitor = {
         "left": region.get("x", 0),
@@ -110,33 +212,120 @@ async def _capture_region(region: dict, quality: int) -> dict:
         "height": region.get("height", 600),
     }
 
+    frame = _grab_dxgi(monitor["left"], monitor["top"], monitor["width"], monitor["height"])
+    if frame is not None:
+        return _encode_bgra(frame, monitor["width"], monitor["height"], quality, "region", downscale)
+
+    # mss grabs only the requested rectangle — no full-desktop capture + crop
     with mss.mss() as sct:
         screenshot = sct.grab(monitor)
-        img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-        return _encode_image(img, quality, "region")
+        width, height = screenshot.size
+        return _encode_bgra(screenshot.bgra, width, height, quality, "region", downscale)
+
+
+def _encode_bgra(
+    bgra: object, width: int, height: int, quality: int, source: str, downscale: float = 1.0,
+) -> dict:
+    """
+    Encode a BGRA framebuffer (mss capture bytes or a DXGI frame) to JPEG.
+
+    With TurboJPEG the framebuffer is encoded in place (no RGB copy
+    through PIL); otherwise, or when downscaling, falls back to the PIL path.
+    """
+    if downscale >= 1.0:
+        image_bytes = _turbo_encode(bgra, width, height, 4, quality)
+        if image_bytes is not None:
+            return _build_result(image_bytes, width, height, source)
+
+    from PIL import Image
+    img = Image.frombuffer("RGB", (width, height), bgra, "raw", "BGRX", 0, 1)
+    return _encode_image(img, quality, source, downscale)
+
+
+def _turbo_encode(
+    pixels: object, width: int, height: int, channels: int, quality: int,
+) -> Optional[bytes]:
+    """
+    Encode packed BGRX (channels=4) or RGB (channels=3) pixels with
+    TurboJPEG. Returns None when it is unavailable or fails, so the caller
+    falls back to PIL.
+    """
+    turbo = _get_turbojpeg()
+    if not turbo:
+        return None
+    try:
+        import numpy as np
+        from turbojpeg import TJPF_BGRX, TJPF_RGB, TJSAMP_420
+
+        array = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, channels)
+        return turbo.encode(
+            array, quality=quality,
+            pixel_format=TJPF_BGRX if channels == 4 else TJPF_RGB,
+            jpeg_subsample=TJSAMP_420,
+        )
+    except Exception as e:
+        logger.debug(f"TurboJPEG encode failed, falling back to PIL: {e}")
+        return None
 
 
-def _encode_image(img: object, quality: int, source: str) -> dict:
-    """Encode a PIL Image to base64 for MCP transport."""
+def _encode_image(img: object, quality: int, source: str, downscale: float = 1.0) -> dict:
+    """Encode a PIL Image to JPEG bytes for MCP transport."""
     from PIL import Image
 
     # Convert to RGB if needed
     if img.mode != "RGB":
         img = img.convert("RGB")
 
+    original_size = img.size
+    if downscale < 1.0:
+        # BOX filter with reducing_gap: fast integer pre-reduction, then a
+        # cheap final resample — text stays legible at 0.5x
+        target = (max(1, round(img.width * downscale)), max(1, round(img.height * downscale)))
+        img = img.resize(target, Image.Resampling.BOX, reducing_gap=2.0)
+
     # Encode to JPEG (smaller than PNG for MCP transport)
-    buffer = io.BytesIO()
-    img.save(buffer, format="JPEG", quality=quality)
-    buffer.seek(0)
+    image_bytes = _turbo_encode(img.tobytes(), img.width, img.height, 3, quality)
+    if image_bytes is None:
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=quality)
+        image_bytes = buffer.getvalue()
+    result = _build_result(image_bytes, img.width, img.height, source)
+    if img.size != original_size:
+        result["scale"] = downscale
+        result["original_size"] = {"width": original_size[0], "height": original_size[1]}
+    return result
 
-    image_base64 = base64.b64encode(buffer.read()).decode("utf-8")
 
+def _build_result(image_bytes: bytes, width: int, height: int, source: str) -> dict:
+    """Build the take_screenshot result dict."""
     return {
-        "image_base64": image_base64,
-        "width": img.width,
-        "height": img.height,
+        "image_bytes": image_bytes,
+        "width": width,
+        "height": height,
         "format": "jpeg",
         "source": source,
-        "size_kb": round(len(image_base64) * 3 / 4 / 1024, 1),
+        "size_kb": round(len(image_bytes) / 1024, 1),
         "hint": "⚠️ This image costs ~1,500 tokens. Use get_ui_tree() for 0-token alternative.",
     }
+
+
+def describe(result: dict) -> str:
+    """
+    One-line caption sent next to the image. Includes the scale when the
+    image was downscaled, so image coordinates can be mapped back to the
+    screen (screen = image / scale).
+
+    / Texto que acompana la imagen; incluye la escala si se redujo.
+    """
+    text = (
+        f"Screenshot: {result.get('width')}x{result.get('height')} "
+        f"({result.get('size_kb')}KB) — Source: {result.get('source')}"
+    )
+    if "scale" in result:
+        original = result.get("original_size") or {}
+        text += (
+            f" — Scale: {result['scale']} of original "
+            f"{original.get('width')}x{original.get('height')}; "
+            f"divide image coordinates by {result['scale']} to click"
+        )
+    return text
@@ -5,6 +5,7 @@ Run commands, open applications, manage clipboard, get system info.
 All shell commands pass through the safety engine's blocked command list.
 """
 
+import asyncio
 import logging
 import platform
 from typing import Optional
@@ -44,7 +45,10 @@ async def run_command(
         else:
             cmd = ["cmd", "/c", command]
 
-        result = subprocess.run(
+        # Off the event loop: a long command must not stall other tool
+        # calls (or the kill_switch tool) for up to `timeout` seconds
+        result = await asyncio.to_thread(
+            subprocess.run,
             cmd,
             capture_output=True,
             text=True,
@@ -156,7 +160,8 @@ async def clipboard(
         import subprocess
 
         if action == "read":
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ["powershell", "-NoProfile", "-Command", "Get-Clipboard"],
                 capture_output=True, text=True, timeout=10,
             )
@@ -166,7 +171,8 @@ async def clipboard(
             }
         else:
             # Pass text via stdin to avoid shell injection
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ["powershell", "-NoProfile", "-Command",
                  "$input | Set-Clipboard"],
                 input=text,
@@ -12,7 +12,7 @@ Inspired by sbroenne's approach: UI Automation first, screenshots last.
 """
 
 import logging
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 logger = logging.getLogger("marlow.tools.ui_tree")
 
@@ -31,6 +31,32 @@ _DEPTH_MAP = {
 }
 _DEPTH_DEFAULT = 10  # Unknown framework fallback
 
+# UIA property ids prefetched for every node of the cached walk
+_UIA_ControlTypePropertyId = 30003
+_UIA_NamePropertyId = 30005
+_UIA_IsEnabledPropertyId = 30010
+_UIA_AutomationIdPropertyId = 30011
+_UIA_ClassNamePropertyId = 30012
+_UIA_IsOffscreenPropertyId = 30022
+_UIA_ValueValuePropertyId = 30045
+_TreeScope_Children = 2
+
+# Pattern name (as reported in "patterns") → Is<Pattern>PatternAvailable id
+_PATTERN_PROPERTIES = (
+    ("Invoke", 30031),
+    ("Toggle", 30041),
+    ("SelectionItem", 30036),
+    ("ExpandCollapse", 30028),
+    ("Value", 30043),
+    ("RangeValue", 30033),
+    ("Scroll", 30034),
+    ("Text", 30040),
+)
+_TEXT_PATTERN_PROPERTY = 30040
+
+# Cache request for the tree walk — built once per process
+_tree_cache_request = None
+
 
 def _resolve_depth(pid: int) -> tuple[int, str, Optional[str]]:
     """
@@ -56,6 +82,7 @@ async def get_ui_tree(
     window_title: Optional[str] = None,
     max_depth: Union[int, str] = "auto",
     include_invisible: bool = False,
+    sanitize: Optional[Callable[[str], str]] = None,
 ) -> dict:
     """
     Get the UI Automation Accessibility Tree for a window or the desktop.
@@ -69,6 +96,10 @@ async def get_ui_tree(
         max_depth: Tree depth. "auto" (default) picks optimal depth per app
                    framework. Pass an integer to override.
         include_invisible: Whether to include non-visible elements.
+        sanitize: Optional str -> str redactor applied to every text field
+                  while the tree is built, so callers don't need a second
+                  pass over the finished dict (server.py passes
+                  DataSanitizer.sanitize).
 
     Returns:
         Dictionary with the UI tree structure including:
@@ -83,6 +114,7 @@ async def get_ui_tree(
     """
     try:
         from pywinauto import Desktop
+        from marlow.core import ui_cache
         from marlow.core.uia_utils import find_window
 
         if window_title:
@@ -93,6 +125,16 @@ async def get_ui_tree(
             desktop = Desktop(backend="uia")
             target = desktop.window(active_only=True)
 
+        # Same window, same arguments, nothing changed since (MCP and kernel
+        # dispatchers both call ui_cache.tool_finished after any tool that
+        # may alter the UI): reuse the finished tree
+        hwnd = getattr(target, "handle", None)
+        cache_key = (hwnd, max_depth, include_invisible, sanitize) if hwnd else None
+        if cache_key is not None:
+            cached = ui_cache.get_result(cache_key)
+            if cached is not None:
+                return cached
+
         # Resolve depth: "auto" → framework-based, int → user override
         # / Resolver profundidad: "auto" → basada en framework, int → override del usuario
         pid = target.process_id()
@@ -110,14 +152,22 @@ async def get_ui_tree(
             except Exception:
                 pass
 
-        # Build the tree
-        # Desktop.windows() returns UIAWrapper objects directly — no wrapper_object() needed
-        tree = _build_element_tree(target, depth, include_invisible)
+        # Build the tree — single walk: sanitizes and counts as it goes.
+        # Cached walk first (one COM round trip per node); the per-property
+        # wrapper walk is the fallback if the native API isn't usable.
+        clean = sanitize or _identity
+        counter = [0]
+        walk = _CachedWalk.start(target, depth, include_invisible, clean, counter)
+        if walk is not None:
+            tree = walk.build(walk.root, 0)
+        else:
+            # Desktop.windows() returns UIAWrapper objects directly — no wrapper_object() needed
+            tree = _build_element_tree(target, depth, include_invisible, clean, counter)
 
         # Get window info
         rect = target.rectangle()
         window_info = {
-            "title": target.window_text(),
+            "title": clean(target.window_text()),
             "position": {"x": rect.left, "y": rect.top},
             "size": {"width": rect.width(), "height": rect.height()},
             "process_id": pid,
@@ -126,13 +176,16 @@ async def get_ui_tree(
         if framework:
             window_info["framework"] = framework
 
-        return {
+        result = {
             "window": window_info,
             "elements": tree,
-            "element_count": _count_elements(tree),
+            "element_count": counter[0],
             "depth_used": depth,
             "depth_reason": depth_reason,
         }
+        if cache_key is not None:
+            ui_cache.put_result(cache_key, result)
+        return result
 
     except ImportError:
         return {
@@ -144,20 +197,180 @@ async def get_ui_tree(
         return {"error": str(e)}
 
 
+def _identity(text: str) -> str:
+    return text
+
+
+def _get_tree_cache_request(iuia):
+    """Return the shared IUIAutomationCacheRequest for the tree walk."""
+    global _tree_cache_request
+    if _tree_cache_request is None:
+        request = iuia.CreateCacheRequest()
+        for prop_id in (
+            _UIA_ControlTypePropertyId, _UIA_NamePropertyId,
+            _UIA_IsEnabledPropertyId, _UIA_AutomationIdPropertyId,
+            _UIA_ClassNamePropertyId, _UIA_IsOffscreenPropertyId,
+            _UIA_ValueValuePropertyId,
+        ):
+            request.AddProperty(prop_id)
+        for _, prop_id in _PATTERN_PROPERTIES:
+            request.AddProperty(prop_id)
+        _tree_cache_request = request
+    return _tree_cache_request
+
+
+class _CachedWalk:
+    """
+    Builds the same tree as _build_element_tree from UIA's cached-property
+    API: each node's children come back from one FindAllBuildCache call
+    with every property and pattern flag prefetched, instead of a COM
+    round trip per property and per pattern probe.
+
+    / Construye el arbol con propiedades cacheadas de UIA (un viaje COM
+    / por nodo en vez de uno por propiedad).
+    """
+
+    __slots__ = (
+        "root", "condition", "request", "id_to_type",
+        "max_depth", "include_invisible", "clean", "counter",
+    )
+
+    @classmethod
+    def start(
+        cls,
+        target: object,
+        max_depth: int,
+        include_invisible: bool,
+        clean: Callable[[str], str],
+        counter: list,
+    ) -> Optional["_CachedWalk"]:
+        """
+        Prefetch ``target`` itself; None when the native API isn't
+        available, so the caller falls back to the wrapper walk.
+        """
+        try:
+            from pywinauto.uia_defines import IUIA
+
+            uia = IUIA()
+            iuia = uia.iuia
+            request = _get_tree_cache_request(iuia)
+            root = target.element_info.element.BuildUpdatedCache(request)
+            return cls(
+                root, iuia.CreateTrueCondition(), request,
+                uia.known_control_type_ids,
+                max_depth, include_invisible, clean, counter,
+            )
+        except Exception as e:
+            logger.debug(f"Cached UIA walk unavailable, using wrappers: {e}")
+            return None
+
+    def __init__(self, root, condition, request, id_to_type,
+                 max_depth, include_invisible, clean, counter):
+        self.root = root
+        self.condition = condition
+        self.request = request
+        self.id_to_type = id_to_type
+        self.max_depth = max_depth
+        self.include_invisible = include_invisible
+        self.clean = clean
+        self.counter = counter
+
+    def build(self, elem, current_depth: int) -> Optional[dict]:
+        if current_depth > self.max_depth:
+            return {"truncated": True, "reason": f"max_depth={self.max_depth} reached"}
+
+        clean = self.clean
+        try:
+            get = elem.GetCachedPropertyValue
+            class_name = get(_UIA_ClassNamePropertyId) or ""
+            name = get(_UIA_NamePropertyId) or ""
+            if class_name and get(_TEXT_PATTERN_PROPERTY):
+                # window_text() reads a text-pattern element's document
+                # text, not its Name — keep that (live) for these nodes
+                name = self._rich_text(elem, name)
+            info = {
+                "name": clean(name),
+                "control_type": clean(
+                    self.id_to_type.get(get(_UIA_ControlTypePropertyId)) or "Unknown"
+                ),
+                "automation_id": clean(get(_UIA_AutomationIdPropertyId) or ""),
+                "class_name": clean(class_name),
+                "is_enabled": bool(get(_UIA_IsEnabledPropertyId)),
+                "is_visible": not get(_UIA_IsOffscreenPropertyId),
+            }
+
+            # Skip invisible elements if not requested
+            if not self.include_invisible and not info["is_visible"]:
+                return None
+
+            self.counter[0] += 1
+
+            # Add value for input elements
+            value = get(_UIA_ValueValuePropertyId)
+            if value:
+                info["value"] = clean(value) if isinstance(value, str) else value
+
+            # Add patterns/capabilities
+            patterns = [p for p, prop_id in _PATTERN_PROPERTIES if get(prop_id)]
+            if patterns:
+                info["patterns"] = patterns
+
+            # Get children
+            if current_depth < self.max_depth:
+                children = []
+                try:
+                    found = elem.FindAllBuildCache(
+                        _TreeScope_Children, self.condition, self.request,
+                    )
+                    for i in range(found.Length if found else 0):
+                        child_tree = self.build(found.GetElement(i), current_depth + 1)
+                        if child_tree is not None:
+                            children.append(child_tree)
+                except Exception:
+                    pass
+
+                if children:
+                    info["children"] = children
+
+            return info
+
+        except Exception as e:
+            return {"error": clean(str(e)), "name": "unknown"}
+
+    @staticmethod
+    def _rich_text(elem, fallback: str) -> str:
+        try:
+            from pywinauto.uia_element_info import UIAElementInfo
+            return UIAElementInfo(elem).rich_text or ""
+        except Exception:
+            return fallback
+
+
 def _build_element_tree(
-    element: object, max_depth: int, include_invisible: bool, current_depth: int = 0
+    element: object,
+    max_depth: int,
+    include_invisible: bool,
+    clean: Callable[[str], str] = _identity,
+    counter: Optional[list] = None,
+    current_depth: int = 0,
 ) -> dict:
-    """Recursively build element tree from a pywinauto wrapper."""
+    """
+    Recursively build element tree from a pywinauto wrapper.
+
+    Text fields are passed through ``clean`` as they are read, and
+    ``counter[0]`` is incremented per element, so no extra traversal is
+    needed afterwards to sanitize or count.
+    """
     if current_depth > max_depth:
         return {"truncated": True, "reason": f"max_depth={max_depth} reached"}
 
     try:
         # Get element properties
         info = {
-            "name": element.window_text() or "",
-            "control_type": element.element_info.control_type or "Unknown",
-            "automation_id": getattr(element.element_info, "automation_id", "") or "",
-            "class_name": element.element_info.class_name or "",
+            "name": clean(element.window_text() or ""),
+            "control_type": clean(element.element_info.control_type or "Unknown"),
+            "automation_id": clean(getattr(element.element_info, "automation_id", "") or ""),
+            "class_name": clean(element.element_info.class_name or ""),
             "is_enabled": element.is_enabled(),
             "is_visible": element.is_visible(),
         }
@@ -166,11 +379,14 @@ def _build_element_tree(
         if not include_invisible and not info["is_visible"]:
             return None
 
+        if counter is not None:
+            counter[0] += 1
+
         # Add value for input elements
         try:
             value = element.get_value()
             if value:
-                info["value"] = value
+                info["value"] = clean(value) if isinstance(value, str) else value
         except (AttributeError, Exception):
             pass
 
@@ -195,7 +411,8 @@ def _build_element_tree(
             try:
                 for child in element.children():
                     child_tree = _build_element_tree(
-                        child, max_depth, include_invisible, current_depth + 1
+                        child, max_depth, include_invisible,
+                        clean, counter, current_depth + 1,
                     )
                     if child_tree is not None:
                         children.append(child_tree)
@@ -208,14 +425,4 @@ def _build_element_tree(
         return info
 
     except Exception as e:
-        return {"error": str(e), "name": "unknown"}
-
-
-def _count_elements(tree: dict) -> int:
-    """Count total elements in a tree."""
-    if not tree or "error" in tree:
-        return 0
-    count = 1
-    for child in tree.get("children", []):
-        count += _count_elements(child)
-    return count
+        return {"error": clean(str(e)), "name": "unknown"}
@@ -10,8 +10,8 @@ window state changes, etc.
 
 import io
 import time
+import asyncio
 import uuid
-import base64
 import logging
 from datetime import datetime
 from typing import Optional
@@ -33,13 +33,75 @@ def _cleanup_old_states():
         del _diff_states[k]
 
 
-def _decode_base64_image(b64_str: str):
-    """Decode a base64 string into a PIL Image."""
+def _decode_image(img_bytes: bytes):
+    """Decode encoded image bytes into a PIL Image."""
     from PIL import Image
-    img_bytes = base64.b64decode(b64_str)
     return Image.open(io.BytesIO(img_bytes))
 
 
+def _diff_stats(before_rgb, after_rgb, threshold: int = 30) -> tuple[int, Optional[tuple]]:
+    """
+    Count pixels whose summed RGB difference exceeds ``threshold`` and
+    find the bounding box of all non-identical pixels, vectorized with
+    numpy (one pass in C instead of a Python loop per pixel).
+
+    Returns (changed_pixels, (left, top, right, bottom) or None).
+
+    / Conteo de pixeles cambiados y bbox, vectorizado con numpy.
+    """
+    import numpy as np
+
+    a = np.asarray(before_rgb, dtype=np.int16)
+    b = np.asarray(after_rgb, dtype=np.int16)
+    diff = np.abs(a - b).sum(axis=2, dtype=np.int32)
+
+    changed_pixels = int(np.count_nonzero(diff > threshold))
+
+    rows = np.flatnonzero(diff.any(axis=1))
+    if rows.size == 0:
+        return changed_pixels, None
+    cols = np.flatnonzero(diff.any(axis=0))
+    bbox = (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+    return changed_pixels, bbox
+
+
+def _compare(before_bytes: bytes, after_bytes: bytes) -> dict:
+    """Decode both captures and measure what changed (runs in a thread)."""
+    before_img = _decode_image(before_bytes)
+    after_img = _decode_image(after_bytes)
+
+    # Resize to match if dimensions differ
+    if before_img.size != after_img.size:
+        after_img = after_img.resize(before_img.size)
+
+    # Convert to RGB for consistent comparison
+    before_rgb = before_img.convert("RGB")
+    after_rgb = after_img.convert("RGB")
+
+    # Pixel-level difference + bounding box of changed region
+    diff_pixels, bbox = _diff_stats(before_rgb, after_rgb)
+    total_pixels = before_rgb.width * before_rgb.height
+    change_percent = round((diff_pixels / total_pixels) * 100, 2) if total_pixels > 0 else 0
+
+    changed_region = None
+    if bbox:
+        changed_region = {
+            "x": bbox[0], "y": bbox[1],
+            "width": bbox[2] - bbox[0],
+            "height": bbox[3] - bbox[1],
+        }
+
+    return {
+        "changed": change_percent > 0.5,
+        "change_percent": change_percent,
+        "changed_pixels": diff_pixels,
+        "total_pixels": total_pixels,
+        "changed_region": changed_region,
+        "before_size": f"{before_rgb.width}x{before_rgb.height}",
+        "after_size": f"{after_img.width}x{after_img.height}",
+    }
+
+
 async def visual_diff(
     window_title: Optional[str] = None,
     description: str = "",
@@ -69,7 +131,7 @@ async def visual_diff(
 
     diff_id = uuid.uuid4().hex[:8]
     _diff_states[diff_id] = {
-        "before_base64": shot["image_base64"],
+        "before_bytes": shot["image_bytes"],
         "before_width": shot.get("width"),
         "before_height": shot.get("height"),
         "window": window_title,
@@ -105,50 +167,22 @@ async def visual_diff_compare(diff_id: str) -> dict:
     state = _diff_states.pop(diff_id)
 
     from marlow.tools.screenshot import take_screenshot
-    from PIL import ImageChops
 
     after_shot = await take_screenshot(window_title=state["window"])
     if "error" in after_shot:
         return after_shot
 
     try:
-        before_img = _decode_base64_image(state["before_base64"])
-        after_img = _decode_base64_image(after_shot["image_base64"])
-
-        # Resize to match if dimensions differ
-        if before_img.size != after_img.size:
-            after_img = after_img.resize(before_img.size)
-
-        # Convert to RGB for consistent comparison
-        before_rgb = before_img.convert("RGB")
-        after_rgb = after_img.convert("RGB")
-
-        # Pixel-level difference
-        diff = ImageChops.difference(before_rgb, after_rgb)
-        diff_pixels = sum(1 for p in diff.getdata() if sum(p) > 30)
-        total_pixels = before_rgb.width * before_rgb.height
-        change_percent = round((diff_pixels / total_pixels) * 100, 2) if total_pixels > 0 else 0
-
-        # Find bounding box of changed region
-        bbox = diff.getbbox()
-        changed_region = None
-        if bbox:
-            changed_region = {
-                "x": bbox[0], "y": bbox[1],
-                "width": bbox[2] - bbox[0],
-                "height": bbox[3] - bbox[1],
-            }
-
+        # Decode + compare is CPU-bound; PIL and numpy release the GIL for
+        # it, so a worker thread keeps the event loop (and other tool calls)
+        # responsive while it runs
+        stats = await asyncio.to_thread(
+            _compare, state["before_bytes"], after_shot["image_bytes"],
+        )
         return {
             "success": True,
             "diff_id": diff_id,
-            "changed": change_percent > 0.5,
-            "change_percent": change_percent,
-            "changed_pixels": diff_pixels,
-            "total_pixels": total_pixels,
-            "changed_region": changed_region,
-            "before_size": f"{before_rgb.width}x{before_rgb.height}",
-            "after_size": f"{after_img.width}x{after_img.height}",
+            **stats,
             "description": state["description"],
         }
 
@@ -11,8 +11,7 @@ Includes basic silence detection (RMS below threshold).
 / La herramienta MCP empieza a grabar inmediatamente cuando la llama el AI.
 """
 
-import os
-import struct
+import asyncio
 import logging
 
 logger = logging.getLogger("marlow.tools.voice")
@@ -21,42 +20,15 @@ logger = logging.getLogger("marlow.tools.voice")
 SILENCE_RMS_THRESHOLD = 500
 
 
-def _compute_rms(audio_path: str) -> float:
-    """Compute RMS (root mean square) of a WAV file for silence detection."""
-    import wave
-
+def _compute_rms(samples) -> float:
+    """Compute RMS (root mean square) of int16 samples for silence detection."""
     try:
-        with wave.open(audio_path, "rb") as wf:
-            n_frames = wf.getnframes()
-            if n_frames == 0:
-                return 0.0
-
-            data = wf.readframes(n_frames)
-            n_channels = wf.getnchannels()
-            sample_width = wf.getsampwidth()
-
-            # Only handle 16-bit audio
-            if sample_width != 2:
-                return -1.0
-
-            # Unpack samples
-            n_samples = len(data) // 2
-            samples = struct.unpack(f"<{n_samples}h", data)
-
-            # If stereo, average channels
-            if n_channels == 2:
-                samples = [
-                    (samples[i] + samples[i + 1]) / 2
-                    for i in range(0, len(samples) - 1, 2)
-                ]
-
-            # Compute RMS
-            if not samples:
-                return 0.0
-            sum_sq = sum(s * s for s in samples)
-            rms = (sum_sq / len(samples)) ** 0.5
-            return rms
+        import numpy as np
 
+        if len(samples) == 0:
+            return 0.0
+        data = samples.astype(np.float64)
+        return float(np.sqrt(np.mean(data * data)))
     except Exception as e:
         logger.debug(f"RMS computation error: {e}")
         return -1.0
@@ -88,17 +60,25 @@ async def listen_for_command(
     # Cap at 60 seconds for voice commands (not long recordings)
     duration_seconds = min(duration_seconds, 60)
 
-    # Record from microphone
-    from marlow.tools.audio import capture_mic_audio, transcribe_audio
+    # Record from microphone — kept in memory, no WAV round-trip
+    from marlow.tools.audio import record_mic, transcribe_audio
 
-    record_result = await capture_mic_audio(duration_seconds=duration_seconds)
-    if "error" in record_result:
-        return record_result
+    try:
+        import sounddevice  # noqa: F401
+    except ImportError:
+        return {
+            "error": "sounddevice not installed. Run: pip install sounddevice",
+        }
 
-    audio_path = record_result["audio_path"]
+    try:
+        loop = asyncio.get_running_loop()
+        samples = await loop.run_in_executor(None, record_mic, duration_seconds)
+    except Exception as e:
+        logger.error(f"Mic audio capture error: {e}")
+        return {"error": str(e)}
 
     # Check for silence
-    rms = _compute_rms(audio_path)
+    rms = _compute_rms(samples)
     is_silent = 0 <= rms < SILENCE_RMS_THRESHOLD
 
     if is_silent:
@@ -107,17 +87,11 @@ async def listen_for_command(
 
     # Transcribe
     transcribe_result = await transcribe_audio(
-        audio_path=audio_path,
+        audio=samples,
         language=language,
         model_size=model_size,
     )
 
-    # Clean up temp audio file
-    try:
-        os.unlink(audio_path)
-    except Exception:
-        pass
-
     if "error" in transcribe_result:
         return transcribe_result
 
@@ -3,7 +3,9 @@ Marlow Smart Wait Tools
 
 Intelligent waiting for UI elements, text, windows, and idle states.
 All waits use polling loops with configurable timeout and interval,
-and check the kill switch between iterations.
+and check the kill switch between iterations. wait_for_window also
+listens for WinEvents, so a new window is picked up as soon as it is
+shown instead of on the next poll.
 
 / Herramientas de espera inteligente para elementos UI, texto, ventanas
 / y estados idle.
@@ -11,11 +13,104 @@ and check the kill switch between iterations.
 
 import asyncio
 import logging
+import threading
 import time
 from typing import Optional
 
 logger = logging.getLogger("marlow.tools.wait")
 
+# WinEvent hook constants (wait_for_window)
+_EVENT_OBJECT_SHOW = 0x8002
+_EVENT_OBJECT_NAMECHANGE = 0x800C
+_WINEVENT_OUTOFCONTEXT = 0x0000
+_OBJID_WINDOW = 0
+_GA_ROOT = 2
+_QS_ALLINPUT = 0x04FF
+_PM_REMOVE = 0x0001
+
+# Minimum gap between window-list checks when woken by events — a window
+# whose title keeps changing (progress in a terminal, animated tab title)
+# must not turn the wait into back-to-back enumerations
+_MIN_WINDOW_CHECK_GAP = 0.2
+
+
+def _pump_window_events(loop, wake: asyncio.Event, stop: threading.Event) -> None:
+    """
+    Thread body: hook top-level window show/rename WinEvents and set
+    ``wake`` on the event loop whenever one fires. Out-of-context hooks
+    are delivered through this thread's message queue, so it sleeps in
+    MsgWaitForMultipleObjects until a message arrives (or ``stop`` is
+    checked every 250 ms).
+
+    / Engancha eventos de ventanas (mostrar/renombrar) y despierta ``wake``.
+    """
+    import ctypes
+    import ctypes.wintypes
+
+    try:
+        user32 = ctypes.windll.user32
+    except AttributeError:
+        return  # not Windows — wait_for_window just polls
+    wt = ctypes.wintypes
+
+    WINEVENTPROC = ctypes.WINFUNCTYPE(
+        None, wt.HANDLE, wt.DWORD, wt.HWND, wt.LONG, wt.LONG, wt.DWORD, wt.DWORD,
+    )
+    user32.GetAncestor.argtypes = [wt.HWND, wt.UINT]
+    user32.GetAncestor.restype = wt.HWND
+    user32.SetWinEventHook.argtypes = [
+        wt.DWORD, wt.DWORD, wt.HMODULE, WINEVENTPROC, wt.DWORD, wt.DWORD, wt.DWORD,
+    ]
+    user32.SetWinEventHook.restype = wt.HANDLE
+    user32.UnhookWinEvent.argtypes = [wt.HANDLE]
+
+    def _on_event(hook, event, hwnd, id_object, id_child, thread_id, event_time):
+        if id_object != _OBJID_WINDOW or id_child != 0 or not hwnd:
+            return
+        if user32.GetAncestor(hwnd, _GA_ROOT) == hwnd:
+            loop.call_soon_threadsafe(wake.set)
+
+    proc = WINEVENTPROC(_on_event)
+    hooks = [
+        user32.SetWinEventHook(
+            event, event, None, proc, 0, 0, _WINEVENT_OUTOFCONTEXT,
+        )
+        for event in (_EVENT_OBJECT_SHOW, _EVENT_OBJECT_NAMECHANGE)
+    ]
+    try:
+        if not all(hooks):
+            logger.debug("SetWinEventHook failed; wait_for_window will poll")
+            return
+        msg = wt.MSG()
+        while not stop.is_set():
+            user32.MsgWaitForMultipleObjects(0, None, False, 250, _QS_ALLINPUT)
+            while user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, _PM_REMOVE):
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+    finally:
+        for hook in hooks:
+            if hook:
+                user32.UnhookWinEvent(hook)
+
+
+def _start_window_events(wake: asyncio.Event) -> Optional[threading.Event]:
+    """
+    Start the WinEvent listener for ``wake``. Returns the event that stops
+    it, or None when hooks aren't available (callers then just poll).
+    """
+    stop = threading.Event()
+    try:
+        threading.Thread(
+            target=_pump_window_events,
+            args=(asyncio.get_running_loop(), wake, stop),
+            name="marlow-wait-winevents",
+            daemon=True,
+        ).start()
+    except Exception as e:
+        logger.debug(f"WinEvent listener unavailable: {e}")
+        return None
+    return stop
+
 
 async def wait_for_element(
     name: str,
@@ -63,7 +158,9 @@ async def wait_for_element(
                     desktop = Desktop(backend="uia")
                     target_window = desktop.window(active_only=True)
 
-                element = find_element_by_name(target_window, name, max_depth=5)
+                element = find_element_by_name(
+                    target_window, name, max_depth=5, use_cache=False,
+                )
                 if element is not None:
                     elapsed = round(time.monotonic() - (deadline - timeout), 2)
                     info = {
@@ -216,7 +313,9 @@ async def wait_for_window(
     """
     Wait for a window with the given title to appear.
 
-    Polls the window list every `interval` seconds.
+    Checks the window list whenever a top-level window is shown or
+    renamed (WinEvent hook), at most every 0.2s, and at least every
+    `interval` seconds.
 
     Args:
         title: Window title (or partial title) to wait for.
@@ -235,47 +334,61 @@ async def wait_for_window(
         import re
         from pywinauto import Desktop
 
-        title_lower = title.lower()
         deadline = time.monotonic() + timeout
         checks = 0
+        wake = asyncio.Event()
+        stop_events = _start_window_events(wake)
 
-        while time.monotonic() < deadline:
-            checks += 1
+        try:
+            while time.monotonic() < deadline:
+                checks += 1
+                wake.clear()
+                last_check = time.monotonic()
 
-            try:
-                desktop = Desktop(backend="uia")
-                windows = desktop.windows(title_re=f".*{re.escape(title)}.*")
+                try:
+                    desktop = Desktop(backend="uia")
+                    windows = desktop.windows(title_re=f".*{re.escape(title)}.*")
 
-                if windows:
-                    win = windows[0]
-                    elapsed = round(time.monotonic() - (deadline - timeout), 2)
+                    if windows:
+                        win = windows[0]
+                        elapsed = round(time.monotonic() - (deadline - timeout), 2)
 
-                    info = {
-                        "title": win.window_text(),
-                        "class_name": win.element_info.class_name,
-                    }
-                    try:
-                        rect = win.rectangle()
-                        info["position"] = {
-                            "x": rect.left,
-                            "y": rect.top,
-                            "width": rect.width(),
-                            "height": rect.height(),
+                        info = {
+                            "title": win.window_text(),
+                            "class_name": win.element_info.class_name,
                         }
-                    except Exception:
-                        pass
+                        try:
+                            rect = win.rectangle()
+                            info["position"] = {
+                                "x": rect.left,
+                                "y": rect.top,
+                                "width": rect.width(),
+                                "height": rect.height(),
+                            }
+                        except Exception:
+                            pass
 
-                    return {
-                        "success": True,
-                        "found": True,
-                        "window": info,
-                        "elapsed_seconds": elapsed,
-                        "checks": checks,
-                    }
-            except Exception:
-                pass
+                        return {
+                            "success": True,
+                            "found": True,
+                            "window": info,
+                            "elapsed_seconds": elapsed,
+                            "checks": checks,
+                        }
+                except Exception:
+                    pass
 
-            await asyncio.sleep(interval)
+                # Wake on the next window shown/renamed, or poll at `interval`
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+                gap = last_check + _MIN_WINDOW_CHECK_GAP - time.monotonic()
+                if gap > 0:
+                    await asyncio.sleep(gap)
+        finally:
+            if stop_events is not None:
+                stop_events.set()
 
         return {
             "error": f"Window '{title}' not found after {timeout}s ({checks} checks)",
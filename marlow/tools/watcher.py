@@ -11,6 +11,7 @@ import hashlib
 import logging
 import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -19,8 +20,8 @@ logger = logging.getLogger("marlow.tools.watcher")
 
 # Module-level state
 _watchers: dict[str, dict] = {}
-_events: list[dict] = []
 _max_events = 500
+_events: deque[dict] = deque(maxlen=_max_events)  # oldest dropped first
 _event_lock = threading.Lock()
 
 # Lazy-loaded watchdog classes (avoid hard failure if not installed)
@@ -79,10 +80,6 @@ def _make_handler(watch_id: str, event_types: list[str]):
 
                 _events.append(entry)
 
-                # Enforce max events limit
-                while len(_events) > _max_events:
-                    _events.pop(0)
-
     return MarlowEventHandler()
 
 
@@ -190,14 +187,13 @@ async def get_watch_events(
     Returns:
         Dict with events list and metadata.
     """
+    # One pass over the buffer instead of a copy plus a pass per filter
     with _event_lock:
-        filtered = _events.copy()
-
-    if watch_id:
-        filtered = [e for e in filtered if e["watch_id"] == watch_id]
-
-    if since:
-        filtered = [e for e in filtered if e["timestamp"] > since]
+        filtered = [
+            e for e in _events
+            if (not watch_id or e["watch_id"] == watch_id)
+            and (not since or e["timestamp"] > since)
+        ]
 
     return {
         "events": filtered[-limit:],
@@ -549,6 +549,24 @@ class TestSmartExecutor:
         assert "timed out" in result.error
         executor.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_mutating_tool_invalidates_ui_cache(self, monkeypatch):
+        """UI-changing tools drop cached UIA trees; read-only ones don't."""
+        from marlow.core import ui_cache
+
+        calls = []
+        monkeypatch.setattr(ui_cache, "invalidate", lambda hwnd=None: calls.append(hwnd))
+
+        async def tool(**kwargs):
+            return {"success": True}
+
+        executor = SmartExecutor(tool_registry={"click": tool, "get_ui_tree": tool})
+        await executor.execute("get_ui_tree", {})
+        assert calls == []
+        await executor.execute("click", {})
+        assert calls == [None]
+        executor.shutdown()
+
     @pytest.mark.asyncio
     async def test_register_and_execute(self):
         """Register a tool dynamically, then execute it."""
@@ -7,6 +7,7 @@ If safety says no, the action does not happen. Period.
 
 import asyncio
 import time
+from collections import deque
 
 import pytest
 
@@ -50,6 +51,13 @@ class TestKillSwitch:
         safety.reset_kill_switch()
         assert safety.is_killed is False
 
+    def test_kill_event_tracks_state(self, safety):
+        assert not safety.kill_event.is_set()
+        safety._trigger_kill()
+        assert safety.kill_event.wait(timeout=0)
+        safety.reset_kill_switch()
+        assert not safety.kill_event.is_set()
+
     @pytest.mark.asyncio
     async def test_kill_blocks_all_actions(self, safety):
         safety._trigger_kill()
@@ -125,6 +133,23 @@ class TestBlockedApps:
         )
         assert approved is False
 
+    @pytest.mark.asyncio
+    async def test_repeated_blocked_call_stays_blocked_and_logged(self, autonomous_safety):
+        for _ in range(2):
+            approved, _ = await autonomous_safety.approve_action(
+                "click", "click", {"window_title": "PayPal"}
+            )
+            assert approved is False
+        assert len(autonomous_safety._blocked_cache) == 1
+        assert len(autonomous_safety.get_action_log()) == 2
+
+    @pytest.mark.asyncio
+    async def test_unhashable_params_still_checked(self, autonomous_safety):
+        approved, _ = await autonomous_safety.approve_action(
+            "click", "click", {"window_title": "PayPal", "keys": ["a"], "name": ["x"]}
+        )
+        assert approved is False
+
 
 # ─────────────────────────────────────────────────────────────
 # Blocked Commands
@@ -218,7 +243,7 @@ class TestRateLimiter:
             await safety.approve_action("click", "click", {})
 
         # Manually expire all timestamps (simulate 61 seconds passing)
-        safety._action_timestamps = [time.time() - 61 for _ in safety._action_timestamps]
+        safety._action_timestamps = deque(time.time() - 61 for _ in safety._action_timestamps)
 
         approved, _ = await safety.approve_action("click", "click", {})
         assert approved is True
@@ -233,3 +233,68 @@ class TestSanitizerStats:
     def test_multiple_redactions_counted(self, sanitizer):
         sanitizer.sanitize("Cards: 4532-1234-5678-9012 and 4532-9876-5432-1098")
         assert sanitizer.total_redactions >= 2
+
+
+# ─────────────────────────────────────────────────────────────
+# Pattern Precedence
+# ─────────────────────────────────────────────────────────────
+
+class TestPatternPrecedence:
+    """Patterns apply in config order: earlier ones redact first."""
+
+    def test_mixed_types_single_string(self, sanitizer):
+        text = "user@example.com paid with 4532-1234-5678-9012, SSN 123-45-6789"
+        result = sanitizer.sanitize(text)
+        assert "[EMAIL-REDACTED]" in result
+        assert "[CREDIT-CARD-REDACTED]" in result
+        assert "[SSN-REDACTED]" in result
+        assert sanitizer.total_redactions == 3
+
+    @pytest.mark.parametrize("text,expected", [
+        # A phone-like prefix starting earlier must not shield the card
+        ("555-123-4567 8901 2345 6789", "555-123-[CREDIT-CARD-REDACTED]"),
+        ("933629 3097 564237690663", "933629 [CREDIT-CARD-REDACTED]"),
+    ])
+    def test_credit_card_wins_over_earlier_phone(self, sanitizer, text, expected):
+        assert sanitizer.sanitize(text) == expected
+
+    def test_custom_pattern_with_inline_flags(self):
+        config = MarlowConfig()
+        config.security.sensitive_patterns = {"secret_word": r"(?i)swordfish"}
+        custom = DataSanitizer(config)
+        assert custom._any_pattern is not None
+        assert custom.sanitize("The word is SwordFish") == "The word is [REDACTED]"
+
+
+class TestPrefilter:
+    """One combined search skips clean strings; redaction stays sequential."""
+
+    def test_prefilter_compiled(self, sanitizer):
+        assert sanitizer._any_pattern is not None
+
+    def test_clean_text_returned_as_is(self, sanitizer):
+        text = "File Edit View Help"
+        assert sanitizer.sanitize(text) is text
+        assert sanitizer.total_redactions == 0
+
+    @pytest.mark.parametrize("text", [
+        "555-123-4567 8901 2345 6789",
+        "933629 3097 564237690663",
+        "password: hunter2, card 4532123456789012, call (555) 123-4567",
+        "mail a.b@example.org or +1 555 123 4567",
+        "Save As...",
+    ])
+    def test_same_result_as_sequential_scan(self, sanitizer, text):
+        expected = DataSanitizer(MarlowConfig())
+        expected._any_pattern = None
+        assert sanitizer.sanitize(text) == expected.sanitize(text)
+
+    def test_backreference_pattern_disables_prefilter(self):
+        config = MarlowConfig()
+        config.security.sensitive_patterns = {
+            "phone_us": r"\d{3}-\d{4}",
+            "doubled": r"(\w+) \1",
+        }
+        custom = DataSanitizer(config)
+        assert custom._any_pattern is None
+        assert custom.sanitize("bye bye") == "[REDACTED]"
@@ -0,0 +1,62 @@
+"""Tests for marlow.core.loop_guard — repeated failing call detection."""
+
+import pytest
+
+import marlow.core.loop_guard as loop_guard
+
+_ERROR = {"error": "Element 'Save' not found"}
+
+
+@pytest.fixture(autouse=True)
+def clean_guard():
+    loop_guard.reset()
+    yield
+    loop_guard.reset()
+
+
+def _fail(key, times):
+    for _ in range(times):
+        loop_guard.record(key, dict(_ERROR))
+
+
+class TestCallKey:
+    def test_argument_order_ignored(self):
+        a = loop_guard.call_key("click", {"element_name": "Save", "window_title": "Notepad"})
+        b = loop_guard.call_key("click", {"window_title": "Notepad", "element_name": "Save"})
+        assert a == b
+
+    def test_different_arguments_or_tool(self):
+        key = loop_guard.call_key("click", {"element_name": "Save"})
+        assert key != loop_guard.call_key("click", {"element_name": "Open"})
+        assert key != loop_guard.call_key("find_elements", {"element_name": "Save"})
+
+
+class TestLoopDetection:
+    def test_aborts_after_repeated_failures(self):
+        key = loop_guard.call_key("click", {"element_name": "Save"})
+        _fail(key, loop_guard.MAX_FAILURES - 1)
+        assert loop_guard.check(key) is None
+        _fail(key, 1)
+        aborted = loop_guard.check(key)
+        assert aborted["aborted"] == "loop-detected"
+        assert aborted["error"] == _ERROR["error"]
+
+    def test_success_clears_failures(self):
+        key = loop_guard.call_key("click", {"element_name": "Save"})
+        _fail(key, loop_guard.MAX_FAILURES)
+        loop_guard.record(key, {"success": True})
+        assert loop_guard.check(key) is None
+
+    def test_slow_retries_not_a_loop(self, monkeypatch):
+        key = loop_guard.call_key("wait_for_element", {"name": "Save"})
+        monkeypatch.setattr(loop_guard, "WINDOW_SECONDS", -1)
+        _fail(key, loop_guard.MAX_FAILURES + 2)
+        assert loop_guard.check(key) is None
+
+    def test_oldest_entries_evicted(self, monkeypatch):
+        monkeypatch.setattr(loop_guard, "_MAX_ENTRIES", 2)
+        keys = [loop_guard.call_key("click", {"x": i}) for i in range(3)]
+        for key in keys:
+            _fail(key, loop_guard.MAX_FAILURES)
+        assert loop_guard.check(keys[0]) is None
+        assert loop_guard.check(keys[-1]) is not None
@@ -0,0 +1,53 @@
+"""Tests for marlow.tools.scheduler — task history queries and runner."""
+
+import asyncio
+from collections import deque
+
+import pytest
+
+import marlow.tools.scheduler as scheduler
+
+
+@pytest.fixture
+def history(monkeypatch):
+    entries = deque(
+        ({"task": "a" if i % 2 else "b", "run": i} for i in range(10)),
+        maxlen=scheduler._max_history,
+    )
+    monkeypatch.setattr(scheduler, "_task_history", entries)
+    return entries
+
+
+def _history(**kwargs):
+    return asyncio.run(scheduler.get_task_history(**kwargs))
+
+
+class TestGetTaskHistory:
+    def test_limit_keeps_most_recent_oldest_first(self, history):
+        result = _history(limit=3)
+        assert [h["run"] for h in result["history"]] == [7, 8, 9]
+        assert result["total"] == 10
+
+    def test_filter_by_task(self, history):
+        result = _history(task_name="a", limit=2)
+        assert [h["run"] for h in result["history"]] == [7, 9]
+        assert result["total"] == 5
+
+    def test_limit_zero_returns_all(self, history):
+        assert len(_history(limit=0)["history"]) == 10
+        assert len(_history(task_name="b", limit=0)["history"]) == 5
+
+
+class TestTaskRunner:
+    def test_removed_task_not_reported_as_kill_switch(self, monkeypatch, history):
+        monkeypatch.setattr(scheduler, "_kill_event", None)
+        monkeypatch.setattr(scheduler, "_kill_switch_check", None)
+        runner = scheduler.TaskRunner("t", "echo", 0, "cmd", None)
+
+        def removed_while_running(cmd):
+            runner.stop()
+            return None
+
+        monkeypatch.setattr(runner, "_execute", removed_while_running)
+        runner.run()
+        assert history[-1]["error"] == "task removed — command terminated"
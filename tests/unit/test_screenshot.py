@@ -0,0 +1,19 @@
+"""Tests for marlow.tools.screenshot — caption sent next to the image."""
+
+from marlow.tools.screenshot import describe
+
+
+class TestDescribe:
+    def test_full_size(self):
+        result = {"width": 1920, "height": 1080, "size_kb": 210.4, "source": "fullscreen"}
+        assert describe(result) == "Screenshot: 1920x1080 (210.4KB) — Source: fullscreen"
+
+    def test_downscaled_includes_scale(self):
+        result = {
+            "width": 960, "height": 540, "size_kb": 0.1, "source": "fullscreen",
+            "scale": 0.5, "original_size": {"width": 1920, "height": 1080},
+        }
+        text = describe(result)
+        assert "Scale: 0.5" in text
+        assert "1920x1080" in text
+        assert "divide image coordinates by 0.5" in text
@@ -0,0 +1,217 @@
+"""Tests for marlow.core.ui_cache — short-lived UIA tree snapshots."""
+
+import pytest
+
+import marlow.core.ui_cache as ui_cache
+from marlow.core.uia_utils import find_element_enhanced
+
+
+class FakeInfo:
+    def __init__(self, automation_id="", control_type="Button"):
+        self.automation_id = automation_id
+        self.help_text = ""
+        self.class_name = ""
+        self.control_type = control_type
+
+
+class FakeElement:
+    """Minimal stand-in for a pywinauto UIAWrapper that counts COM reads."""
+
+    reads = 0
+
+    def __init__(self, name, children=(), handle=0, control_type="Button"):
+        self.name = name
+        self._children = list(children)
+        self.handle = handle
+        self.element_info = FakeInfo(control_type=control_type)
+
+    def window_text(self):
+        FakeElement.reads += 1
+        return self.name
+
+    def children(self):
+        return self._children
+
+    def rectangle(self):
+        raise RuntimeError("no bbox in tests")
+
+
+class FakeWatcher:
+    def __init__(self):
+        self.watched = []
+        self.unwatched = []
+
+    def watch_structure(self, hwnd):
+        self.watched.append(hwnd)
+
+    def unwatch_structure(self, hwnd):
+        self.unwatched.append(hwnd)
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    ui_cache.set_watcher(None)
+    FakeElement.reads = 0
+    yield
+    ui_cache.set_watcher(None)
+
+
+def _window(handle=100):
+    return FakeElement("Notepad", handle=handle, control_type="Window", children=[
+        FakeElement("File", children=[FakeElement("Save"), FakeElement("Open")]),
+        FakeElement("Edit"),
+        FakeElement("Help"),
+    ])
+
+
+class TestTreeSnapshot:
+    def test_walk_is_preorder(self):
+        snapshot = ui_cache.TreeSnapshot(_window(), max_depth=5)
+        names = [e["name"] for e in snapshot]
+        assert names == ["Notepad", "File", "Save", "Open", "Edit", "Help"]
+        assert snapshot.complete
+
+    def test_max_depth_respected(self):
+        snapshot = ui_cache.TreeSnapshot(_window(), max_depth=1)
+        assert [e["name"] for e in snapshot] == ["Notepad", "File", "Edit", "Help"]
+
+    def test_partial_walk_resumes(self):
+        snapshot = ui_cache.TreeSnapshot(_window(), max_depth=5)
+        for entry in snapshot:
+            if entry["name"] == "Save":
+                break
+        assert not snapshot.complete
+        assert len(snapshot.entries) == 3
+        assert [e["name"] for e in snapshot][-1] == "Help"
+        assert FakeElement.reads == 6  # each element read exactly once
+
+
+class TestGetTree:
+    def test_same_window_reuses_snapshot(self):
+        win = _window()
+        assert ui_cache.get_tree(win, 5) is ui_cache.get_tree(win, 5)
+
+    def test_no_handle_not_cached(self):
+        win = _window(handle=0)
+        assert ui_cache.get_tree(win, 5) is not ui_cache.get_tree(win, 5)
+
+    def test_expired_snapshot_replaced(self, monkeypatch):
+        win = _window()
+        first = ui_cache.get_tree(win, 5)
+        monkeypatch.setattr(ui_cache, "TTL_SECONDS", -1)
+        assert ui_cache.get_tree(win, 5) is not first
+
+    def test_invalidate_by_handle(self):
+        a, b = _window(100), _window(200)
+        snap_a, snap_b = ui_cache.get_tree(a, 5), ui_cache.get_tree(b, 5)
+        ui_cache.invalidate(100)
+        assert ui_cache.get_tree(a, 5) is not snap_a
+        assert ui_cache.get_tree(b, 5) is snap_b
+
+
+    def test_only_recent_windows_kept(self):
+        wins = [_window(h) for h in range(1, ui_cache._MAX_WINDOWS + 2)]
+        snaps = [ui_cache.get_tree(w, 5) for w in wins]
+        assert ui_cache.get_tree(wins[-1], 5) is snaps[-1]
+        assert ui_cache.get_tree(wins[0], 5) is not snaps[0]
+
+
+class TestStructureWatcher:
+    def test_cached_window_is_watched_once(self):
+        watcher = FakeWatcher()
+        ui_cache.set_watcher(watcher)
+        win = _window()
+        ui_cache.get_tree(win, 5)
+        ui_cache.get_tree(win, 3)
+        assert watcher.watched == [100]
+
+    def test_subscribed_window_ignores_short_ttl(self, monkeypatch):
+        ui_cache.set_watcher(FakeWatcher())
+        win = _window()
+        ui_cache.get_tree(win, 5)
+        ui_cache.subscribed(100)
+        snapshot = ui_cache.get_tree(win, 5)  # pre-subscription one dropped
+        monkeypatch.setattr(ui_cache, "TTL_SECONDS", -1)
+        assert ui_cache.get_tree(win, 5) is snapshot
+        ui_cache.invalidate(100)  # structure-changed event
+        assert ui_cache.get_tree(win, 5) is not snapshot
+
+    def test_unsubscribed_falls_back_to_ttl(self, monkeypatch):
+        ui_cache.set_watcher(FakeWatcher())
+        win = _window()
+        ui_cache.get_tree(win, 5)
+        ui_cache.subscribed(100)
+        ui_cache.unsubscribed(100)
+        snapshot = ui_cache.get_tree(win, 5)
+        monkeypatch.setattr(ui_cache, "TTL_SECONDS", -1)
+        assert ui_cache.get_tree(win, 5) is not snapshot
+
+    def test_evicted_window_is_unwatched(self):
+        watcher = FakeWatcher()
+        ui_cache.set_watcher(watcher)
+        for h in range(1, ui_cache._MAX_WINDOWS + 2):
+            ui_cache.get_tree(_window(h), 5)
+        assert watcher.unwatched == [1]
+
+
+class TestResults:
+    def test_result_reused_within_ttl(self):
+        result = {"elements": {}}
+        ui_cache.put_result((100, 5), result)
+        assert ui_cache.get_result((100, 5)) is result
+        assert ui_cache.get_result((100, 3)) is None
+
+    def test_result_expires(self, monkeypatch):
+        ui_cache.put_result((100, 5), {})
+        monkeypatch.setattr(ui_cache, "TTL_SECONDS", -1)
+        assert ui_cache.get_result((100, 5)) is None
+
+    def test_invalidate_drops_results(self):
+        ui_cache.put_result((100, 5), {})
+        ui_cache.put_result((200, 5), {})
+        ui_cache.invalidate(100)
+        assert ui_cache.get_result((100, 5)) is None
+        assert ui_cache.get_result((200, 5)) is not None
+        ui_cache.invalidate()
+        assert ui_cache.get_result((200, 5)) is None
+
+
+class TestToolFinished:
+    def test_mutating_tool_invalidates(self):
+        win = _window()
+        snapshot = ui_cache.get_tree(win, 5)
+        ui_cache.tool_finished("click")
+        assert ui_cache.get_tree(win, 5) is not snapshot
+
+    def test_mutating_tool_drops_results(self):
+        ui_cache.put_result((100, 5), {})
+        ui_cache.tool_finished("type_text")
+        assert ui_cache.get_result((100, 5)) is None
+
+    def test_read_only_tool_keeps_cache(self):
+        win = _window()
+        snapshot = ui_cache.get_tree(win, 5)
+        ui_cache.tool_finished("get_ui_tree")
+        assert ui_cache.get_tree(win, 5) is snapshot
+
+
+class TestCachedSearch:
+    def test_second_search_reads_nothing_new(self):
+        win = _window()
+        first = find_element_enhanced(win, "Open")
+        reads = FakeElement.reads
+        second = find_element_enhanced(win, "Open")
+        assert first[0]["name"] == second[0]["name"] == "Open"
+        assert FakeElement.reads == reads
+
+    def test_use_cache_false_walks_again(self):
+        win = _window()
+        find_element_enhanced(win, "Open")
+        reads = FakeElement.reads
+        find_element_enhanced(win, "Open", use_cache=False)
+        assert FakeElement.reads > reads
+
+    def test_control_type_filter_still_searches_children(self):
+        win = _window()
+        results = find_element_enhanced(win, "Save", control_type="Button")
+        assert results and results[0]["name"] == "Save"
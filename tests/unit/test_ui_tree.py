@@ -0,0 +1,83 @@
+"""Tests for marlow.tools.ui_tree — cached-property tree walk."""
+
+from marlow.tools import ui_tree
+from marlow.tools.ui_tree import _CachedWalk
+
+_TYPES = {50000: "Button", 50004: "Edit", 50032: "Window"}
+
+
+class FakeArray:
+    def __init__(self, elements):
+        self._elements = elements
+        self.Length = len(elements)
+
+    def GetElement(self, i):
+        return self._elements[i]
+
+
+class FakeCachedElement:
+    """IUIAutomationElement stand-in that only answers cached reads."""
+
+    fetches = 0
+
+    def __init__(self, props, children=()):
+        self._props = props
+        self._children = list(children)
+
+    def GetCachedPropertyValue(self, prop_id):
+        return self._props.get(prop_id)
+
+    def FindAllBuildCache(self, scope, condition, request):
+        FakeCachedElement.fetches += 1
+        return FakeArray(self._children)
+
+
+def _window():
+    FakeCachedElement.fetches = 0
+    return FakeCachedElement({30005: "Notepad", 30003: 50032, 30010: True}, [
+        FakeCachedElement({30005: "Save", 30003: 50000, 30010: True, 30031: True}),
+        FakeCachedElement({30005: "Hidden", 30003: 50000, 30022: True}),
+        FakeCachedElement({30005: "Text", 30003: 50004, 30045: "hello", 30043: True}),
+    ])
+
+
+def _walk(root, max_depth=5, include_invisible=False, clean=str):
+    return _CachedWalk(
+        root, None, None, _TYPES, max_depth, include_invisible, clean, [0],
+    )
+
+
+class TestCachedWalk:
+    def test_same_shape_as_wrapper_walk(self):
+        root = _window()
+        walk = _walk(root)
+        tree = walk.build(root, 0)
+        assert tree["name"] == "Notepad"
+        assert tree["control_type"] == "Window"
+        assert [c["name"] for c in tree["children"]] == ["Save", "Text"]
+        save, text = tree["children"]
+        assert save["patterns"] == ["Invoke"] and save["is_enabled"] is True
+        assert text["value"] == "hello" and text["patterns"] == ["Value"]
+        assert walk.counter == [3]
+
+    def test_one_fetch_per_expanded_node(self):
+        root = _window()
+        _walk(root).build(root, 0)
+        # root + its two visible children; hidden ones are never expanded
+        assert FakeCachedElement.fetches == 3
+
+    def test_depth_and_invisible(self):
+        root = _window()
+        tree = _walk(root, max_depth=0).build(root, 0)
+        assert "children" not in tree
+        tree = _walk(root, include_invisible=True).build(root, 0)
+        assert len(tree["children"]) == 3
+
+    def test_text_is_cleaned(self):
+        root = _window()
+        tree = _walk(root, clean=str.upper).build(root, 0)
+        assert tree["children"][1]["value"] == "HELLO"
+
+    def test_start_without_uia_falls_back(self):
+        assert _CachedWalk.start(object(), 5, False, str, [0]) is None
+        assert ui_tree._tree_cache_request is None
@@ -0,0 +1,190 @@
+"""Tests for marlow.core.uia_utils — fuzzy matching helpers."""
+
+import pytest
+
+import marlow.core.uia_utils as uia_utils
+from marlow.core.uia_utils import _levenshtein, _similarity
+
+
+def _reference_levenshtein(a: str, b: str) -> int:
+    """Textbook full-matrix DP, used as ground truth."""
+    d = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) + 1):
+        d[i][0] = i
+    for j in range(len(b) + 1):
+        d[0][j] = j
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            d[i][j] = min(
+                d[i - 1][j] + 1,
+                d[i][j - 1] + 1,
+                d[i - 1][j - 1] + (a[i - 1] != b[j - 1]),
+            )
+    return d[-1][-1]
+
+
+@pytest.fixture(params=["python", "rapidfuzz"])
+def backend(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(uia_utils, "_rf_levenshtein", None)
+    elif uia_utils._rf_levenshtein is None:
+        pytest.skip("rapidfuzz not installed")
+    return request.param
+
+
+class TestLevenshtein:
+    @pytest.mark.parametrize("a,b", [
+        ("", ""), ("abc", ""), ("", "abc"),
+        ("kitten", "sitting"), ("flaw", "lawn"),
+        ("save", "save as"), ("btnSubmit", "btnSubmt"),
+        ("abcabc", "abc"), ("aaaa", "aa"), ("ab", "ba"),
+        ("contraseña", "contrasena"),
+    ])
+    def test_matches_reference(self, backend, a, b):
+        assert _levenshtein(a, b) == _reference_levenshtein(a, b)
+        assert _levenshtein(b, a) == _reference_levenshtein(a, b)
+
+
+class TestSimilarity:
+    def test_identical(self):
+        assert _similarity("save", "save") == 1.0
+
+    def test_empty(self):
+        assert _similarity("", "") == 1.0
+
+    def test_score(self):
+        assert _similarity("kitten", "sitting") == pytest.approx(1 - 3 / 7)
+
+    def test_min_score_short_circuits_on_length(self):
+        assert _similarity("ok", "okay then", min_score=0.7) == 0.0
+
+    def test_min_score_does_not_change_reachable_scores(self):
+        assert _similarity("btnsubmit", "btnsubmt", min_score=0.6) == \
+            _similarity("btnsubmit", "btnsubmt")
+
+
+# ─────────────────────────────────────────────────────────────
+# Native FindAll prefilter (mocked IUIAutomation)
+# ─────────────────────────────────────────────────────────────
+
+class FakeNativeElement:
+    def __init__(self, name, control_type, parent=None):
+        self.CachedName = name
+        self.CachedAutomationId = ""
+        self.CachedHelpText = ""
+        self.CachedClassName = ""
+        self.CachedControlType = control_type
+        self.parent = parent
+
+
+class FakeArray:
+    def __init__(self, elements):
+        self._elements = elements
+        self.Length = len(elements)
+
+    def GetElement(self, i):
+        return self._elements[i]
+
+
+class FakeIUIAutomation:
+    """Builds conditions as tuples; FindAll ignores them, like a lax provider."""
+
+    def __init__(self):
+        self.RawViewWalker = self
+
+    def GetParentElement(self, elem):
+        return elem.parent
+
+    def CompareElements(self, a, b):
+        return a is b
+
+    def CreatePropertyConditionEx(self, prop_id, value, flags):
+        return ("prop", prop_id, value)
+
+    def CreatePropertyCondition(self, prop_id, value):
+        return ("prop", prop_id, value)
+
+    def CreateOrCondition(self, a, b):
+        return ("or", a, b)
+
+    def CreateAndCondition(self, a, b):
+        return ("and", a, b)
+
+    def CreateCacheRequest(self):
+        class Request:
+            def AddProperty(self, prop_id):
+                pass
+        return Request()
+
+
+class FakeRoot(FakeNativeElement):
+    def __init__(self):
+        super().__init__("Dialog", 50032)
+        self.matches = []
+        self.conditions = []
+
+    def FindAllBuildCache(self, scope, condition, request):
+        self.conditions.append(condition)
+        return FakeArray(self.matches)
+
+
+class FakeWrapper:
+    def __init__(self, info):
+        self.native = info
+
+    def rectangle(self):
+        raise RuntimeError("no bbox in tests")
+
+
+@pytest.fixture
+def native_uia(monkeypatch):
+    import sys
+    import types
+
+    iuia = FakeIUIAutomation()
+    uia = types.SimpleNamespace(
+        iuia=iuia,
+        known_control_types={"Button": 50000, "Text": 50020, "Window": 50032},
+        known_control_type_ids={50000: "Button", 50020: "Text", 50032: "Window"},
+    )
+    modules = {
+        "pywinauto": types.ModuleType("pywinauto"),
+        "pywinauto.uia_defines": types.SimpleNamespace(IUIA=lambda: uia),
+        "pywinauto.uia_element_info": types.SimpleNamespace(UIAElementInfo=lambda e: e),
+        "pywinauto.controls": types.ModuleType("pywinauto.controls"),
+        "pywinauto.controls.uiawrapper": types.SimpleNamespace(UIAWrapper=FakeWrapper),
+    }
+    for name, module in modules.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.setattr(uia_utils, "_cache_request", None)
+    monkeypatch.setattr(uia_utils, "_control_type_ids", None)
+
+    root = FakeRoot()
+    parent = types.SimpleNamespace(element_info=types.SimpleNamespace(element=root))
+    return root, parent
+
+
+class TestFindNative:
+    def test_lowercase_control_type_filters(self, native_uia):
+        root, parent = native_uia
+        root.matches = [
+            FakeNativeElement("Save", 50020, parent=root),
+            FakeNativeElement("Save", 50000, parent=root),
+        ]
+        results = uia_utils.find_element_enhanced(parent, "Save", control_type="button")
+        assert [r["control_type"] for r in results] == ["Button"]
+        assert root.conditions[0][0] == "and"  # type condition sent to UIA
+
+    def test_unknown_control_type_uses_walk(self, native_uia):
+        root, parent = native_uia
+        assert uia_utils._find_native(parent, "Save", "NoSuchType") is None
+        assert root.conditions == []
+
+    def test_max_depth_respected(self, native_uia):
+        root, parent = native_uia
+        node = root
+        for depth in range(1, 4):
+            node = FakeNativeElement(f"Save {depth}", 50000, parent=node)
+            root.matches.append(node)
+        found = uia_utils._find_native(parent, "Save", None, max_depth=2)
+        assert [props["name"] for _, props in found] == ["Save 1", "Save 2"]